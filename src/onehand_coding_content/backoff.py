@@ -0,0 +1,14 @@
+"""Retry timing shared by everything that calls a web service."""
+import random
+
+# Retries of rate limited or failed requests, waiting a random time up to
+# BACKOFF_BASE * 2**attempt seconds (capped at BACKOFF_CAP) in between,
+# unless the service says how long.
+MAX_RETRIES = 3
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 30.0
+
+
+def backoff(attempt: int) -> float:
+    """Jittered exponential backoff before retry number `attempt` (from 0)."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
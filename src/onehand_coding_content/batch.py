@@ -0,0 +1,133 @@
+"""Headless batch rendering of every content script.
+
+Each script runs in a worker process on an instant clock, with its input()
+answers read from `data/answers/<script>.txt` and its output recorded to
+`data/renders/<script>.cast`.
+"""
+import io
+import os
+import sys
+import time
+from pathlib import Path
+from typing import List, Optional, NamedTuple
+
+from .clock import InstantClock, set_clock
+from .config import LINE_LENGTH, RENDERS_DIR, ANSWERS_DIR
+from .manifest import get_manifest
+
+# Logical seconds a script may run before it gets a simulated Ctrl+C.
+MAX_RENDER_SECONDS = 30 * 60
+
+
+class BudgetClock(InstantClock):
+    """Instant clock that presses Ctrl+C once a script has used up its time budget.
+
+    Some scripts loop until interrupted, this stops them the same way a
+    presenter would.
+    """
+
+    def __init__(self, budget: float = MAX_RENDER_SECONDS):
+        super().__init__()
+        self.budget = budget
+        self.interrupted = False
+
+    def sleep(self, seconds: float) -> None:
+        super().sleep(seconds)
+        if self.now() > self.budget:
+            self.interrupted = True
+            raise KeyboardInterrupt
+
+
+class RenderResult(NamedTuple):
+    """Outcome of rendering a single script."""
+    script: str
+    status: str
+    output: Optional[str]
+    seconds: float
+
+
+def load_answers(script_name: str) -> str:
+    """Scripted stdin for a script, empty if it has no answers file."""
+    answers_file = ANSWERS_DIR / f"{Path(script_name).stem}.txt"
+    if answers_file.exists():
+        return answers_file.read_text(encoding="utf-8")
+    return ""
+
+
+def render_script(script_name: str, output_dir: Path, budget: float = MAX_RENDER_SECONDS) -> RenderResult:
+    """Run one script headless and record its output, meant to run in a worker."""
+    # Imported here since the runner itself imports this module.
+    from .main import run_script, use_clock
+    from .recorder import AsciicastRecorder
+
+    use_clock(0)
+    render_clock = BudgetClock(budget)
+    set_clock(render_clock)
+    output = Path(output_dir) / f"{Path(script_name).stem}.cast"
+    started = time.perf_counter()
+    status = "ok"
+
+    saved_stdin = sys.stdin
+    sys.stdin = io.StringIO(load_answers(script_name))
+    try:
+        with AsciicastRecorder(output, title=script_name, echo=False):
+            run_script(script_name)
+    except EOFError:
+        status = "ok (answers ran out)"
+    except KeyboardInterrupt:
+        pass
+    except SystemExit as e:
+        if e.code not in (None, 0):
+            status = f"exited with {e.code}"
+    except Exception as e:
+        status = f"failed: {e!r}"
+    finally:
+        sys.stdin = saved_stdin
+
+    if render_clock.interrupted:
+        status = f"stopped after {budget:.0f}s of script time"
+
+    return RenderResult(script_name, status, str(output), time.perf_counter() - started)
+
+
+def render_all(scripts: List[str], content_dir: Path, jobs: Optional[int] = None,
+               output_dir: Path = RENDERS_DIR) -> List[RenderResult]:
+    """Render scripts in parallel, one worker process per script at a time."""
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jobs = jobs or os.cpu_count() or 1
+
+    manifest = get_manifest(content_dir)
+    results = []
+    renderable = []
+    for script_name in scripts:
+        # Scripts drawing with turtle need a display, so they can't be rendered headless.
+        if manifest[script_name].graphical:
+            results.append(RenderResult(script_name, "skipped (graphical)", None, 0.0))
+        else:
+            renderable.append(script_name)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {executor.submit(render_script, script_name, output_dir): script_name for script_name in renderable}
+        for done, future in enumerate(as_completed(futures), start=1):
+            try:
+                result = future.result()
+            except Exception as e:
+                result = RenderResult(futures[future], f"failed: {e!r}", None, 0.0)
+            print(f"[{done}/{len(renderable)}] {result.script}: {result.status}", flush=True)
+            results.append(result)
+
+    return sorted(results, key=lambda result: result.script)
+
+
+def print_render_summary(results: List[RenderResult]) -> None:
+    """Print a summary table of a batch render."""
+    print()
+    print("=" * LINE_LENGTH)
+    print("RENDER SUMMARY:")
+    print("=" * LINE_LENGTH)
+    for result in results:
+        print(f"{result.script:<35} {result.seconds:6.2f}s  {result.status}")
+    print()
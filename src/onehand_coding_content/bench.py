@@ -0,0 +1,64 @@
+"""Import-time benchmark for tracking the cold start of the `content` CLI."""
+import sys
+import time
+from typing import Dict, List, NamedTuple
+
+from .config import LINE_LENGTH
+
+CLI_MODULE = "onehand_coding_content.main"
+
+
+class ImportTiming(NamedTuple):
+    """Result of benchmarking the import of a module."""
+    module: str
+    wall_times: List[float]
+    import_times: List[float]
+    slowest: List[tuple]
+
+
+def _parse_importtime(stderr: str) -> Dict[str, tuple]:
+    """Parse `python -X importtime` output into {module: (self_us, cumulative_us)}."""
+    timings = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|")
+        timings[module.strip()] = (int(self_us), int(cumulative_us))
+    return timings
+
+
+def measure_import_time(module: str = CLI_MODULE, runs: int = 5, top: int = 10) -> ImportTiming:
+    """Import `module` in fresh interpreters and time it."""
+    import subprocess
+
+    wall_times = []
+    import_times = []
+    timings = {}
+    for _ in range(runs):
+        started = time.perf_counter()
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True, text=True, check=True,
+        )
+        wall_times.append(time.perf_counter() - started)
+        timings = _parse_importtime(completed.stderr)
+        import_times.append(timings.get(module, (0, 0))[1] / 1_000_000)
+
+    slowest = sorted(timings.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return ImportTiming(module, wall_times, import_times, slowest)
+
+
+def print_import_timing(timing: ImportTiming) -> None:
+    """Print an import benchmark report."""
+    import statistics
+
+    print()
+    print("=" * LINE_LENGTH)
+    print(f"IMPORT TIME: {timing.module}")
+    print("=" * LINE_LENGTH)
+    print(f"Interpreter + import (median of {len(timing.wall_times)}): {statistics.median(timing.wall_times) * 1000:.1f} ms")
+    print(f"Import only (median): {statistics.median(timing.import_times) * 1000:.1f} ms")
+    print("\nSlowest modules (self time):")
+    for module, (self_us, cumulative_us) in timing.slowest:
+        print(f"  {self_us / 1000:7.2f} ms  {module}")
+    print()
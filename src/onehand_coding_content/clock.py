@@ -0,0 +1,111 @@
+"""Pluggable clock used to pace the presentation effects and content scripts.
+
+Scripts should call `clock.sleep()` instead of `time.sleep()` so a whole run can
+be sped up (previews) or skipped entirely (regression checks, batch rendering).
+asyncio is only imported by the async sleeps, which already run inside a loop.
+"""
+import time
+
+
+class Clock:
+    """Realtime clock, sleeps exactly as long as asked."""
+
+    speed = 1.0
+
+    def __init__(self):
+        self._start = time.monotonic()
+
+    @property
+    def realtime(self) -> bool:
+        """Whether the clock runs at normal speed."""
+        return self.speed == 1.0
+
+    def now(self) -> float:
+        """Logical seconds elapsed since the clock started."""
+        return (time.monotonic() - self._start) * self.speed
+
+    def sleep(self, seconds: float) -> None:
+        """Wait for `seconds` of logical time."""
+        if seconds > 0:
+            time.sleep(seconds / self.speed)
+
+    async def async_sleep(self, seconds: float) -> None:
+        """Async version of `sleep`."""
+        import asyncio
+
+        if seconds > 0:
+            await asyncio.sleep(seconds / self.speed)
+        else:
+            await asyncio.sleep(0)
+
+
+class ScaledClock(Clock):
+    """Clock that runs `speed` times faster than realtime."""
+
+    def __init__(self, speed: float):
+        if speed <= 0:
+            raise ValueError("Clock speed must be greater than zero.")
+        super().__init__()
+        self.speed = float(speed)
+
+
+class InstantClock(Clock):
+    """Clock that never actually waits, sleeping only moves logical time forward."""
+
+    speed = float("inf")
+
+    def __init__(self):
+        super().__init__()
+        self._elapsed = 0.0
+
+    def now(self) -> float:
+        return self._elapsed
+
+    def sleep(self, seconds: float) -> None:
+        if seconds > 0:
+            self._elapsed += seconds
+
+    async def async_sleep(self, seconds: float) -> None:
+        import asyncio
+
+        self.sleep(seconds)
+        await asyncio.sleep(0)
+
+
+def make_clock(speed: float = 1.0) -> Clock:
+    """Create a clock for a speed factor, 0 means instant."""
+    if speed == 0:
+        return InstantClock()
+    if speed == 1:
+        return Clock()
+    return ScaledClock(speed)
+
+
+_clock = Clock()
+
+
+def get_clock() -> Clock:
+    """Return the active clock."""
+    return _clock
+
+
+def set_clock(clock: Clock) -> Clock:
+    """Make `clock` the active clock, returns the previous one."""
+    global _clock
+    previous, _clock = _clock, clock
+    return previous
+
+
+def now() -> float:
+    """Logical time of the active clock."""
+    return _clock.now()
+
+
+def sleep(seconds: float) -> None:
+    """Sleep on the active clock."""
+    _clock.sleep(seconds)
+
+
+async def async_sleep(seconds: float) -> None:
+    """Async sleep on the active clock."""
+    await _clock.async_sleep(seconds)
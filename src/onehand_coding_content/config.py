@@ -26,15 +26,21 @@ def create_folders(folders: List[Path]) -> None:
         folder.mkdir(parents=True, exist_ok=True)
 
 
+def ensure_data_folders() -> None:
+    """Create the data folders, call this before writing into them."""
+    create_folders(data_folders)
+
+
 # Directories
 PROJECT_ROOT = find_project_root()
 
 DATA_DIR = PROJECT_ROOT / "data"
 SOUND_DIR = PROJECT_ROOT / "data" / "sounds"
 MAPS_DIR = PROJECT_ROOT / "data" / "maps"
+RENDERS_DIR = PROJECT_ROOT / "data" / "renders"
+ANSWERS_DIR = PROJECT_ROOT / "data" / "answers"
 
 data_folders = [DATA_DIR, SOUND_DIR, MAPS_DIR]
-create_folders(data_folders)
 
 # Generic constants
 LINE_LENGTH = 50
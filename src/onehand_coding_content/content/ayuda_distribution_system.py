@@ -1,6 +1,6 @@
-import time
 import random
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
 
@@ -101,7 +101,7 @@ class AyudaDistributionSystem:
         
         for event in events:
             typing_with_pauses(event)
-            time.sleep(0.5)
+            clock.sleep(0.5)
 
         final_ayuda = ayuda_per_person * 0.25 # 'Processing fees'
         dramatic_pause(1)
@@ -6,8 +6,8 @@ Filed by: Sen. Bam Aquino (September 2, 2025)
 "Putting corruption on the blockchain... so at least it's transparent corruption!"
 """
 
-import time
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, CORRUPTION_3, DELAY
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -54,7 +54,7 @@ class BlockchainBudgetAnalyzer:
         for feature, description in promises:
             typing_with_pauses(f"\n✅ {feature}:")
             typing_with_pauses(f"   → {description}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         dramatic_pause(2)
         typing_with_pauses("\n💬 Sen. Aquino: 'Bawat piso, kita ng publiko!'")
@@ -97,9 +97,9 @@ class BlockchainBudgetAnalyzer:
 
         for item in technical_facts:
             typing_with_pauses(f"\n⚡ {item['concept']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   💭 Reality: {item['reality']}")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   ⚠️  Implication: {item['implication']}")
             dramatic_pause(1.5)
 
@@ -156,11 +156,11 @@ class BlockchainBudgetAnalyzer:
 
         for item in advantages:
             typing_with_pauses(f"\n📌 {item['advantage']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   ℹ️  What it means: {item['explanation']}")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   📋 Example: {item['example']}")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   📊 Impact Level: {item['impact']}")
             dramatic_pause(1.5)
 
@@ -235,13 +235,13 @@ class BlockchainBudgetAnalyzer:
 
         for item in problems:
             typing_with_pauses(f"\n🔴 {item['problem']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   📖 What it means: {item['description']}")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   🎭 Real scenario: {item['scenario']}")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   💰 Who benefits: {item['who_benefits']}")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   ⚠️  Severity: {item['severity']}")
             dramatic_pause(1.5)
 
@@ -258,7 +258,7 @@ class BlockchainBudgetAnalyzer:
         dramatic_pause(1)
 
         typing_with_pauses("\n1️⃣  BEFORE Blockchain (The Prerequisites):")
-        time.sleep(1)
+        clock.sleep(1)
         prerequisites = [
             "Strong anti-corruption laws (with enforcement!)",
             "Independent oversight bodies (with teeth!)",
@@ -268,11 +268,11 @@ class BlockchainBudgetAnalyzer:
         ]
         for prereq in prerequisites:
             typing_with_pauses(f"   ❌ {prereq}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         dramatic_pause(2)
         typing_with_pauses("\n📊 Status Check:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   ₱118.5B in ghost projects (2025)")
         typing_with_pauses("   Independent Commission Investigation (2025)")
         typing_with_pauses("   Hearings: CLOSED DOOR ❌")
@@ -292,17 +292,17 @@ class BlockchainBudgetAnalyzer:
         dramatic_pause(3)
 
         typing_with_pauses("\n🔄 The Pattern:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   ├─ Problem discovered: Corruption")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses("   ├─ Solution proposed: New technology")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses("   ├─ Technology implemented: ₱₱₱")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses("   ├─ Corruption still happens: But transparent now!")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses("   ├─ No one jailed: 'Under investigation'")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses("   └─ Next scandal: Blockchain contract overpriced")
         dramatic_pause(3)
 
@@ -351,17 +351,17 @@ class BlockchainBudgetAnalyzer:
 
         for event in events:
             typing_with_pauses(f"\n📆 {event['time']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   📢 Event: {event['event']}")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   ⛓️  Blockchain: {event['blockchain']}")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   🎭 Reality: {event['reality']}")
             dramatic_pause(2)
 
         dramatic_pause(2)
         typing_with_pauses("\n📊 Year-End Summary:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   ✅ Blockchain: Working perfectly")
         typing_with_pauses("   ✅ Transparency: 100%")
         typing_with_pauses("   ✅ Data Integrity: Immaculate")
@@ -412,11 +412,11 @@ class BlockchainBudgetAnalyzer:
 
         for opinion in opinions:
             typing_with_pauses(f"\n👤 {opinion['expert']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   📍 Position: {opinion['position']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   💬 Quote: {opinion['quote']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   ⚖️  Verdict: {opinion['verdict']}")
             dramatic_pause(1.5)
 
@@ -439,7 +439,7 @@ class BlockchainBudgetAnalyzer:
         dramatic_pause(1)
 
         typing_with_pauses("\n💸 ESTIMATED COSTS:")
-        time.sleep(1)
+        clock.sleep(1)
         costs = [
             ("Blockchain Infrastructure", "₱2-5 Billion", "Servers, nodes, network"),
             ("System Development", "₱3-8 Billion", "Smart contracts, portal, APIs"),
@@ -455,14 +455,14 @@ class BlockchainBudgetAnalyzer:
         for item, cost, note in costs:
             typing_with_pauses(f"   • {item}: {cost}")
             typing_with_pauses(f"     └─ {note}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         dramatic_pause(1)
         typing_with_pauses(f"\n   📈 TOTAL ESTIMATED COST: ₱{total_low}-{total_high} Billion")
         dramatic_pause(2)
 
         typing_with_pauses("\n✨ POTENTIAL BENEFITS:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   IF political will exists:")
         typing_with_pauses("   • Reduced post-approval tampering: Priceless")
         typing_with_pauses("   • Faster detection of anomalies: High value")
@@ -481,7 +481,7 @@ class BlockchainBudgetAnalyzer:
         typing_with_pauses("   'Is blockchain the best use of ₱21B?'")
         dramatic_pause(1)
         typing_with_pauses("   'Or would ₱21B be better spent on...'")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Actually enforcing existing anti-corruption laws?")
         typing_with_pauses("   • Strengthening COA and Ombudsman?")
         typing_with_pauses("   • Witness protection programs that work?")
@@ -502,7 +502,7 @@ class BlockchainBudgetAnalyzer:
         dramatic_pause(2)
 
         typing_with_pauses("\n✅ PASS THE BILL IF:")
-        time.sleep(1)
+        clock.sleep(1)
         conditions_pass = [
             "It's PAIRED with anti-corruption law reforms",
             "COA and Ombudsman get MORE funding and power",
@@ -514,12 +514,12 @@ class BlockchainBudgetAnalyzer:
         ]
         for condition in conditions_pass:
             typing_with_pauses(f"   • {condition}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         dramatic_pause(2)
 
         typing_with_pauses("\n❌ DON'T PASS (or Delay) IF:")
-        time.sleep(1)
+        clock.sleep(1)
         conditions_fail = [
             "It's seen as THE solution (it's not, it's A tool)",
             "Implementation contract goes to 'preferred bidder'",
@@ -531,7 +531,7 @@ class BlockchainBudgetAnalyzer:
         ]
         for condition in conditions_fail:
             typing_with_pauses(f"   • {condition}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         dramatic_pause(3)
 
@@ -565,7 +565,7 @@ class BlockchainBudgetAnalyzer:
         typing_with_pauses("\n🔮 PREDICTION:")
         dramatic_pause(1)
         typing_with_pauses("   IF passed without reforms:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Year 1: Big announcement, much hype")
         typing_with_pauses("   • Year 2: Implementation delays, cost overruns")
         typing_with_pauses("   • Year 3: 'Working' but no one uses it")
@@ -1,5 +1,5 @@
-import time
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, CORRUPTION_2
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -36,7 +36,7 @@ class Budget2025Reallocator:
 
         for program, amount in self.original_allocations.items():
             typing_with_pauses(f"   • {program}: ₱{amount:,.2f}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         dramatic_pause(2)
         typing_with_pauses("\n✅ 'Looks good for the people!' - Citizens")
@@ -64,9 +64,9 @@ class Budget2025Reallocator:
         # The infamous realignment
         print("\n🎯 Realignment Summary:")
         typing_with_pauses("   • Regular Realignments: ₱487.5 Billion")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Unprogrammed Funds Added: ₱373 Billion")
-        time.sleep(1)
+        clock.sleep(1)
 
         total_realigned = 487_500_000_000 + 373_000_000_000
         typing_with_pauses(f"   • TOTAL REALIGNED: ₱{total_realigned:,.2f}")
@@ -105,7 +105,7 @@ class Budget2025Reallocator:
             typing_with_pauses(f"   Original: ₱{original:,.2f}")
             typing_with_pauses(f"   New Amount: ₱{new:,.2f}")
             typing_with_pauses(f"   CUT: -₱{cut_amount:,.2f} ({cut_percent:.1f}%)")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   💬 {comment}")
             dramatic_pause(2)
 
@@ -141,7 +141,7 @@ class Budget2025Reallocator:
             typing_with_pauses(f"   Before: ₱{original:,.2f}")
             typing_with_pauses(f"   After: ₱{new:,.2f}")
             typing_with_pauses(f"   INCREASE: +₱{increase_amount:,.2f} (+{increase_percent:.0f}%)")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   💬 {comment}")
             dramatic_pause(2)
 
@@ -170,7 +170,7 @@ class Budget2025Reallocator:
 
         for source, reaction in reactions:
             typing_with_pauses(f"\n   {source}: {reaction}")
-            time.sleep(1.5)
+            clock.sleep(1.5)
 
         dramatic_pause(2)
 
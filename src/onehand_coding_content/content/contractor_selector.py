@@ -1,6 +1,6 @@
-import time
 import random
 
+from .. import clock
 from ..sounds import play_with_wait, SABOG_SOUND
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
 
@@ -71,7 +71,7 @@ class ContractorSelectionSystem:
             typing_with_pauses(f"   Credentials: {bidder['credentials']}")
             typing_with_pauses(f"   Past Projects: {bidder['past_projects']}")
             print()
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
     def evaluation_criteria(self):
         """Official evaluation metrics (very scientific)"""
@@ -89,7 +89,7 @@ class ContractorSelectionSystem:
 
         for criterion, weight, note in criteria:
             typing_with_pauses(f"✓ {criterion}: {weight} - {note}")
-            time.sleep(0.5)
+            clock.sleep(0.5)
 
     def random_selection_process(self):
         """The most 'random' selection you'll ever see"""
@@ -110,7 +110,7 @@ class ContractorSelectionSystem:
         typing_with_pauses("\n⏳ Selecting winner in:")
         for i in range(3, 0, -1):
             typing_with_pauses(f"   {i}...")
-            time.sleep(1)
+            clock.sleep(1)
 
         # Fake randomization
         typing_with_pauses("\n🎯 Random selection in progress:")
@@ -119,12 +119,12 @@ class ContractorSelectionSystem:
         for bidder in self.bidders:
             bidder = bidder['name']
             typing_with_pauses(f"   Checking... {bidder}")
-            time.sleep(0.5)
+            clock.sleep(0.5)
             if bidder != self.the_chosen_one:
                 typing_with_pauses(f"   ❌ Disqualified ({random.choice(self.disqualification_reasons)})")
             else:
                 typing_with_pauses("   ✅ *Mysteriously passes all criteria*")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
     def announce_winner(self):
         """The grand reveal"""
@@ -168,7 +168,7 @@ class ContractorSelectionSystem:
 
         for reaction in reactions:
             typing_with_pauses(f"   {reaction}")
-            time.sleep(1)
+            clock.sleep(1)
 
         dramatic_pause(2)
         typing_with_pauses("\n📢 Official Response:")
@@ -1,6 +1,6 @@
-import time
 import random
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, CORRUPTION_1
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -95,7 +95,7 @@ def main():
 
         for question in questions:
             typing_with_pauses(f"❓ {senator}: '{question}'")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
             # Simulate witness response
             response_type = random.choice(["invoke", "deflect", "answer"])
@@ -117,7 +117,7 @@ def main():
     typing_with_pauses("   - CONTINUE: Use when skipping corrupt allocations or sleeping senators")
     typing_with_pauses("   - LOOPS: Perfect for simulating endless Philippine political cycles!")
 
-    time.sleep(2)
+    clock.sleep(2)
     typing_with_pauses("\n🤷‍♂️ Welcome to Philippine politics - where the loops never end!")
     typing_with_pauses("   and the break statements are just wishful thinking...")
 
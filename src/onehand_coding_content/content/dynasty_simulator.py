@@ -3,10 +3,10 @@ Philippine Political Dynasty Simulator
 A stark look at inherited power in Philippine politics
 """
 
-import time
 import signal
 import random
 
+from .. import clock
 from ..sounds import play_with_wait, CORRUPTION_3
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
 
@@ -29,42 +29,42 @@ def run_dynasty_loop():
             dramatic_pause(1)
 
             typing_with_pauses("  Ballots being cast...")
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses("  Votes being counted...")
-            time.sleep(1)
+            clock.sleep(1)
 
             # Election Results - Same Surnames Win
             typing_with_pauses("\n  📊 RESULTS: Same families win again!")
-            time.sleep(0.5)
+            clock.sleep(0.5)
 
             typing_with_pauses("    • Marcos family: Still in power")
             typing_with_pauses("    • Duterte family: Still in power")
             typing_with_pauses("    • Senator siblings: Still in Senate")
             typing_with_pauses("    • Provincial dynasties: Still controlling their territories")
 
-            time.sleep(1)
+            clock.sleep(1)
 
             # The Waiting Period
             typing_with_pauses(f"\n  ⏳ Simulating {year}-{year+6} term...")
-            time.sleep(2.5)  # Representing 6-year term
+            clock.sleep(2.5)  # Representing 6-year term
 
             typing_with_pauses("  ✓ Term completed. Same surnames still in power.")
 
             # Meta Commentary
             if election_count == 1:
-                time.sleep(1)
+                clock.sleep(1)
                 typing_with_pauses("\n  # Hmmm, coincidence lang siguro...")
             elif election_count == 2:
-                time.sleep(1)
+                clock.sleep(1)
                 typing_with_pauses("\n  # Wait, same families pa rin?")
             elif election_count == 3:
-                time.sleep(1)
+                clock.sleep(1)
                 typing_with_pauses("\n  # Ito na yata yung pattern eh...")
             elif election_count == 4:
-                time.sleep(1)
+                clock.sleep(1)
                 typing_with_pauses("\n  # Decades na... still the same surnames.")
             elif election_count >= 5:
-                time.sleep(1)
+                clock.sleep(1)
                 typing_with_pauses("\n  # This is not a bug. It's a FEATURE.")
 
             year += 6  # Next election cycle
@@ -75,7 +75,7 @@ def run_dynasty_loop():
             # break  # Still waiting for Congress to pass the enabling law...
             # break  # Pero puro dynasty members naman ang Congress, so... 🤷
 
-            time.sleep(2)
+            clock.sleep(2)
 
     except KeyboardInterrupt:
         # User tries to escape the loop
@@ -86,7 +86,7 @@ def run_dynasty_loop():
         typing_with_pauses("⚠️  SIMULATION INTERRUPTED BY USER")
         print("=" * 60)
 
-        time.sleep(1)
+        clock.sleep(1)
 
         typing_with_pauses(f"\n  You pressed Ctrl+C after {election_count} election cycles.")
         typing_with_pauses(f"  That's {election_count * 6} years of the same families in power.")
@@ -100,9 +100,9 @@ def run_dynasty_loop():
         dramatic_pause(2)
 
         typing_with_pauses("\n  At least sa code, may Ctrl+C button.")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("  Sa totoo? Wala tayong ganyang option.")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("  The loop just... continues. Forever.")
 
         dramatic_pause(2)
@@ -122,7 +122,7 @@ def run_dynasty_loop():
         typing_with_pauses("💭 This is not a bug. This is by design.")
         print()
 
-        time.sleep(1)
+        clock.sleep(1)
 
         play_with_wait(CORRUPTION_3)
 
@@ -162,34 +162,34 @@ def main():
     print("=" * 60)
     typewriter_effect("PHILIPPINE POLITICAL DYNASTY SIMULATOR v1987.0")
     print("=" * 60)
-    time.sleep(1)
+    clock.sleep(1)
 
     typing_with_pauses("\n# Initializing democracy.exe...")
     dramatic_pause(2)
 
     typing_with_pauses("\n# Loading political families into power...")
-    time.sleep(1)
+    clock.sleep(1)
 
     # Show current power structure
     typing_with_pauses("\n>>> NATIONAL LEVEL DETECTED:")
-    time.sleep(0.5)
+    clock.sleep(0.5)
 
     for branch, positions in national_positions.items():
         print(f"\n  {branch}:")
         for position, family in positions.items():
             typing_with_pauses(f"    • {position}: {family}")
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
     dramatic_pause(2)
 
     typing_with_pauses("\n>>> PROVINCIAL DYNASTIES DETECTED:")
-    time.sleep(0.5)
+    clock.sleep(0.5)
 
     for province, families in list(provincial_dynasties.items())[:5]:  # Show first 5
         typing_with_pauses(f"\n  {province}:")
         for family in families:
             typing_with_pauses(f"    • {family} (Controlling local government for decades)")
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
     typing_with_pauses("\n  ... and more provinces with similar patterns")
 
@@ -200,7 +200,7 @@ def main():
     typing_with_pauses("💡 ATTEMPTING SOLUTION: Brute Force Configuration Search")
     print("=" * 60)
 
-    time.sleep(1)
+    clock.sleep(1)
 
     typing_with_pauses("\n# Maybe we can find a dynasty-free government configuration?")
     typewriter_effect("# Let's try different permutations of available candidates...")
@@ -261,7 +261,7 @@ def main():
     for province, pool in provincial_locks.items():
         dynasty_count = len([c for c in pool if c[1] != "No Dynasty"])
         typing_with_pauses(f"     • {province}: {dynasty_count}/{len(pool)} candidates are dynasty members")
-        time.sleep(0.3)
+        clock.sleep(0.3)
 
     typing_with_pauses(f"\n🎯 Positions to randomize: {len(national_positions)} (national level only)")
     typing_with_pauses(f"🔒 Positions locked by territory: {len(provincial_locks)} (provincial level)")
@@ -269,7 +269,7 @@ def main():
     dramatic_pause(2)
 
     typing_with_pauses("\n# Generating random government configurations...")
-    time.sleep(1)
+    clock.sleep(1)
 
     # Try 3 random permutations
     for attempt in range(1, 4):
@@ -288,27 +288,27 @@ def main():
             provincial_config[province] = random.choice(pool)
 
         typing_with_pauses("\n  Proposed Government Configuration:")
-        time.sleep(0.5)
+        clock.sleep(0.5)
 
         # Display NATIONAL configuration
         typing_with_pauses("\n  National Level (randomized):")
         for i, position in enumerate(national_positions):
             candidate_name, family = national_config[i]
             typing_with_pauses(f"    • {position}: {candidate_name} ({family})")
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
         # Display PROVINCIAL configuration (territory-locked)
         dramatic_pause(1)
         typing_with_pauses("\n  Provincial Level (locked by territory):")
         for province, (candidate_name, family) in provincial_config.items():
             typing_with_pauses(f"    • {province}: {candidate_name} ({family})")
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
         dramatic_pause(2)
 
         # Analyze for dynasties
         typing_with_pauses("\n  🔬 Analyzing for dynasty members...")
-        time.sleep(1)
+        clock.sleep(1)
 
         # Combine both configs for analysis
         all_config = national_config + list(provincial_config.values())
@@ -326,15 +326,15 @@ def main():
         duplicate_families = sum(1 for count in family_counts.values() if count > 1)
 
         typing_with_pauses("\n  📈 Results:")
-        time.sleep(0.3)
+        clock.sleep(0.3)
         typing_with_pauses(f"    • Total positions: {total_positions}")
-        time.sleep(0.3)
+        clock.sleep(0.3)
         typing_with_pauses(f"    • Dynasty members: {dynasty_count}/{total_positions} ({dynasty_percentage:.1f}%)")
-        time.sleep(0.3)
+        clock.sleep(0.3)
 
         if duplicate_families > 0:
             typing_with_pauses(f"    • Families with multiple members: {duplicate_families}")
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
         independent_count = total_positions - dynasty_count
         typing_with_pauses(f"    • Independent officials: {independent_count}/{total_positions} ({100-dynasty_percentage:.1f}%)")
@@ -346,14 +346,14 @@ def main():
             typing_with_pauses("\n  ✅ SUCCESS: Dynasty-free government found!")
         else:
             typing_with_pauses(f"\n  ❌ FAILED: Still {dynasty_percentage:.1f}% dynasty-controlled")
-            time.sleep(0.5)
+            clock.sleep(0.5)
             typing_with_pauses("  (Even with provinces locked to their territories)")
 
-        time.sleep(1)
+        clock.sleep(1)
 
         if attempt < 3:
             typing_with_pauses("\n  Trying another combination...")
-            time.sleep(1)
+            clock.sleep(1)
 
     # Final analysis
     dramatic_pause(3)
@@ -362,39 +362,39 @@ def main():
     typing_with_pauses("📊 BRUTE FORCE ATTEMPT: CONCLUSION")
     print("=" * 60)
 
-    time.sleep(1)
+    clock.sleep(1)
 
     typing_with_pauses("\n  After 3 random configuration attempts:")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses("  ❌ No dynasty-free government configuration found")
 
     dramatic_pause(2)
 
     typing_with_pauses("\n  Root Cause Analysis:")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses("    • Problem is not the algorithm")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses("    • Problem is the dataset (candidate pool)")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses(f"    • National level: {len([c for c in national_candidates if c[1] != 'No Dynasty'])}/{len(national_candidates)} candidates are dynasty-affiliated")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses("    • Provincial level: Already locked to territorial dynasties")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses("    • Even randomizing national positions can't overcome provincial locks")
 
     dramatic_pause(2)
 
     typing_with_pauses("\n  💭 Conclusion:")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses("  You can't brute force your way out of a system")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses("  where the input itself is already compromised.")
 
     dramatic_pause(3)
 
     typing_with_pauses("You want to see why?...")
 
-    time.sleep(2)
+    clock.sleep(2)
 
     run_dynasty_loop()  # The Infinite Loop - The Heart of the Problem
 
@@ -1,6 +1,6 @@
-import time
 import random
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, EVIL_GIGGLE
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -21,7 +21,7 @@ def travel_edsa(destination, distance_km, traffic_reasons, contemplations):
 
     distance_traveled = 0
     patience_level = 100
-    start_time = time.time()
+    start_time = clock.now()
 
     while distance_traveled < distance_km:
         move = random.uniform(0.001, 0.05)
@@ -49,7 +49,7 @@ def travel_edsa(destination, distance_km, traffic_reasons, contemplations):
 
         dramatic_pause(1)
 
-    end_time = time.time()
+    end_time = clock.now()
     total_time_seconds = end_time - start_time
     total_time_hours = total_time_seconds / 3600
 
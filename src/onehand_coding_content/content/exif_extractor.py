@@ -7,25 +7,146 @@ Features:
 - GPS location extraction with reverse geocoding
 - Interactive maps (Folium) + Google Maps option
 - Privacy awareness education
+
+Batch mode: content exif_extractor --folder PHOTOS [--output results.jsonl] [--jobs 8] [--geocode]
 """
 
 import os
+import re
 import sys
+import json
+import math
+import argparse
 from pathlib import Path
 from datetime import datetime
 import webbrowser
+from importlib.util import find_spec
 
-import pyexiv2
-import folium
-from folium.plugins import MarkerCluster
-from PIL import Image
-from PIL.ExifTags import TAGS, GPSTAGS
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut, GeocoderServiceError
-
-from ..config import LINE_LENGTH, MAPS_DIR
+from ..config import LINE_LENGTH, MAPS_DIR, ensure_data_folders
+from ..geocode_queue import (
+    ADDRESS_NOT_FOUND, ADDRESS_LOOKUP_FAILED, ADDRESS_LOOKUP_ERROR, GEOCODE_TIMEOUT, NOMINATIM_RATE,
+    GeocodeQueue, is_network_error,
+)
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
 
+# Images per task sent to a worker process, bigger chunks mean less pickling
+# overhead, smaller ones a smoother progress counter.
+MAX_CHUNK_SIZE = 64
+
+JPEG_FORMATS = ('.jpg', '.jpeg')
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+JPEG_SOS = 0xDA
+JPEG_COM = 0xFE
+
+
+# One EXIF rational as pyexiv2 formats it, "4272/100", or a plain number.
+RATIONAL_PATTERN = re.compile(r"(\d+)(?:/(\d+))?|(\d*\.\d+)")
+
+
+def parse_rational(value):
+    """
+    Turn an EXIF rational into a float, None if it isn't one.
+
+    Accepts pyexiv2 strings like "4272/100", PIL IFDRational (or any
+    fraction-like object), old PIL (numerator, denominator) tuples and plain
+    numbers. Nothing is ever evaluated, so odd metadata can't run code.
+    """
+    try:
+        if isinstance(value, str):
+            match = RATIONAL_PATTERN.fullmatch(value.strip())
+            if not match:
+                return None
+            numerator, denominator, decimal = match.groups()
+            if decimal is not None:
+                return float(decimal)
+            numerator, denominator = int(numerator), int(denominator or 1)
+        elif hasattr(value, "numerator") and hasattr(value, "denominator"):
+            numerator, denominator = value.numerator, value.denominator
+        elif isinstance(value, tuple) and len(value) == 2:
+            numerator, denominator = value
+        else:
+            result = float(value)
+            return result if math.isfinite(result) else None
+
+        if not denominator:
+            return None
+        result = numerator / denominator
+        return result if math.isfinite(result) else None
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def dms_to_degrees(value):
+    """
+    Decimal degrees from EXIF degrees/minutes/seconds, None if they can't be read.
+
+    Takes the pyexiv2 string form "14/1 35/1 4272/100" or a sequence of up to
+    three rationals as PIL returns them.
+    """
+    parts = value.split() if isinstance(value, str) else value
+    try:
+        parts = list(parts)
+    except TypeError:
+        return None
+    if not 1 <= len(parts) <= 3:
+        return None
+
+    degrees = 0.0
+    for i, part in enumerate(parts):
+        number = parse_rational(part)
+        if number is None or number < 0:
+            return None
+        degrees += number / 60 ** i
+    return degrees
+
+
+def read_jpeg_header(image_path):
+    """
+    Read only the metadata segments of a JPEG, returned as a tiny JPEG.
+
+    EXIF, XMP, IPTC and ICC data all live in the APPn segments before the
+    image data starts, so everything else is skipped with seeks and the
+    file is left as soon as the scan starts. Returns None for files that
+    don't look like JPEGs, callers then fall back to reading the whole file.
+    """
+    with open(image_path, "rb") as f:
+        if f.read(2) != JPEG_SOI:
+            return None
+        segments = [JPEG_SOI]
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            # Markers may be padded with extra 0xFF bytes.
+            while marker[1] == 0xFF:
+                marker = marker[1:] + f.read(1)
+                if len(marker) < 2:
+                    return None
+            code = marker[1]
+            if code == JPEG_SOS or marker == JPEG_EOI:
+                break
+            if 0xD0 <= code <= 0xD7 or code == 0x01:
+                # Markers without a length.
+                continue
+
+            length_bytes = f.read(2)
+            if len(length_bytes) < 2:
+                return None
+            length = int.from_bytes(length_bytes, "big")
+            if length < 2:
+                return None
+            if 0xE0 <= code <= 0xEF or code == JPEG_COM:
+                payload = f.read(length - 2)
+                if len(payload) < length - 2:
+                    return None
+                segments.append(marker + length_bytes + payload)
+            else:
+                f.seek(length - 2, os.SEEK_CUR)
+
+    segments.append(JPEG_EOI)
+    return b"".join(segments)
+
 
 class ExifExtractor:
     """
@@ -35,10 +156,33 @@ class ExifExtractor:
 
     SUPPORTED_FORMATS = ('.jpg', '.jpeg', '.png', '.tiff', '.bmp', '.heic')
 
-    def __init__(self):
-        self.geocoder = Nominatim(user_agent="saan-ka-talaga-ph")
+    def __init__(self, geocoder=None, geocode_cache=None):
+        """
+        Args:
+            geocoder: Anything with geopy's `reverse(query, timeout=...)`, defaults to Nominatim.
+            geocode_cache: A `GeocodeCache`, defaults to the one in the data folder.
+        """
+        self._geocoder = geocoder
+        self._geocode_cache = geocode_cache
         self.results = []
-        self.has_pyexiv2 = pyexiv2 is not None
+        # pyexiv2 is optional and only imported when extracting, PIL is the fallback.
+        self.has_pyexiv2 = find_spec("pyexiv2") is not None
+
+    @property
+    def geocoder(self):
+        """Nominatim geocoder, geopy is only imported when an address is needed."""
+        if self._geocoder is None:
+            from geopy.geocoders import Nominatim
+            self._geocoder = Nominatim(user_agent="saan-ka-talaga-ph")
+        return self._geocoder
+
+    @property
+    def geocode_cache(self):
+        """Cache of looked up addresses, only opened when an address is needed."""
+        if self._geocode_cache is None:
+            from ..geocode_cache import GeocodeCache
+            self._geocode_cache = GeocodeCache()
+        return self._geocode_cache
 
     def show_intro(self):
         """Display intro with warnings"""
@@ -79,9 +223,13 @@ class ExifExtractor:
 
     def extract_exif_pil(self, image_path):
         """Extract EXIF using PIL (fallback method)"""
+        from PIL import Image
+        from PIL.ExifTags import TAGS
+
         try:
-            img = Image.open(image_path)
-            exif_data = img._getexif()
+            # Image.open only parses the headers, the pixels are never decoded.
+            with Image.open(image_path) as img:
+                exif_data = img._getexif()
 
             if not exif_data:
                 return None
@@ -96,12 +244,33 @@ class ExifExtractor:
             return None
 
     def extract_exif_pyexiv2(self, image_path):
-        """Extract EXIF using pyexiv2 (more robust)"""
+        """
+        Extract EXIF using pyexiv2 (more robust)
+
+        Returns an empty dict when the image has no EXIF data, and None only
+        when exiv2 couldn't read it, so PIL is only tried for the latter.
+        """
+        import pyexiv2
+
+        try:
+            # JPEGs: hand exiv2 just the metadata segments. Other formats: let
+            # exiv2 open the file itself, it only reads the parts it needs.
+            header = read_jpeg_header(image_path) if Path(image_path).suffix.lower() in JPEG_FORMATS else None
+            if header is not None:
+                with pyexiv2.ImageData(header) as image_info:
+                    exif_data = image_info.read_exif()
+            else:
+                with pyexiv2.Image(str(image_path)) as image_info:
+                    exif_data = image_info.read_exif()
+            return exif_data or {}
+        except Exception:
+            pass
+
+        # Last resort, e.g. paths exiv2 can't open on Windows: read the whole file.
         try:
             with open(image_path, "rb") as f:
                 with pyexiv2.ImageData(f.read()) as image_info:
-                    exif_data = image_info.read_exif()
-                    return exif_data if exif_data else None
+                    return image_info.read_exif() or {}
         except Exception as e:
             return None
 
@@ -110,6 +279,8 @@ class ExifExtractor:
         if not exif:
             return None
 
+        from PIL.ExifTags import GPSTAGS
+
         try:
             # Try pyexiv2 format (most reliable)
             if isinstance(exif, dict):
@@ -120,14 +291,10 @@ class ExifExtractor:
 
                 if latitude_info and longitude_info:
                     # Parse format like "14/1 35/1 4272/100"
-                    latitude = sum(
-                        (value / 60**i)
-                        for i, value in enumerate(map(eval, latitude_info.split()))
-                    )
-                    longitude = sum(
-                        (value / 60**i)
-                        for i, value in enumerate(map(eval, longitude_info.split()))
-                    )
+                    latitude = dms_to_degrees(latitude_info)
+                    longitude = dms_to_degrees(longitude_info)
+                    if not self.valid_coordinates(latitude, longitude):
+                        return None
 
                     # Apply hemisphere
                     if lat_ref == 'S':
@@ -151,6 +318,8 @@ class ExifExtractor:
                 if 'GPSLatitude' in gps_data and 'GPSLongitude' in gps_data:
                     lat = self.convert_to_degrees(gps_data['GPSLatitude'])
                     lon = self.convert_to_degrees(gps_data['GPSLongitude'])
+                    if not self.valid_coordinates(lat, lon):
+                        return None
 
                     if gps_data.get('GPSLatitudeRef') == 'S':
                         lat = -lat
@@ -165,30 +334,113 @@ class ExifExtractor:
 
         return None
 
+    def extract_metadata(self, image_path):
+        """Everything the batch mode needs from one image, without any output."""
+        record = {'path': str(image_path), 'filename': os.path.basename(image_path)}
+
+        exif = None
+        if self.has_pyexiv2:
+            exif = self.extract_exif_pyexiv2(image_path)
+        if exif is None:
+            exif = self.extract_exif_pil(image_path)
+
+        record['has_exif'] = bool(exif)
+        if not exif:
+            return record
+
+        record['camera'] = self.extract_camera_info(exif)
+        record['date'], record['time'] = self.extract_datetime(exif)
+        gps_data = self.extract_gps_data(exif)
+        if gps_data:
+            record.update(gps_data)
+        return record
+
+    def extract_batch(self, image_paths, jobs=None, progress=None, on_records=None):
+        """
+        Extract metadata from many images across worker processes.
+
+        Images are sent to the workers in chunks and the records come back in
+        the same order as `image_paths`. `progress(done, total)` is called as
+        chunks finish, and `on_records(records)` with each finished chunk's
+        records so they can be used before the whole batch is done.
+        """
+        image_paths = [str(path) for path in image_paths]
+        total = len(image_paths)
+        jobs = jobs or os.cpu_count() or 1
+
+        if jobs == 1 or total <= 1:
+            records = []
+            for done, image_path in enumerate(image_paths, 1):
+                records.append(self.extract_metadata(image_path))
+                if on_records:
+                    on_records(records[-1:])
+                if progress:
+                    progress(done, total)
+            return records
+
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # A few chunks per worker keeps them all busy until the end.
+        chunk_size = max(1, min(MAX_CHUNK_SIZE, total // (jobs * 4)))
+        chunks = [image_paths[i:i + chunk_size] for i in range(0, total, chunk_size)]
+        results = [None] * len(chunks)
+        done = 0
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {executor.submit(extract_chunk, chunk): index for index, chunk in enumerate(chunks)}
+            for future in as_completed(futures):
+                index = futures[future]
+                results[index] = future.result()
+                if on_records:
+                    on_records(results[index])
+                done += len(chunks[index])
+                if progress:
+                    progress(done, total)
+
+        return [record for chunk_records in results for record in chunk_records]
+
+    def lookup_address(self, lat, lon):
+        """
+        Address of coordinates, or a short reason why there isn't one.
+
+        Answers are cached per rounded location, so photos taken at the same
+        place only cost one geocoder call. Failed lookups aren't cached.
+        """
+        address = self.geocode_cache.get(lat, lon)
+        if address is not None:
+            return address
+
+        try:
+            location = self.geocoder.reverse(f"{lat}, {lon}", timeout=GEOCODE_TIMEOUT)
+        except Exception as e:
+            return ADDRESS_LOOKUP_FAILED if is_network_error(e) else ADDRESS_LOOKUP_ERROR
+
+        address = location.address if location else ADDRESS_NOT_FOUND
+        self.geocode_cache.put(lat, lon, address)
+        return address
+
     def convert_to_degrees(self, value):
         """Convert GPS coordinates to degrees"""
-        d, m, s = value
-        return d + (m / 60.0) + (s / 3600.0)
+        return dms_to_degrees(value)
+
+    def valid_coordinates(self, lat, lon):
+        """Whether parsed coordinates are a real place on Earth"""
+        return lat is not None and lon is not None and lat <= 90 and lon <= 180
 
     def reverse_geocode(self, lat, lon):
         """Get address from coordinates using geopy"""
-        try:
-            typewriter_effect("   🌐 Looking up address...")
-            location = self.geocoder.reverse(f"{lat}, {lon}", timeout=10)
-            dramatic_pause(1)
+        typewriter_effect("   🌐 Looking up address...")
+        address = self.lookup_address(lat, lon)
 
-            if location:
-                return location.address
-            return "Address not found"
-
-        except (GeocoderTimedOut, GeocoderServiceError) as e:
+        if address == ADDRESS_LOOKUP_FAILED:
             typing_with_pauses("   ⚠️ Address lookup failed (network issue)")
-            return "Address lookup failed"
-        except Exception as e:
-            return "Address lookup error"
+        elif address != ADDRESS_LOOKUP_ERROR:
+            dramatic_pause(1)
+        return address
 
     def generate_single_map(self, lat, lon, info, filename="location_map.html"):
         """Generate interactive map for single location"""
+        import folium
+
         map_obj = folium.Map(location=[lat, lon], zoom_start=15)
 
         popup_html = f"""
@@ -211,6 +463,7 @@ class ExifExtractor:
             icon=folium.Icon(color='red', icon='camera', prefix='fa')
         ).add_to(map_obj)
 
+        ensure_data_folders()
         filename = str(MAPS_DIR / filename)
         map_obj.save(filename)
         return filename
@@ -220,6 +473,9 @@ class ExifExtractor:
         if not locations:
             return None
 
+        import folium
+        from folium.plugins import MarkerCluster
+
         # Calculate center point
         avg_lat = sum(loc['latitude'] for loc in locations) / len(locations)
         avg_lon = sum(loc['longitude'] for loc in locations) / len(locations)
@@ -255,6 +511,7 @@ class ExifExtractor:
                 icon=folium.Icon(color=color, icon='camera', prefix='fa')
             ).add_to(marker_cluster)
 
+        ensure_data_folders()
         filename = str(MAPS_DIR / filename)
         map_obj.save(filename)
         return filename
@@ -386,7 +643,7 @@ class ExifExtractor:
         if self.has_pyexiv2:
             exif = self.extract_exif_pyexiv2(image_path)
 
-        if not exif:
+        if exif is None:
             exif = self.extract_exif_pil(image_path)
 
         if not exif:
@@ -479,7 +736,7 @@ class ExifExtractor:
 
         return info
 
-    def process_folder(self, folder_path):
+    def process_folder(self, folder_path, jobs=None, geocode_rate=NOMINATIM_RATE):
         """Process all images in a folder"""
         print("\n" + "="*LINE_LENGTH)
         typing_with_pauses("📁 BATCH PROCESSING MODE ACTIVATED")
@@ -507,19 +764,22 @@ class ExifExtractor:
             typing_with_pauses("\n👋 Cancelled. Takot ka na ba? 😏")
             return
 
-        # Process images
-        locations_with_gps = []
+        # Process images, all at once across the CPU cores, looking up
+        # addresses in the background as the GPS coordinates come in
         total = len(image_files)
-
-        for i, image_path in enumerate(image_files, 1):
-            typing_with_pauses(f"\nProgress: [{i}/{total}]")
-            result = self.process_single_image(image_path)
-
-            if result and 'latitude' in result:
-                locations_with_gps.append(result)
-                self.results.append(result)
-
-            dramatic_pause(0.5)
+        typewriter_effect(f"\n🔬 Extracting EXIF data using {jobs or os.cpu_count() or 1} worker(s)...")
+        with GeocodeQueue(self.geocoder, self.geocode_cache, rate=geocode_rate) as geocoding:
+            records = self.extract_batch(image_files, jobs=jobs, progress=show_progress,
+                                         on_records=geocoding.submit_all)
+            print()
+
+            locations_with_gps = [record for record in records if 'latitude' in record]
+            if geocoding.resolved < geocoding.submitted:
+                typewriter_effect(f"\n🌐 Looking up {geocoding.submitted - geocoding.resolved} more address(es)...")
+                geocoding.join(progress=show_progress)
+                print()
+        self.results.extend(locations_with_gps)
+        dramatic_pause(1)
 
         # Generate summary
         self.generate_batch_summary(total, locations_with_gps)
@@ -558,14 +818,14 @@ class ExifExtractor:
         dramatic_pause(1)
 
         # Group by location (simplified)
-        unique_locations = len(set((loc['address'] for loc in locations_with_gps)))
+        unique_locations = len(set(loc.get('address', ADDRESS_LOOKUP_ERROR) for loc in locations_with_gps))
         typing_with_pauses(f"   Unique locations: {unique_locations}")
 
         # Show top locations
         if with_gps <= 10:
             typewriter_effect("\n📌 Locations found:")
             for i, loc in enumerate(locations_with_gps, 1):
-                typing_with_pauses(f"   {i}. {loc['address']}")
+                typing_with_pauses(f"   {i}. {loc.get('address', ADDRESS_LOOKUP_ERROR)}")
                 typing_with_pauses(f"      📅 {loc['date']} @ {loc['time']}")
                 dramatic_pause(0.5)
 
@@ -626,8 +886,81 @@ class ExifExtractor:
         dramatic_pause(2)
 
 
+_worker_extractor = None
+
+
+def extract_chunk(image_paths):
+    """Extract metadata from a chunk of images, runs in a worker process."""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = ExifExtractor()
+    return [_worker_extractor.extract_metadata(image_path) for image_path in image_paths]
+
+
+def show_progress(done, total):
+    """Progress counter that updates in place."""
+    print(f"\r   Progress: [{done}/{total}]", end="", flush=True)
+
+
+def extract_folder(folder_path, output_file=None, jobs=None, geocode=False, geocode_rate=NOMINATIM_RATE):
+    """
+    Extract every image in a folder, writing one JSON record per line in folder order.
+
+    With `geocode`, records with GPS data also get their address, looked up
+    while the extraction is still running.
+    """
+    extractor = ExifExtractor()
+    image_files = []
+    for root, dirs, files in os.walk(folder_path):
+        dirs.sort()
+        image_files.extend(os.path.join(root, file) for file in sorted(files) if extractor.is_image_file(file))
+
+    def stderr_progress(done, total):
+        print(f"\r[{done}/{total}]", end="", flush=True, file=sys.stderr)
+
+    if geocode:
+        with GeocodeQueue(extractor.geocoder, extractor.geocode_cache, rate=geocode_rate) as geocoding:
+            records = extractor.extract_batch(image_files, jobs=jobs, progress=stderr_progress,
+                                              on_records=geocoding.submit_all)
+            print(file=sys.stderr)
+            geocoding.join(progress=lambda done, total: print(
+                f"\r[{done}/{total}] addresses", end="", flush=True, file=sys.stderr))
+    else:
+        records = extractor.extract_batch(image_files, jobs=jobs, progress=stderr_progress)
+
+    output = open(output_file, "w", encoding="utf-8") if output_file else sys.stdout
+    try:
+        for record in records:
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+    finally:
+        if output_file:
+            output.close()
+    with_gps = sum('latitude' in record for record in records)
+    print(f"\n✅ {len(records)} image(s), {with_gps} with GPS data", file=sys.stderr)
+
+
+def parse_args(argv):
+    """Parse the batch mode options."""
+    parser = argparse.ArgumentParser(prog="content exif_extractor", description="Extract EXIF and GPS data from photos.")
+    parser.add_argument("-d", "--folder", help="Extract every image in this folder without prompts, prints JSON lines.")
+    parser.add_argument("-o", "--output", help="Write the JSON lines to this file instead of stdout.")
+    parser.add_argument("-j", "--jobs", type=int, help="Worker processes for folders (default: all cores).")
+    parser.add_argument("-g", "--geocode", action="store_true", help="Also look up the address of photos with GPS data.")
+    parser.add_argument("--geocode-rate", type=float, default=NOMINATIM_RATE,
+                        help=f"Address lookups per second (default: {NOMINATIM_RATE:g}, Nominatim's limit).")
+    args = parser.parse_args(argv)
+    if args.geocode_rate <= 0:
+        parser.error("--geocode-rate must be greater than zero.")
+    return args
+
+
 def main():
     """Main entry point"""
+    args = parse_args(sys.argv[1:])
+    if args.folder:
+        extract_folder(args.folder, args.output, args.jobs, args.geocode, args.geocode_rate)
+        return
+
     extractor = ExifExtractor()
 
     # Show intro
@@ -668,7 +1001,7 @@ def main():
             typing_with_pauses("\n❌ Not a valid folder!")
             return
 
-        extractor.process_folder(folder_path)
+        extractor.process_folder(folder_path, jobs=args.jobs, geocode_rate=args.geocode_rate)
 
     else:
         typing_with_pauses("\n❌ Invalid choice!")
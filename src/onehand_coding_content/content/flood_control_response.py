@@ -1,6 +1,6 @@
-import time
 from datetime import date
 
+from .. import clock
 from ..sounds import play_with_wait, NO_PROMISES, DELAY
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
 
@@ -23,11 +23,11 @@ class IndependentCommission:
         typing_with_pauses("   ⚠️  Appointed by: President Marcos")
         typing_with_pauses("   ⚠️  Investigating: Same administration")
         typing_with_pauses("   ⚠️  Marcos cousin implicated: Yes")
-        time.sleep(1.5)
+        clock.sleep(1.5)
 
         typing_with_pauses("\n   ❌ Independence Score: QUESTIONABLE")
         print()
-        time.sleep(1)
+        clock.sleep(1)
 
     def check_transparency(self):
         typewriter_effect("\n👁️  Checking Transparency...")
@@ -42,11 +42,11 @@ class IndependentCommission:
         typing_with_pauses("   ❌ Livestream: Not allowed")
         typing_with_pauses("   ❌ Public Monitoring: Blocked")
         print("="*60)
-        time.sleep(2)
+        clock.sleep(2)
 
         # Public sentiment with typewriter
         typing_with_pauses("\n📢 Public Sentiment:")
-        time.sleep(0.5)
+        clock.sleep(0.5)
 
         sentiments = [
             ("Justice Carpio", "People will lose faith in the ICI"),
@@ -59,7 +59,7 @@ class IndependentCommission:
 
         for person, quote in sentiments:
             typing_with_pauses(f"   • {person}: '{quote}'")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         dramatic_pause(2)
 
@@ -68,12 +68,12 @@ class IndependentCommission:
             "\n   🤔 ICI's Response: 'Ayaw namin ng trial by publicity'",
 
         )
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses(
             "   💭 Translation: 'Ayaw namin ng accountability' 🙃\n",
 
         )
-        time.sleep(1.5)
+        clock.sleep(1.5)
 
     def check_effectiveness(self):
         typewriter_effect("\n⚖️  Effectiveness Report:")
@@ -89,19 +89,19 @@ class IndependentCommission:
 
         for metric, value, status in metrics:
             typing_with_pauses(f"   • {metric}: {value} {status}")
-            time.sleep(0.5)
-        time.sleep(2)
+            clock.sleep(0.5)
+        clock.sleep(2)
 
         # Translation with typewriter effect
         typing_with_pauses("\n💬 Translation:")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(
             "   'Pwede kaming magtanong pero, kung ayaw sumagot, wala kaming magagawa.'"
         )
         typing_with_pauses(
             "   'Ah, at di nyo makikita yung hearing.' 🙈\n"
         )
-        time.sleep(2)
+        clock.sleep(2)
 
         return "WALANG NGIPIN, WALANG TRANSPARENCY 🦷❌👁️❌"
 
@@ -123,7 +123,7 @@ class IndependentCommission:
 
         for step, desc, status in playbook:
             typing_with_pauses(f"   {step}: {desc} {status}")
-            time.sleep(0.7)
+            clock.sleep(0.7)
 
         dramatic_pause(2)
 
@@ -135,7 +135,7 @@ class IndependentCommission:
         typing_with_pauses("   📈 Probability ng 'nalimutan na': 99.99%")
         typing_with_pauses("   📈 Probability na closed door pa rin: 100%")
         print("="*60)
-        time.sleep(2)
+        clock.sleep(2)
 
 
 def main():
@@ -148,14 +148,14 @@ def main():
 
     commission = IndependentCommission()
 
-    time.sleep(1)
+    clock.sleep(1)
 
     # Run checks
     commission.check_independence()
-    time.sleep(1)
+    clock.sleep(1)
 
     commission.check_transparency()  # The transparency issue
-    time.sleep(1)
+    clock.sleep(1)
 
     verdict = commission.check_effectiveness()
 
@@ -1,5 +1,5 @@
-import time
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, CORRUPTION_3
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -32,9 +32,9 @@ class FloodControlRealityCheck:
         dramatic_pause(1)
 
         typing_with_pauses(f"💰 Total Spent on Flood Control: ₱{self.budget_spent:,.2f}")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses(f"🏗️  Projects Claimed Built: {self.projects_built}")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("📍 Priority Area: Bulacan (most projects)")
         dramatic_pause(2)
 
@@ -48,11 +48,11 @@ class FloodControlRealityCheck:
         typing_with_pauses("\n📉 Actual Outcome (2025):")
         dramatic_pause(1)
         typing_with_pauses(f"   ❌ July 2025 Floods: {self.recent_casualties} deaths")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses(f"   ❌ People Affected: {self.affected_people:,}+")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   ❌ Bulacan Status: STILL FLOODING (despite most projects)")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   ❌ Projects Status: Overpriced, unfinished, mismatched")
         dramatic_pause(2)
 
@@ -92,9 +92,9 @@ class FloodControlRealityCheck:
 
         typing_with_pauses("\n📋 Infrastructure Status Check:")
         for infrastructure, status in issues:
-            time.sleep(1)
+            clock.sleep(1)
             typing_with_pauses(f"   • {infrastructure}: ", end_with_newline=False)
-            time.sleep(0.5)
+            clock.sleep(0.5)
             typing_with_pauses(status)
 
         dramatic_pause(2)
@@ -107,15 +107,15 @@ class FloodControlRealityCheck:
         dramatic_pause(2)
 
         typing_with_pauses("\n📱 Meanwhile in reality:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   🏊 EDSA: Closed. Swimming pool na.")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   🚗 NLEX: Parking lot ng baha")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   🏠 Bulacan: Residents on rooftops (again)")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   📸 Social Media: #WalangPasok trending")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   😤 Citizens: 'San yung ₱500B?!'")
         dramatic_pause(2)
 
@@ -159,9 +159,9 @@ class FloodControlRealityCheck:
 
         for finding in findings:
             typing_with_pauses(f"\n⚠️  {finding['issue']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   📌 Finding: {finding['details']}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses(f"   💬 Official Response: {finding['response']}")
             dramatic_pause(1.5)
 
@@ -179,29 +179,29 @@ class FloodControlRealityCheck:
 
         typing_with_pauses("\n📊 DIRECT COSTS:")
         typing_with_pauses("   • Flood control budget (2022-2025): ₱500B+")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Estimated ghost projects: ₱118B")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Cost overruns & corruption: ₱200B+ (estimated)")
         dramatic_pause(2)
 
         typing_with_pauses("\n📉 CONSEQUENCE COSTS:")
         typing_with_pauses("   • Stock market: -1.5% (7-day drop, 5-month low)")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Philippine peso: Weakened significantly")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • South Korea loan: $503M SUSPENDED")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Predicted losses (2022-2050): $124B from floods")
         dramatic_pause(2)
 
         typing_with_pauses("\n😔 HUMAN COSTS (July 2025 alone):")
         typing_with_pauses(f"   • Deaths: {self.recent_casualties}")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Affected: 8M+ people")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Displaced: Thousands")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   • Homes damaged: Thousands")
         dramatic_pause(2)
 
@@ -236,7 +236,7 @@ class FloodControlRealityCheck:
 
         for solution in expert_solutions:
             typing_with_pauses(f"   • {solution}")
-            time.sleep(1)
+            clock.sleep(1)
 
         dramatic_pause(2)
         typing_with_pauses("\n🤷 Government Response to Expert Recommendations:")
@@ -277,28 +277,28 @@ class FloodControlRealityCheck:
         dramatic_pause(2)
 
         typing_with_pauses("\n🎭 THE PATTERN:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   1. Announce mega flood control project")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   2. Award to 'preferred' contractors")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   3. Overpriced, substandard, or ghost")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   4. Floods happen anyway")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   5. Announce NEW mega project")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   6. Repeat cycle")
         dramatic_pause(3)
 
         typing_with_pauses("\n💬 VOICES:")
         dramatic_pause(1)
         typing_with_pauses("   Advocates: 'Flood control projects fail the poor'")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   Economists: 'Systemic corruption in infrastructure'")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   Citizens: 'San napunta yung pera?!'")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   Officials: 'We are investigating...' (always)")
         dramatic_pause(3)
 
@@ -1,6 +1,6 @@
-import time
 import random
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, DELAY
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -21,7 +21,7 @@ class OmbudsmanOffice:
         # Special handling for DPWH + Senator cases
         if "senator" in case_name.lower() or "dpwh" in case_name.lower():
             typing_with_pauses("⚠️  WARNING: VIP detected! Switching to delicate mode...")
-            time.sleep(3)  # Extra time for "careful" handling
+            clock.sleep(3)  # Extra time for "careful" handling
 
             vip_outcomes = [
                 "Transferred to regular court (downgraded)",
@@ -32,7 +32,7 @@ class OmbudsmanOffice:
             result = random.choice(vip_outcomes)
         else:
             # Simulate "thorough" investigation
-            time.sleep(2)  # Emphasis on how slow it is
+            clock.sleep(2)  # Emphasis on how slow it is
 
             investigation_outcomes = [
                 "Case forwarded to Sandiganbayan",
@@ -76,7 +76,7 @@ class PhilippineJudiciary:
 
         for i, process in enumerate(processes):
             typing_with_pauses(f"📅 Year {i+1}: {process}")
-            time.sleep(1)  # Each year passes slowly
+            clock.sleep(1)  # Each year passes slowly
 
         typing_with_pauses(f"⏰ Expected resolution: {self.average_case_duration}")
         typing_with_pauses("🎭 Plot twist: Key witness suddenly has amnesia")
@@ -111,7 +111,7 @@ def main():
     for case in major_cases:
         result = ombudsman.investigate_corruption(case)
         typing_with_pauses(f"Remaining confidential funds: ₱{ombudsman.confidential_funds:,}\n")
-        time.sleep(1)
+        clock.sleep(1)
 
     print("\n" + "="*LINE_LENGTH)
     typing_with_pauses("JUDICIARY PROCESS PHASE")
@@ -133,7 +133,7 @@ def main():
     typing_with_pauses(f"⏱️  Average justice delivery time: Still counting...")
     typing_with_pauses(f"🏆 Corruption level: Unchanged")
 
-    time.sleep(2)  # Let the irony sink in
+    clock.sleep(2)  # Let the irony sink in
 
     typing_with_pauses("\n💡 SYSTEM ERROR: Justice.exe has stopped working")
     typing_with_pauses("🔄 Please restart democracy and try again")
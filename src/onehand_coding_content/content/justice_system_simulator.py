@@ -11,9 +11,9 @@ Same script. Different actors. Same ending?
 This is not a bug. This is a FEATURE.
 """
 
-import time
 from datetime import datetime
 
+from .. import clock
 from ..sounds import play_with_wait, CORRUPTION_3, CORRUPTION_2
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
 
@@ -72,38 +72,38 @@ class JusticeSystemSimulator:
 
         typing_with_pauses("\n🏛️  PORK BARREL SCAM (2013)")
         print("-"*70)
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   💰 Amount Stolen: ₱{self.napoles_scandal['amount_stolen']:,.2f}")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   📅 Years Since Exposed: {self.napoles_scandal['years_elapsed']} years")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   👨‍⚖️ Big Fish Convicted: {self.napoles_scandal['big_fish_jailed']}")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses("   ✅ Napoles Convicted: Yes (in OTHER cases)")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   ❌ Acquitted TODAY: {', '.join(self.napoles_scandal['masterminds_acquitted_today'])}")
         dramatic_pause(2)
 
         typing_with_pauses("\n\n🌊 FLOOD CONTROL SCAM (2025)")
         print("-"*70)
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   💰 Amount Stolen: ₱{self.flood_scandal['amount_stolen']:,.2f}")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   📅 Years Since Exposed: {self.flood_scandal['years_elapsed']} years")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   🚫 Ghost Projects Found: {self.flood_scandal['ghost_projects']} (so far)")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   🔒 Hearings Status: {self.flood_scandal['hearings']}")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   🎯 Senators Implicated: {self.flood_scandal['senators_implicated']}")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses(f"   👨‍⚖️ Big Fish Convicted: {self.flood_scandal['big_fish_jailed']}")
         dramatic_pause(2)
 
         # The shocking comparison
         typing_with_pauses("\n\n📈 MAGNITUDE COMPARISON:")
         print("-"*70)
-        time.sleep(1)
+        clock.sleep(1)
         multiplier = self.flood_scandal['amount_stolen'] / self.napoles_scandal['amount_stolen']
         typing_with_pauses(f"   Flood Control Scam is {multiplier:.1f}x BIGGER than Pork Barrel")
         dramatic_pause(2)
@@ -128,18 +128,18 @@ class JusticeSystemSimulator:
 
         for year, event, emoji in timeline:
             typing_with_pauses(f"\n   {emoji} {year}: {event}")
-            time.sleep(1.5)
+            clock.sleep(1.5)
 
         dramatic_pause(2)
 
         typing_with_pauses("\n   🔮 Reasons for acquittal:")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      • 'Prosecution failed to prove beyond reasonable doubt'")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      • 'Endorsement letters were merely recommendatory'")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      • 'No proof of kickbacks'")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      • 'Whistleblower testimony unreliable'")
         dramatic_pause(2)
 
@@ -175,23 +175,23 @@ class JusticeSystemSimulator:
             typing_with_pauses(f"\n   {status} {year}: {event}")
             if probability < 100:
                 typing_with_pauses(f"      Probability: {probability}%")
-            time.sleep(1.5)
+            clock.sleep(1.5)
 
         dramatic_pause(3)
 
         typing_with_pauses("\n\n   🎯 Expected Outcome:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      ₱118.5 BILLION stolen")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      421+ ghost projects")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      6 senators implicated")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      Result: ZERO big fish jailed")
         dramatic_pause(2)
 
         typing_with_pauses("\n   💬 'History doesn't repeat, but it rhymes.' - Mark Twain")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   🤡 'In PH, history copy-pastes.' - Citizens")
         dramatic_pause(2)
 
@@ -203,32 +203,32 @@ class JusticeSystemSimulator:
         dramatic_pause(2)
 
         typing_with_pauses("\n🚨 CRITICAL DIFFERENCE: CLOSED DOOR HEARINGS")
-        time.sleep(1)
+        clock.sleep(1)
 
         typing_with_pauses("\n   ❌ Independent Commission Investigation (2025):")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      • Hearings: CLOSED DOOR")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      • Public access: DENIED")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      • Media coverage: Press releases only")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      • Livestream: NOT ALLOWED")
         dramatic_pause(2)
 
         typing_with_pauses("\n   💬 What people are saying:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      Justice Carpio: 'People will lose faith in the ICI'")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      Sen. Pangilinan: 'Decision is ill-advised, open it!'")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      Agot Isidro: 'Taxpayers fund this, we should see it'")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      Netizens: 'Kung walang tinatago, bakit takot ipakita?'")
         dramatic_pause(2)
 
         typing_with_pauses("\n   🤔 ICI's Response: 'Ayaw namin ng trial by publicity'")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   💭 Translation: 'Ayaw namin ng accountability' 🙈")
         dramatic_pause(3)
 
@@ -262,7 +262,7 @@ class JusticeSystemSimulator:
             typing_with_pauses("   💡 Answer:")
             for line in answer.split('\n'):
                 typing_with_pauses(f"      {line}")
-                time.sleep(1)
+                clock.sleep(1)
             dramatic_pause(2)
 
     def the_code_speaks(self):
@@ -320,7 +320,7 @@ flood_control_result = philippine_justice_system("Flood Control")
 
         for line in code.split('\n'):
             typing_with_pauses(line)
-            time.sleep(0.3)
+            clock.sleep(0.3)
 
         dramatic_pause(3)
 
@@ -332,16 +332,16 @@ flood_control_result = philippine_justice_system("Flood Control")
         dramatic_pause(2)
 
         typing_with_pauses("\nOctober 24, 2025.")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("12 years after the Pork Barrel Scam was exposed.")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("Enrile, Napoles, Reyes: ACQUITTED.")
         dramatic_pause(2)
 
         typing_with_pauses("\nMeanwhile, ₱118.5 BILLION is missing.")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("421 ghost flood control projects.")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("And the hearings? CLOSED DOOR.")
         dramatic_pause(3)
 
@@ -349,20 +349,20 @@ flood_control_result = philippine_justice_system("Flood Control")
         dramatic_pause(2)
 
         typing_with_pauses("\n   ✊ What we demand:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("      1. PUBLIC hearings (livestreamed)")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      2. REAL accountability (jail time for big fish)")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      3. TRANSPARENT investigations")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      4. RECOVERED funds (return people's money)")
-        time.sleep(0.8)
+        clock.sleep(0.8)
         typing_with_pauses("      5. SYSTEMIC change (break the pattern)")
         dramatic_pause(3)
 
         typing_with_pauses("\n\n   💪 Our heroes fought for freedom.")
-        time.sleep(1.5)
+        clock.sleep(1.5)
         typing_with_pauses("   We fight for accountability.")
         dramatic_pause(2)
 
@@ -374,7 +374,7 @@ flood_control_result = philippine_justice_system("Flood Control")
         typing_with_pauses("ay hindi makararating sa paroroonan.'", delay=0.04)
         dramatic_pause(1)
         typing_with_pauses("\nWe've looked back. We see the pattern.", delay=0.04)
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("Now we change the destination.", delay=0.04)
         print("="*70)
         dramatic_pause(2)
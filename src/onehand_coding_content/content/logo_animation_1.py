@@ -1,7 +1,8 @@
 import turtle
 import math
 import random
-import time
+
+from .. import clock
 
 # --- Setup the screen ---
 screen = turtle.Screen()
@@ -193,7 +194,7 @@ class PowerSymbol:
 
                 # Update the screen with the new frame
                 screen.update()
-                time.sleep(0.03) # Control frame rate
+                clock.sleep(0.03) # Control frame rate
 
             except turtle.Terminator:
                 print("Animation window closed.")
@@ -1,7 +1,8 @@
 import turtle
 import math
 import random
-import time
+
+from .. import clock
 
 # Setup the screen
 screen = turtle.Screen()
@@ -328,7 +329,7 @@ class PowerSymbol:
                 screen.update()
 
                 # Control animation speed
-                time.sleep(0.05)
+                clock.sleep(0.05)
 
             except turtle.Terminator:
                 break
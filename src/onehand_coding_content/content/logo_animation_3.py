@@ -1,7 +1,8 @@
 import turtle
 import math
 import random
-import time
+
+from .. import clock
 
 # --- Setup the screen ---
 screen = turtle.Screen()
@@ -334,7 +335,7 @@ class PowerSymbol:
                 self.draw_power_button(pulse_factor, self.arc_progress)
 
                 screen.update()
-                time.sleep(0.03)
+                clock.sleep(0.03)
 
             except turtle.Terminator:
                 print("Animation window closed.")
@@ -1,21 +1,41 @@
 """
 Name Meaning Explorer
 A module that dynamically fetches and presents meanings for names using external APIs
+
+Batch mode: content name_meaning_explorer --file names.txt [--output results.jsonl] [--concurrency 8]
+Interactive options: --min-animation SECONDS
 """
 import os
-import time
+import sys
+import json
 import asyncio
+import argparse
 
+from .. import clock
 from ..config import LINE_LENGTH
-from ..name_meanings import NameMeaningProvider
+from ..name_meanings import NameMeaningProvider, API_SOURCE
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
 
+# Loading messages and how long each stays before the next one.
+LOADING_STEPS = [
+    ("\n🔄 Analyzing name: '{name}'", 1),
+    ("🌍 Fetching etymology data...", 1),
+    ("📚 Consulting name databases...", 1),
+    ("🔍 Processing meaning information...", 2),
+]
+
+# Once the loading animation shows up it stays at least this many seconds,
+# so quick lookups don't just flash it.
+MIN_ANIMATION_TIME = 1.0
+
 
 class NameMeaningExplorer:
     """Interactive name meaning exploration tool."""
 
-    def __init__(self):
+    def __init__(self, min_animation_time: float = MIN_ANIMATION_TIME):
         """Initialize the name meaning explorer."""
+        self.min_animation_time = min_animation_time
+        self._animation_started = None
         self.name_meaning_provider = NameMeaningProvider()
         print("\n" + "="*LINE_LENGTH)
         typewriter_effect("🔍 NAME MEANING EXPLORER")
@@ -25,74 +45,155 @@ class NameMeaningExplorer:
         dramatic_pause(1)
 
     async def analyze_name_concurrently(self, name: str):
-        """Analyze a name while showing animations."""
-        # Start the analysis task
-        analysis_task = asyncio.create_task(self.name_meaning_provider.analyze_name(name))
-        
-        # Run the animations
-        await self._show_loading_animations(name)
-        
-        # Wait for the analysis to complete
-        analysis_result = await analysis_task
-        
-        # Display the results
-        self._display_name_info(analysis_result.get('formatted_description', 'No information available.'))
+        """Analyze a name while showing animations, typing the answer as the LLM streams it."""
+        provider = self.name_meaning_provider
+        # The animation task only gets to run once the lookup has to wait,
+        # so cache hits are shown without it.
+        self._animation_started = None
+        animations = asyncio.create_task(self._show_loading_animations(name))
+        streamed = False
+        analysis_result = {}
+        try:
+            async for kind, value in provider.stream_name(name):
+                if kind == "result":
+                    analysis_result = value
+                    continue
+                line = provider.format_llm_field(*value)
+                if line is None:
+                    continue
+                if not streamed:
+                    # The first field is in, stop the animations and start typing.
+                    await self._stop_animations(animations)
+                    self._show_results_header()
+                    self._type_lines([f"🔍 NAME ANALYSIS: {provider.normalize_name(name)}"])
+                    streamed = True
+                self._type_lines(line.split('\n'))
+        except BaseException:
+            animations.cancel()
+            raise
+
+        if streamed and analysis_result.get('source') != API_SOURCE:
+            self._show_results_footer()
+            return
+
+        # Nothing was streamed (a cache hit or the API fallback), show the whole result at once.
+        await self._stop_animations(animations)
+        # The provider hands out the description already split into lines
+        self._display_name_info(analysis_result.get('description_lines', ['No information available.']))
 
     async def _show_loading_animations(self, name: str):
-        """Display loading animations."""
-        typing_with_pauses(f"\n🔄 Analyzing name: '{name}'")
-        await asyncio.sleep(1)
-        
-        typing_with_pauses("🌍 Fetching etymology data...")
-        await asyncio.sleep(1)
-        
-        typing_with_pauses("📚 Consulting name databases...")
-        await asyncio.sleep(1)
-        
-        typing_with_pauses("🔍 Processing meaning information...")
-        await asyncio.sleep(2)
-
-    def _display_name_info(self, description: str):
+        """Display loading animations until cancelled."""
+        self._animation_started = clock.now()
+        for message, pause in LOADING_STEPS:
+            typing_with_pauses(message.format(name=name))
+            await clock.async_sleep(pause)
+
+        # Out of messages, keep the last one up until the analysis is done.
+        await asyncio.get_running_loop().create_future()
+
+    async def _stop_animations(self, animations: asyncio.Task):
+        """Cancel the loading animations, once they've been up for the minimum time."""
+        if self._animation_started is not None:
+            remaining = self.min_animation_time - (clock.now() - self._animation_started)
+            if remaining > 0:
+                await clock.async_sleep(remaining)
+        animations.cancel()
+
+    def _display_name_info(self, lines: list):
         """Display name information using presentation effects."""
         
-        if description:
-            print("\n" + "="*LINE_LENGTH)
-            typewriter_effect("📊 NAME ANALYSIS RESULTS")
-            print("="*LINE_LENGTH, "\n")
-            
-            # Print the description with effect, line by line
-            lines = description.split('\n')
-            for line in lines:
-                if line.strip():
-                    typing_with_pauses(f"  {line.strip()}")
-                    time.sleep(0.5)
-
-            # Print line break based on terminal width.
-            print("\n" + "="*os.get_terminal_size().columns, "\n\n")
+        if lines:
+            self._show_results_header()
+            self._type_lines(lines)
+            self._show_results_footer()
         else:
             typewriter_effect("❌ No information found for this name.")
 
+    def _show_results_header(self):
+        print("\n" + "="*LINE_LENGTH)
+        typewriter_effect("📊 NAME ANALYSIS RESULTS")
+        print("="*LINE_LENGTH, "\n")
+
+    def _type_lines(self, lines: list):
+        """Print the description with effect, line by line."""
+        for line in lines:
+            if line.strip():
+                typing_with_pauses(f"  {line.strip()}")
+                clock.sleep(0.5)
+
+    def _show_results_footer(self):
+        # Print line break based on terminal width.
+        print("\n" + "="*os.get_terminal_size().columns, "\n\n")
+
+
+def read_names(names_file: str) -> list:
+    """Read one name per line, skipping blank lines and # comments."""
+    with open(names_file, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+async def analyze_file(names_file: str, output_file: str = None, concurrency: int = 8):
+    """Analyze every name in a file, writing one JSON result per line as they come in."""
+    names = read_names(names_file)
+
+    output = open(output_file, "w", encoding="utf-8") if output_file else sys.stdout
+    done = 0
+    try:
+        async with NameMeaningProvider(max_connections=max(concurrency, 1) * 3) as provider:
+            async for result in provider.analyze_names(names, concurrency=concurrency):
+                output.write(json.dumps(result, ensure_ascii=False) + "\n")
+                output.flush()
+                done += 1
+                if output_file:
+                    print(f"\r[{done}] {result.get('name', '')}", end="", flush=True, file=sys.stderr)
+    finally:
+        if output_file:
+            output.close()
+            print(f"\n✅ {done} name(s) written to {output_file}", file=sys.stderr)
+
+
+def parse_args(argv):
+    """Parse the batch mode options."""
+    parser = argparse.ArgumentParser(prog="content name_meaning_explorer", description="Analyze names interactively or in bulk.")
+    parser.add_argument("-f", "--file", help="Text file with one name per line, analyzes them all and prints JSON lines.")
+    parser.add_argument("-o", "--output", help="Write the JSON lines to this file instead of stdout.")
+    parser.add_argument("-n", "--concurrency", type=int, default=8, help="Names to look up at the same time (default: 8).")
+    parser.add_argument("--min-animation", type=float, default=MIN_ANIMATION_TIME, help=f"Shortest time the loading animation stays up, in seconds (default: {MIN_ANIMATION_TIME}).")
+    args = parser.parse_args(argv)
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1.")
+    return args
+
 
 async def main():
     """Main entry point for the name meaning explorer."""
-    explorer = NameMeaningExplorer()
+    args = parse_args(sys.argv[1:])
+    if args.file:
+        await analyze_file(args.file, args.output, args.concurrency)
+        return
+
+    explorer = NameMeaningExplorer(min_animation_time=args.min_animation)
 
     loop = asyncio.get_running_loop()
 
-    while True:
-        typewriter_effect("\n📋 Enter a name to analyze (or 'quit' to exit): ", end_with_newline=False)
+    try:
+        while True:
+            typewriter_effect("\n📋 Enter a name to analyze (or 'quit' to exit): ", end_with_newline=False)
         
-        # Get user input asynchronously
-        user_input = await loop.run_in_executor(None, lambda: input().strip().title())
-
-        if user_input.lower() in ['quit', 'exit', 'q']:
-            typewriter_effect("\n👋 Thank you for exploring name meanings!")
-            break
-
-        if user_input:
-            await explorer.analyze_name_concurrently(user_input)
-        else:
-            typewriter_effect("⚠️  Please enter a valid name.")
+            # Get user input asynchronously
+            user_input = await loop.run_in_executor(None, lambda: input().strip().title())
+
+            if user_input.lower() in ['quit', 'exit', 'q']:
+                typewriter_effect("\n👋 Thank you for exploring name meanings!")
+                break
+
+            if user_input:
+                await explorer.analyze_name_concurrently(user_input)
+            else:
+                typewriter_effect("⚠️  Please enter a valid name.")
+    finally:
+        # Close the pooled HTTP connections
+        await explorer.name_meaning_provider.aclose()
 
 
 # Usage
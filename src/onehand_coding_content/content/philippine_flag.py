@@ -4,10 +4,10 @@ Render the Philippine flag using colored asterisks in terminal
 With historical facts and political commentary
 """
 
-import time
 import math
 import sys
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, HERO
 from ..presentation import typing_with_pauses, typewriter_effect
@@ -166,14 +166,14 @@ def print_header():
     """Print engaging header"""
     print()
     print("=" * LINE_LENGTH)
-    time.sleep(0.3)
+    clock.sleep(0.3)
     typewriter_effect("RENDERING SOVEREIGNTY.EXE... ✓")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typewriter_effect("🇵🇭 Philippine Flag v1898.0 (Independence Patch)")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     typing_with_pauses("Status: Rendering freedom... please stand for the flag!")
     print("=" * LINE_LENGTH)
-    time.sleep(1)
+    clock.sleep(1)
     print("\n")
 
 
@@ -183,7 +183,7 @@ def print_historical_facts():
     print("=" * LINE_LENGTH)
     typewriter_effect("📜 FLAG.LOG (HISTORICAL DEBUG INFO)")
     print("=" * LINE_LENGTH)
-    time.sleep(0.5)
+    clock.sleep(0.5)
 
     facts = [
         "\n🏗️  SYSTEM SPECIFICATIONS:",
@@ -214,15 +214,15 @@ def print_historical_facts():
 
     for fact in facts:
         typing_with_pauses(fact)
-        time.sleep(0.2)
+        clock.sleep(0.2)
 
-    time.sleep(1)
+    clock.sleep(1)
 
     # The spicy part
     print("\n" + "=" * LINE_LENGTH)
     typewriter_effect("⚠️  CORRUPTION.LOG (SYSTEM WARNINGS)")
     print("=" * LINE_LENGTH)
-    time.sleep(0.8)
+    clock.sleep(0.8)
 
     corruption_facts = [
         "\n💔 HOW POLITICIANS SULLIED IT:",
@@ -262,15 +262,15 @@ def print_historical_facts():
 
     for fact in corruption_facts:
         typing_with_pauses(fact)
-        time.sleep(0.15)
+        clock.sleep(0.15)
 
-    time.sleep(1.5)
+    clock.sleep(1.5)
 
     # The brutal truth
     print("\n" + "=" * LINE_LENGTH)
     typewriter_effect("💭 RUNTIME ERROR: INTEGRITY_CHECK_FAILED")
     print("=" * LINE_LENGTH)
-    time.sleep(0.8)
+    clock.sleep(0.8)
 
     final_thoughts = [
         "",
@@ -297,9 +297,9 @@ def print_historical_facts():
 
     for thought in final_thoughts:
         typing_with_pauses(thought)
-        time.sleep(0.2)
+        clock.sleep(0.2)
 
-    time.sleep(1.5)
+    clock.sleep(1.5)
 
     # Footer
     print("\n" + "=" * LINE_LENGTH)
@@ -311,17 +311,17 @@ def print_historical_facts():
     typing_with_pauses("   • PRIORITY: Anti-Dynasty Law (pending since 1987)")
     print()
 
-    time.sleep(1)
+    clock.sleep(1)
 
     print("\n")
     typing_with_pauses("# while politicians.corrupt():")
-    time.sleep(0.3)
+    clock.sleep(0.3)
     typing_with_pauses("#     flag.meaning -= 1")
-    time.sleep(0.3)
+    clock.sleep(0.3)
     typing_with_pauses("#     people.disappointment += 1")
-    time.sleep(0.3)
+    clock.sleep(0.3)
     typing_with_pauses("#     # Loop continues until we break it ourselves")
-    time.sleep(1)
+    clock.sleep(1)
 
     print()
 
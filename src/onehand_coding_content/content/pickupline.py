@@ -1,7 +1,7 @@
-import time
 import sys
 import random
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, SABOG_SOUND
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -13,7 +13,7 @@ def miriam_political_wisdom():
     """
     # The question - slower for emphasis
     typing_with_pauses("\n📝 QUESTION:")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     print()
     typing_with_pauses("What is the difference between corruption in the U.S. and corruption in the Philippines?")
 
@@ -21,13 +21,13 @@ def miriam_political_wisdom():
 
     # The devastating answer
     typing_with_pauses("\n💡 ANSWER:")
-    time.sleep(1)
+    clock.sleep(1)
     typing_with_pauses("\nIn the U.S. they go to jail.")
-    time.sleep(2)  # Let it sink in
+    clock.sleep(2)  # Let it sink in
     typing_with_pauses("In the Philippines, they go to the U.S.!")
 
     # Final dramatic pause
-    time.sleep(2)
+    clock.sleep(2)
     typing_with_pauses("\n--- MIRIAM DEFENSOR SANTIAGO🔥\n")
 
 
@@ -36,7 +36,7 @@ def interactive_reveal():
     Interactive version where user presses enter to continue
     """
     typing_with_pauses("\n📝 QUESTION:")
-    time.sleep(0.5)
+    clock.sleep(0.5)
     print()
     typing_with_pauses("What is the difference between corruption in the U.S. and corruption in the Philippines?")
 
@@ -47,12 +47,12 @@ def interactive_reveal():
 
     # The devastating answer
     typing_with_pauses("\n💡 ANSWER:")
-    time.sleep(1)
+    clock.sleep(1)
     typing_with_pauses("\nIn the U.S. they go to jail.")
-    time.sleep(2)  # Let it sink in
+    clock.sleep(2)  # Let it sink in
     typing_with_pauses("In the Philippines, they go to the U.S.!")
 
-    time.sleep(2)
+    clock.sleep(2)
     typing_with_pauses("\n--- MIRIAM DEFENSOR SANTIAGO🔥\n")
 
 
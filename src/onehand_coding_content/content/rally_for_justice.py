@@ -1,6 +1,6 @@
-import time
 import random
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, REVOLUTION
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -35,26 +35,26 @@ class PinoyRally:
 
         # Verify na neutral tayo
         typing_with_pauses(f"Status: {self.check_politician_support()}")
-        time.sleep(1)
+        clock.sleep(1)
 
         typing_with_pauses("\n📢 OUR DEMANDS (hindi request, DEMANDS!):")
         for i, demand in enumerate(self.demands, 1):
             typing_with_pauses(f"{i}. {demand}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         typing_with_pauses("\n🎯 TARGET: Lahat ng may kapangyarihan")
-        time.sleep(1)
+        clock.sleep(1)
 
         # Random check kung sino man nakaupo
         current_official = random.choice(self.politicians)
         typing_with_pauses(f"\n⚖️ Whoever you are '{current_official}', deliver or resign!")
-        time.sleep(1.5)
+        clock.sleep(1.5)
 
         # The punchline
         typing_with_pauses("\n💡 REMINDER:")
         typing_with_pauses("   Our loyalty is to the COUNTRY,")
         typing_with_pauses("   not to any politician's bank account! 💸")
-        time.sleep(2)
+        clock.sleep(2)
 
         return "Rally successful! Now back to work... 💪"
 
@@ -71,7 +71,7 @@ def voice_out():
     typing_with_pauses("\n🔊 VOICES FROM THE PEOPLE:")
     for voice in voices:
         typing_with_pauses(f"   👥 {voice}")
-        time.sleep(1)
+        clock.sleep(1)
 
 def calculate_tax_efficiency():
     """Calculate kung saan napupunta ang tax ng mga manggagawa."""
@@ -85,13 +85,13 @@ def calculate_tax_efficiency():
 
     typing_with_pauses(f"\n💰 TAX BREAKDOWN CALCULATOR:")
     typing_with_pauses(f"   Actual Public Services: {actual_services}%")
-    time.sleep(1)
+    clock.sleep(1)
     typing_with_pauses(f"   Ghost Projects: {ghost_projects}%")
-    time.sleep(1)
+    clock.sleep(1)
     typing_with_pauses(f"   'Legitimate Expenses': {legitimate_expenses}%")
-    time.sleep(1)
+    clock.sleep(1)
     typing_with_pauses(f"   Nasa kung saan: {unknown_allocation}%")
-    time.sleep(2)
+    clock.sleep(2)
 
     if unknown_allocation > actual_services:
         typing_with_pauses("   ❌ EFFICIENCY: FAILED!")
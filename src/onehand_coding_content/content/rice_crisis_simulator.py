@@ -1,5 +1,5 @@
-import time
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_with_wait, CORRUPTION_2
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -36,14 +36,14 @@ class RiceCrisisSimulator:
 
         typing_with_pauses("\nJUAN'S PROFILE:")
         print("-"*LINE_LENGTH)
-        time.sleep(0.5)
+        clock.sleep(0.5)
 
         typing_with_pauses(f"   * Daily Income: P{self.farmer_income_daily}")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Job: Growing rice (the irony is thick)")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses(f"   * Family Size: {self.family_size} mouths to feed")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Hope Level: Fading")
         dramatic_pause(2)
 
@@ -55,16 +55,16 @@ class RiceCrisisSimulator:
         dramatic_pause(2)
 
         typing_with_pauses(f"\n2020 (Pre-Crisis): P{self.rice_price_2020}/kilo")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   Status: AFFORDABLE (kinda)")
-        time.sleep(1)
+        clock.sleep(1)
 
         typing_with_pauses(f"\n2025 (Now): P{self.rice_price_2025}/kilo")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   Status: YOUR SALARY BETTER INCREASED")
 
         price_increase = ((self.rice_price_2025 - self.rice_price_2020) / self.rice_price_2020) * 100
-        time.sleep(1)
+        clock.sleep(1)
 
         print("\n")
         typing_with_pauses(f"Price Increase: {price_increase:.1f}%")
@@ -86,15 +86,15 @@ class RiceCrisisSimulator:
         loss = ((kilos_2020 - kilos_2025) / kilos_2020) * 100
 
         typing_with_pauses("\nWith P500 daily income:")
-        time.sleep(1)
+        clock.sleep(1)
 
         typing_with_pauses(f"\n   2020: Juan could buy {kilos_2020:.2f} kilos/day")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses(f"   2025: Juan can buy {kilos_2025:.2f} kilos/day")
         dramatic_pause(2)
 
         typing_with_pauses(f"\nPURCHASING POWER LOSS: {loss:.1f}%")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   (His salary stayed the same. Rice decided to betray him.)")
         dramatic_pause(2)
 
@@ -113,15 +113,15 @@ class RiceCrisisSimulator:
         dramatic_pause(2)
 
         typing_with_pauses("\nCOST COMPARISON:")
-        time.sleep(1)
+        clock.sleep(1)
 
         typing_with_pauses(f"\n   2020: P{cost_2020:.2f}/day")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses("   Juan: OKAY nakakabili pa")
-        time.sleep(1)
+        clock.sleep(1)
 
         typing_with_pauses(f"\n   2025: P{cost_2025:.2f}/day")
-        time.sleep(0.5)
+        clock.sleep(0.5)
         typing_with_pauses("   Juan: KUMUSTA NA ANG BUHAY")
         dramatic_pause(2)
 
@@ -134,7 +134,7 @@ class RiceCrisisSimulator:
         dramatic_pause(2)
 
         typing_with_pauses("\nJuan: Paano ko kakainin ang pamilya?")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("Government: Have you tried eating spreadsheets?")
         dramatic_pause(2)
 
@@ -150,15 +150,15 @@ class RiceCrisisSimulator:
         dramatic_pause(1)
 
         typing_with_pauses("\nReality Check:")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Import tariff: 35% on rice")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Result: Higher prices for EVERYONE")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Who benefits: Monopoly importers")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Who suffers: Juan & family")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Local farmers: Also suffering (lower quality competition)")
         dramatic_pause(2)
 
@@ -199,9 +199,9 @@ class RiceCrisisSimulator:
 
         for i, solution in enumerate(solutions, 1):
             typing_with_pauses(f"\nSolution #{i}: {solution['claim']}")
-            time.sleep(1)
+            clock.sleep(1)
             typewriter_effect(f"   Status: {solution['status']}")
-            time.sleep(0.5)
+            clock.sleep(0.5)
             typing_with_pauses(f"   Reality: {solution['reality']}")
             dramatic_pause(1.5)
 
@@ -227,7 +227,7 @@ class RiceCrisisSimulator:
 
         for time_slot, event in events:
             typing_with_pauses(f"\n{time_slot}: {event}")
-            time.sleep(1)
+            clock.sleep(1)
 
         dramatic_pause(2)
 
@@ -246,13 +246,13 @@ class RiceCrisisSimulator:
 
         typing_with_pauses("\nTHE CONTRADICTION:")
         typing_with_pauses("   * Juan GROWS rice")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * But can NOT AFFORD to eat it")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Government protects farmers")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * By making rice unaffordable")
-        time.sleep(1)
+        clock.sleep(1)
         typing_with_pauses("   * Logic level: BROKEN")
         dramatic_pause(2)
 
@@ -1,6 +1,6 @@
-import time
 import random
 
+from .. import clock
 from ..config import LINE_LENGTH
 from ..sounds import play_sound, play_with_wait, NEVER_BACKDOWN, KEYPRESS_SOUND
 from ..presentation import typewriter_effect, typing_with_pauses, dramatic_pause
@@ -46,7 +46,7 @@ class TransparencyMeter:
 
         for step in steps:
             typing_with_pauses(f"   ⏳ {step}")
-            time.sleep(1.5)
+            clock.sleep(1.5)
 
         typing_with_pauses("\n✅ System initialized!")
         dramatic_pause(1)
@@ -73,7 +73,7 @@ class TransparencyMeter:
         print("\nProgress: [", end="")
         for i in range(20):
             print("░", end="", flush=True)
-            time.sleep(0.1)
+            clock.sleep(0.1)
         print("] 0%")
         play_sound(KEYPRESS_SOUND)
 
@@ -113,7 +113,7 @@ class TransparencyMeter:
             typing_with_pauses("🚫 Status: Information not available")
             excuse = random.choice(self.excuses_list)
             typing_with_pauses(f"📌 Reason: {excuse}")
-            time.sleep(1.5)
+            clock.sleep(1.5)
 
     def attempt_to_fix(self):
         """Try to fix the stuck meter (spoiler: it won't work)"""
@@ -141,7 +141,7 @@ class TransparencyMeter:
             print("   [", end="", flush=True)
             for i in range(10):
                 print("▓", end="", flush=True)
-                time.sleep(0.2)
+                clock.sleep(0.2)
             print("] Done")
 
             if success:
@@ -149,7 +149,7 @@ class TransparencyMeter:
             else:
                 typing_with_pauses("   ❌ Failed. Meter still at 0%")
 
-            time.sleep(0.8)
+            clock.sleep(0.8)
 
         typing_with_pauses("\n🤷 DIAGNOSIS:")
         dramatic_pause(1)
@@ -199,15 +199,15 @@ class TransparencyMeter:
 
         for request in requests:
             typing_with_pauses(f"\n📥 {request}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             typing_with_pauses("   Status: Pending")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             days_waiting = random.choice(satirical_waiting_days)
             typing_with_pauses(f"   Days waiting: {days_waiting}")
-            time.sleep(0.8)
+            clock.sleep(0.8)
             response = random.choice(satirical_responses)
             typing_with_pauses(f"   Expected response: {response}")
-            time.sleep(1.5)
+            clock.sleep(1.5)
 
         typing_with_pauses("\n💬 Auto-reply:")
         typing_with_pauses("   'Your request has been received and is being processed.'")
@@ -0,0 +1,276 @@
+"""Warm runner daemon, `content --serve`.
+
+The daemon keeps the interpreter, pygame mixer and decoded sounds loaded. The
+`content` CLI hands it a script over a Unix socket together with its own
+stdin/stdout/stderr file descriptors, so the script reads and writes the
+caller's terminal directly while starting in milliseconds.
+
+Scripts run with the caller's working directory and environment variables,
+not the daemon's, so e.g. `GEMINI_API_KEY=... content name_meaning_explorer`
+behaves the same with or without a daemon. `.env` values are loaded on top
+of the caller's environment without overriding it, like on a fresh start.
+The daemon's own environment is restored after each run.
+"""
+import os
+import sys
+import json
+import signal
+import socket
+import tempfile
+import threading
+import traceback
+from pathlib import Path
+from typing import List, Optional
+
+from .config import LINE_LENGTH
+
+
+def _runtime_dir() -> Path:
+    """Per-user directory for the socket, other users must not be able to plant one there."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir)
+    user = os.getuid() if hasattr(os, "getuid") else "user"
+    return Path(tempfile.gettempdir()) / f"onehand-content-{user}"
+
+
+SOCKET_FILE = _runtime_dir() / "onehand-content.sock"
+
+# Largest request message, requests are JSON objects carrying the caller's environment.
+MAX_MESSAGE_SIZE = 1024 * 1024
+
+# Bytes read at a time from the socket.
+RECV_SIZE = 64 * 1024
+
+INTERRUPT_MESSAGE = b"interrupt\n"
+
+
+def is_supported() -> bool:
+    """The daemon needs Unix sockets that can pass file descriptors."""
+    return hasattr(socket, "AF_UNIX") and hasattr(socket, "send_fds")
+
+
+def _owned_by_us(path: Path, private: bool = False) -> bool:
+    """Whether `path` belongs to this user, and with `private` isn't accessible to anyone else."""
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return st.st_uid == os.getuid() and not (private and st.st_mode & 0o077)
+
+
+def _read_line(conn: socket.socket) -> bytes:
+    """Read one newline terminated message, empty when the peer hung up."""
+    data = b""
+    while not data.endswith(b"\n"):
+        chunk = conn.recv(1)
+        if not chunk:
+            return b""
+        data += chunk
+    return data
+
+
+def _forward_interrupts(conn: socket.socket, running: threading.Event) -> None:
+    """Turn the client's Ctrl+C messages into KeyboardInterrupt in the running script."""
+    main_thread = threading.main_thread().ident
+    while running.is_set():
+        try:
+            message = _read_line(conn)
+        except OSError:
+            return
+        if not message:
+            return
+        # Once the script is done an interrupt would stop the daemon instead.
+        # A real signal, unlike interrupt_main(), also breaks a script blocked in input().
+        if message == INTERRUPT_MESSAGE and running.is_set():
+            signal.pthread_kill(main_thread, signal.SIGINT)
+
+
+def _use_environment(environment: dict) -> None:
+    """Replace this process' environment variables with the caller's."""
+    os.environ.clear()
+    os.environ.update(environment)
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return
+    # Same lookup as the modules loading it on import, existing variables win.
+    load_dotenv()
+
+
+def _run_request(request: dict) -> int:
+    """Run a script request in this process, returns its exit code."""
+    from .main import run_script, record_script, use_clock
+
+    script_name = request["script"]
+    use_clock(request.get("speed", 1.0))
+
+    # Forget the script module so its top-level code runs again like a fresh start.
+    sys.modules.pop(f"{__package__}.content.{Path(script_name).stem}", None)
+
+    args = request.get("args", [])
+    saved_environment = os.environ.copy()
+    if request.get("env") is not None:
+        _use_environment(request["env"])
+    try:
+        if request.get("record"):
+            record_script(script_name, request["record"], args)
+        else:
+            run_script(script_name, args)
+    except SystemExit as e:
+        return e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+    except KeyboardInterrupt:
+        print()
+        return 130
+    except Exception:
+        traceback.print_exc()
+        return 1
+    finally:
+        os.environ.clear()
+        os.environ.update(saved_environment)
+    return 0
+
+
+def _handle_client(conn: socket.socket) -> None:
+    """Serve one script run using the client's terminal as stdio."""
+    message, fds, _, _ = socket.recv_fds(conn, RECV_SIZE, 3)
+    if len(fds) != 3:
+        for fd in fds:
+            os.close(fd)
+        return
+    # Bigger requests arrive in more than one piece.
+    while not message.endswith(b"\n") and len(message) < MAX_MESSAGE_SIZE:
+        chunk = conn.recv(RECV_SIZE)
+        if not chunk:
+            break
+        message += chunk
+    request = json.loads(message)
+
+    # Point our stdio at the client's, keeping ours to restore afterwards.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved_fds = [os.dup(fd) for fd in (0, 1, 2)]
+    saved_cwd = os.getcwd()
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+
+    running = threading.Event()
+    running.set()
+    threading.Thread(target=_forward_interrupts, args=(conn, running), daemon=True).start()
+    try:
+        if request.get("cwd"):
+            os.chdir(request["cwd"])
+        exit_code = _run_request(request)
+    finally:
+        running.clear()
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for target, fd in enumerate(saved_fds):
+            os.dup2(fd, target)
+            os.close(fd)
+        os.chdir(saved_cwd)
+
+    conn.sendall(json.dumps({"exit": exit_code}).encode() + b"\n")
+
+
+def warm_up() -> None:
+    """Load everything scripts would otherwise pay for on start."""
+    from . import presentation  # noqa: F401
+    from .sounds import preload_sounds
+    from .main import get_script_manifest
+
+    get_script_manifest()
+    preload_sounds()
+
+
+def serve(socket_file: Path = SOCKET_FILE) -> None:
+    """Run the daemon until interrupted."""
+    if not is_supported():
+        print("The warm runner needs Unix sockets, it isn't supported on this platform.")
+        return
+
+    socket_dir = socket_file.parent
+    socket_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not _owned_by_us(socket_dir, private=True):
+        print(f"{socket_dir} isn't a private directory of yours, refusing to serve from it.")
+        return
+
+    if socket_file.exists():
+        client = _connect(socket_file)
+        if client is not None:
+            client.close()
+            print(f"A content daemon is already running on {socket_file}")
+            return
+        socket_file.unlink()
+
+    warm_up()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(socket_file))
+    os.chmod(socket_file, 0o600)
+    server.listen()
+
+    print("=" * LINE_LENGTH)
+    print(f"Content daemon ready on {socket_file}")
+    print("Run scripts with `content SCRIPT` as usual, Ctrl+C to stop.")
+    print("=" * LINE_LENGTH)
+
+    try:
+        while True:
+            conn, _ = server.accept()
+            with conn:
+                try:
+                    _handle_client(conn)
+                except (OSError, ValueError) as e:
+                    print(f"Request failed: {e}", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("\nStopping content daemon.")
+    finally:
+        server.close()
+        socket_file.unlink(missing_ok=True)
+
+
+def _connect(socket_file: Path) -> Optional[socket.socket]:
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.connect(str(socket_file))
+    except OSError:
+        client.close()
+        return None
+    return client
+
+
+def run_via_daemon(script_name: str, speed: float = 1.0, record: Optional[str] = None,
+                   args: Optional[List[str]] = None, socket_file: Path = SOCKET_FILE) -> Optional[int]:
+    """Hand a script to a running daemon, returns None if there's no daemon."""
+    if not is_supported() or not socket_file.exists():
+        return None
+    # Our terminal is handed to whoever listens there, so only talk to our own daemon.
+    if not _owned_by_us(socket_file) or not _owned_by_us(socket_file.parent, private=True):
+        return None
+    client = _connect(socket_file)
+    if client is None:
+        return None
+
+    request = {
+        "script": script_name,
+        "speed": speed,
+        "record": os.path.abspath(record) if record else None,
+        "args": args or [],
+        "cwd": os.getcwd(),
+        "env": dict(os.environ),
+    }
+    sys.stdout.flush()
+    with client:
+        socket.send_fds(client, [json.dumps(request).encode() + b"\n"], [0, 1, 2])
+        while True:
+            try:
+                reply = _read_line(client)
+                break
+            except KeyboardInterrupt:
+                client.sendall(INTERRUPT_MESSAGE)
+
+    if not reply:
+        return 1
+    return json.loads(reply).get("exit", 0)
@@ -1,82 +1,463 @@
-"""Module for handling the SQLite database connection and caching."""
+"""Module for handling the SQLite database connection and caching.
+
+Name lookups go through a small in-process LRU first, then the `names`
+table. Entries expire after `CACHE_TTL` seconds and the table is pruned
+back to `MAX_CACHED_NAMES`, dropping the least recently used names.
+
+The rendered description of a name is stored next to its data together
+with the version of the formatter that made it, and comes back both whole
+and split into lines when the caller asks for that version.
+"""
+import os
+import time
 import sqlite3
 import json
 import logging
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, Iterator, Iterable
 from pathlib import Path
 
 # Define the database path relative to the project's data directory
 DB_FILE = Path(__file__).parent.parent.parent / "data" / "name_cache.db"
-DB_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-def get_db_connection():
-    """Establishes a connection to the SQLite database."""
-    conn = sqlite3.connect(DB_FILE)
+# Seconds to wait for another process holding the write lock.
+BUSY_TIMEOUT = 10
+
+# WAL lets readers and a writer work at the same time, and with it
+# synchronous=NORMAL only fsyncs at checkpoints instead of every commit.
+PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 64 * 1024 * 1024,
+    "cache_size": -16 * 1024,  # Negative means KiB, so 16 MiB.
+    "temp_store": "MEMORY",
+}
+
+# Names per bulk SELECT, older SQLite builds allow at most 999 parameters.
+BULK_LOOKUP_SIZE = 500
+
+# Seconds a cached analysis stays valid, None keeps it forever.
+CACHE_TTL = 90 * 24 * 60 * 60
+
+# Rows kept in the `names` table, the least recently used go first.
+MAX_CACHED_NAMES = 50_000
+
+# Prune the table after this many writes.
+PRUNE_INTERVAL = 500
+
+# Parsed entries kept in memory in front of SQLite.
+MEMORY_CACHE_SIZE = 1024
+
+# Keys of the rendered description in the data dictionaries, stored in their own column.
+DESCRIPTION_KEY = "formatted_description"
+LINES_KEY = "description_lines"
+
+# Each thread reuses its own connection, sqlite3 connections can't be shared between threads.
+_local = threading.local()
+_setup_lock = threading.Lock()
+_database_ready = False
+
+# name -> (data, expires_at, description_version), most recently used last. Shared by all threads.
+_memory_cache: "OrderedDict[str, tuple]" = OrderedDict()
+_memory_lock = threading.Lock()
+_stats = {"memory_hits": 0, "database_hits": 0, "misses": 0}
+
+# Access times of names read from either tier, saved to the table with the next
+# write so reads never need the write lock.
+_touched: Dict[str, float] = {}
+_writes_since_prune = 0
+
+
+def _open_connection() -> sqlite3.Connection:
+    """Open a new connection with our pragmas applied."""
+    DB_FILE.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(DB_FILE, timeout=BUSY_TIMEOUT)
     conn.row_factory = sqlite3.Row
+    for pragma, value in PRAGMAS.items():
+        conn.execute(f"PRAGMA {pragma} = {value}")
     return conn
 
-def setup_database():
-    """Sets up the database table if it doesn't exist."""
+
+def get_db_connection() -> sqlite3.Connection:
+    """Returns this thread's connection to the SQLite database, opening it on first use."""
+    global _database_ready
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _open_connection()
+        _local.conn = conn
+        _local.batch_depth = 0
+
+    if not _database_ready:
+        with _setup_lock:
+            if not _database_ready:
+                _create_tables(conn)
+                _database_ready = True
+    return conn
+
+
+def close_db_connection():
+    """Close this thread's connection, a new one is opened on the next call."""
+    conn = getattr(_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
+
+@contextmanager
+def transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Group writes into a single transaction, committed when the block exits.
+
+    Writes made with `cache_name` inside the block are committed together,
+    blocks can be nested and only the outermost one commits.
+    """
     conn = get_db_connection()
+    _local.batch_depth += 1
+    try:
+        yield conn
+    except BaseException:
+        _local.batch_depth -= 1
+        if _local.batch_depth == 0:
+            conn.rollback()
+        raise
+    else:
+        _local.batch_depth -= 1
+        if _local.batch_depth == 0:
+            conn.commit()
+
+
+def _commit(conn: sqlite3.Connection):
+    """Commit unless we're inside a `transaction()` block."""
+    if not getattr(_local, "batch_depth", 0):
+        conn.commit()
+
+
+def _create_tables(conn: sqlite3.Connection):
     try:
         conn.execute("""
             CREATE TABLE IF NOT EXISTS names (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 name TEXT NOT NULL UNIQUE,
                 data TEXT NOT NULL,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
+                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                expires_at REAL,
+                last_access REAL,
+                source TEXT,
+                description TEXT,
+                description_version INTEGER
             )
         """)
+        # Databases made by older versions lack the newer columns.
+        columns = {row['name'] for row in conn.execute("PRAGMA table_info(names)")}
+        for column, column_type in (("expires_at", "REAL"), ("last_access", "REAL"), ("source", "TEXT"),
+                                    ("description", "TEXT"), ("description_version", "INTEGER")):
+            if column not in columns:
+                conn.execute(f"ALTER TABLE names ADD COLUMN {column} {column_type}")
+        if "expires_at" not in columns and CACHE_TTL is not None:
+            conn.execute("UPDATE names SET expires_at = ?", (time.time() + CACHE_TTL,))
+        conn.execute("CREATE INDEX IF NOT EXISTS names_last_access ON names (last_access)")
         conn.commit()
         logging.info("Database table 'names' is set up.")
     except sqlite3.Error as e:
         logging.error(f"Database setup failed: {e}")
-    finally:
-        conn.close()
 
-def get_cached_name(name: str) -> Optional[Dict[str, Any]]:
+
+def setup_database():
+    """Sets up the database table if it doesn't exist."""
+    _create_tables(get_db_connection())
+
+
+def _expires_at(ttl: Optional[float], now: float) -> Optional[float]:
+    return None if ttl is None else now + ttl
+
+
+def _with_description(data: Dict[str, Any], description: Optional[str]) -> Dict[str, Any]:
+    """Add a rendered description, whole and split into lines, to the data."""
+    if description is not None:
+        data[DESCRIPTION_KEY] = description
+        data[LINES_KEY] = description.split("\n")
+    return data
+
+
+def _row_data(row: sqlite3.Row) -> Dict[str, Any]:
+    return _with_description(json.loads(row['data']), row['description'])
+
+
+def _remember(name: str, data: Dict[str, Any], expires_at: Optional[float], description_version: Optional[int]):
+    """Put an entry in the in-memory tier, evicting the least recently used."""
+    with _memory_lock:
+        _memory_cache[name] = (data, expires_at, description_version)
+        _memory_cache.move_to_end(name)
+        while len(_memory_cache) > MEMORY_CACHE_SIZE:
+            _memory_cache.popitem(last=False)
+
+
+def _for_version(data: Dict[str, Any], stored_version: Optional[int], description_version: Optional[int]) -> Dict[str, Any]:
+    """A copy of the data callers can change, without the description if it's the wrong version."""
+    data = dict(data)
+    if description_version is None or stored_version != description_version:
+        data.pop(DESCRIPTION_KEY, None)
+        data.pop(LINES_KEY, None)
+    return data
+
+
+def _from_memory(name: str, now: float, description_version: Optional[int]) -> Optional[Dict[str, Any]]:
+    """Look a name up in the in-memory tier."""
+    with _memory_lock:
+        entry = _memory_cache.get(name)
+        if entry is None:
+            return None
+        data, expires_at, stored_version = entry
+        if expires_at is not None and expires_at <= now:
+            del _memory_cache[name]
+            return None
+        _memory_cache.move_to_end(name)
+        _touched[name] = now
+        _stats["memory_hits"] += 1
+    return _for_version(data, stored_version, description_version)
+
+
+def clear_memory_cache():
+    """Forget the in-memory tier, the database is left alone."""
+    with _memory_lock:
+        _memory_cache.clear()
+
+
+def _touch(names: Iterable[str], now: float):
+    """Note names read from the database, their access times are saved with the next write."""
+    with _memory_lock:
+        for name in names:
+            _touched[name] = now
+
+
+def _save_access_times(conn: sqlite3.Connection):
+    """Write the access times of names read since the last write to the table."""
+    with _memory_lock:
+        touched = list(_touched.items())
+        _touched.clear()
+    if touched:
+        conn.executemany("UPDATE names SET last_access = ? WHERE name = ?",
+                         [(accessed, name) for name, accessed in touched])
+
+
+def get_cached_name(name: str, description_version: Optional[int] = None) -> Optional[Dict[str, Any]]:
     """
     Retrieves cached data for a given name.
 
     Args:
         name: The name to look up in the cache.
+        description_version: Formatter version the caller renders descriptions with,
+            a stored description of that version is included in the data.
 
     Returns:
-        The cached data as a dictionary, or None if not found.
+        The cached data as a dictionary, or None if not found or expired.
     """
-    conn = get_db_connection()
+    now = time.time()
+    data = _from_memory(name, now, description_version)
+    if data is not None:
+        return data
+
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT data FROM names WHERE name = ?", (name,))
-        row = cursor.fetchone()
-        if row:
-            logging.info(f"Found cached data for '{name}'.")
-            return json.loads(row['data'])
-        return None
-    finally:
-        conn.close()
+        row = get_db_connection().execute(
+            "SELECT data, expires_at, description, description_version FROM names"
+            " WHERE name = ? AND (expires_at IS NULL OR expires_at > ?)",
+            (name, now)
+        ).fetchone()
+    except sqlite3.Error as e:
+        logging.error(f"Failed to read '{name}' from the cache: {e}")
+        row = None
+    if row:
+        logging.info(f"Found cached data for '{name}'.")
+        data = _row_data(row)
+        _remember(name, data, row['expires_at'], row['description_version'])
+        _touch([name], now)
+        _stats["database_hits"] += 1
+        return _for_version(data, row['description_version'], description_version)
+    _stats["misses"] += 1
+    return None
+
+
+def get_cached_names(names: Iterable[str], description_version: Optional[int] = None) -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieves cached data for many names at once.
 
-def cache_name(name: str, data: Dict[str, Any]):
+    Args:
+        names: The names to look up in the cache.
+        description_version: As for `get_cached_name`.
+
+    Returns:
+        A dictionary of name to cached data, names not in the cache are left out.
+    """
+    now = time.time()
+    found = {}
+    remaining = []
+    for name in dict.fromkeys(names):
+        data = _from_memory(name, now, description_version)
+        if data is not None:
+            found[name] = data
+        else:
+            remaining.append(name)
+    if not remaining:
+        return found
+
+    from_database = []
+    try:
+        conn = get_db_connection()
+        for start in range(0, len(remaining), BULK_LOOKUP_SIZE):
+            chunk = remaining[start:start + BULK_LOOKUP_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = conn.execute(
+                f"SELECT name, data, expires_at, description, description_version FROM names"
+                f" WHERE name IN ({placeholders}) AND (expires_at IS NULL OR expires_at > ?)",
+                [*chunk, now]
+            )
+            for row in rows:
+                data = _row_data(row)
+                _remember(row['name'], data, row['expires_at'], row['description_version'])
+                found[row['name']] = _for_version(data, row['description_version'], description_version)
+                from_database.append(row['name'])
+    except sqlite3.Error as e:
+        logging.error(f"Failed to read {len(remaining)} names from the cache: {e}")
+
+    _touch(from_database, now)
+    _stats["database_hits"] += len(from_database)
+    _stats["misses"] += len(remaining) - len(from_database)
+    return found
+
+
+def cache_name(name: str, data: Dict[str, Any], ttl: Optional[float] = CACHE_TTL, source: Optional[str] = None,
+               description_version: Optional[int] = None):
     """
     Caches the data for a given name.
 
     Args:
         name: The name to cache.
-        data: The data dictionary to cache.
+        data: The data dictionary to cache, its `formatted_description` is stored separately.
+        ttl: Seconds until the entry expires, None to keep it forever.
+        source: Where the data came from, e.g. "llm" or "api".
+        description_version: Version of the formatter that rendered the description.
     """
-    conn = get_db_connection()
+    cache_names({name: data}, ttl, source, description_version)
+
+
+def cache_names(items: Dict[str, Dict[str, Any]], ttl: Optional[float] = CACHE_TTL, source: Optional[str] = None,
+                description_version: Optional[int] = None):
+    """
+    Caches the data for many names in one transaction.
+
+    Args:
+        items: Mapping of name to the data dictionary to cache.
+        ttl: Seconds until the entries expire, None to keep them forever.
+        source: Where the data came from, e.g. "llm" or "api".
+        description_version: Version of the formatter that rendered the descriptions.
+    """
+    global _writes_since_prune
+    if not items:
+        return
+    now = time.time()
+    expires_at = _expires_at(ttl, now)
+    rows = {}
+    for name, data in items.items():
+        description = data.get(DESCRIPTION_KEY)
+        stored = {key: value for key, value in data.items() if key not in (DESCRIPTION_KEY, LINES_KEY)}
+        rows[name] = (stored, description)
     try:
-        cursor = conn.cursor()
-        cursor.execute(
-            "INSERT OR REPLACE INTO names (name, data) VALUES (?, ?)",
-            (name, json.dumps(data))
+        with transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO names (name, data, expires_at, last_access, source, description, description_version)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(name, json.dumps(stored), expires_at, now, source, description,
+                  description_version if description is not None else None)
+                 for name, (stored, description) in rows.items()]
+            )
+            _save_access_times(conn)
+        logging.info(f"Cached data for {len(items)} name(s).")
+    except sqlite3.Error as e:
+        logging.error(f"Failed to cache data for {len(items)} names: {e}")
+        return
+
+    for name, (stored, description) in rows.items():
+        _remember(name, _with_description(stored, description), expires_at, description_version)
+
+    _writes_since_prune += len(items)
+    if _writes_since_prune >= PRUNE_INTERVAL:
+        prune_cache()
+
+
+def cache_description(name: str, description: str, description_version: int):
+    """Store a freshly rendered description for a name that's already cached."""
+    try:
+        conn = get_db_connection()
+        conn.execute(
+            "UPDATE names SET description = ?, description_version = ? WHERE name = ?",
+            (description, description_version, name)
         )
-        conn.commit()
-        logging.info(f"Cached data for '{name}'.")
+        _commit(conn)
     except sqlite3.Error as e:
-        logging.error(f"Failed to cache data for '{name}': {e}")
-    finally:
-        conn.close()
+        logging.error(f"Failed to cache the description of '{name}': {e}")
+        return
+
+    with _memory_lock:
+        entry = _memory_cache.get(name)
+        if entry is not None:
+            data, expires_at, _ = entry
+            _memory_cache[name] = (_with_description(dict(data), description), expires_at, description_version)
+
 
-# Initialize the database when this module is loaded
-setup_database()
+def prune_cache(max_entries: int = MAX_CACHED_NAMES) -> int:
+    """
+    Delete expired entries, then the least recently used ones above `max_entries`.
+
+    Returns:
+        The number of deleted entries.
+    """
+    global _writes_since_prune
+    _writes_since_prune = 0
+    now = time.time()
+    try:
+        with transaction() as conn:
+            _save_access_times(conn)
+            deleted = conn.execute("DELETE FROM names WHERE expires_at <= ?", (now,)).rowcount
+            deleted += conn.execute("""
+                DELETE FROM names WHERE id IN (
+                    SELECT id FROM names ORDER BY last_access DESC LIMIT -1 OFFSET ?
+                )
+            """, (max_entries,)).rowcount
+    except sqlite3.Error as e:
+        logging.error(f"Failed to prune the name cache: {e}")
+        return 0
+
+    if deleted:
+        # Don't serve names from memory that are gone from the table.
+        clear_memory_cache()
+        logging.info(f"Pruned {deleted} names from the cache.")
+    return deleted
+
+
+def vacuum_cache():
+    """Give the space freed by pruning back to the file system."""
+    conn = get_db_connection()
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.execute("VACUUM")
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Entry counts, file size and hit counts of this process."""
+    conn = get_db_connection()
+    row = conn.execute(
+        "SELECT COUNT(*) AS entries, COUNT(CASE WHEN expires_at <= ? THEN 1 END) AS expired FROM names",
+        (time.time(),)
+    ).fetchone()
+    sources = conn.execute("SELECT COALESCE(source, 'unknown') AS source, COUNT(*) AS entries FROM names GROUP BY 1")
+    size = sum(os.path.getsize(path) for path in (DB_FILE, f"{DB_FILE}-wal") if os.path.exists(path))
+    return {
+        "entries": row['entries'],
+        "expired": row['expired'],
+        "sources": {source_row['source']: source_row['entries'] for source_row in sources},
+        "max_entries": MAX_CACHED_NAMES,
+        "file_size": size,
+        "memory_entries": len(_memory_cache),
+        **_stats,
+    }
@@ -0,0 +1,104 @@
+"""On-disk cache of reverse geocoded addresses.
+
+Coordinates are rounded to `precision` decimal places before they're looked
+up, so every photo taken around the same spot shares one entry. 4 places is
+roughly 11 m, enough to tell buildings apart. Entries expire after `ttl`
+seconds since places do get renamed.
+"""
+import time
+import sqlite3
+import logging
+import threading
+from pathlib import Path
+from typing import Optional, Tuple
+
+from .config import DATA_DIR
+from .database import BUSY_TIMEOUT, PRAGMAS
+
+GEOCODE_DB_FILE = DATA_DIR / "geocode_cache.db"
+
+# Decimal places coordinates are rounded to.
+GEOCODE_PRECISION = 4
+
+# Seconds an address stays valid, None keeps it forever.
+GEOCODE_TTL = 180 * 24 * 60 * 60
+
+
+class GeocodeCache:
+    """Addresses by rounded coordinates, safe to share between threads."""
+
+    def __init__(self, db_file: Path = GEOCODE_DB_FILE, precision: int = GEOCODE_PRECISION,
+                 ttl: Optional[float] = GEOCODE_TTL):
+        self.db_file = Path(db_file)
+        self.precision = precision
+        self.ttl = ttl
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_file.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_file, timeout=BUSY_TIMEOUT, check_same_thread=False)
+            for pragma, value in PRAGMAS.items():
+                conn.execute(f"PRAGMA {pragma} = {value}")
+            # Different precisions are kept apart so changing it never mixes cells.
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS places (
+                    precision INTEGER NOT NULL,
+                    lat INTEGER NOT NULL,
+                    lon INTEGER NOT NULL,
+                    address TEXT NOT NULL,
+                    expires_at REAL,
+                    PRIMARY KEY (precision, lat, lon)
+                )
+            """)
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def key(self, lat: float, lon: float) -> Tuple[int, int, int]:
+        """The cell coordinates fall in, as integers so float noise can't split a cell."""
+        scale = 10 ** self.precision
+        return self.precision, round(lat * scale), round(lon * scale)
+
+    def get(self, lat: float, lon: float) -> Optional[str]:
+        """The cached address for coordinates, None if unknown or expired."""
+        try:
+            with self._lock:
+                row = self._connection().execute(
+                    "SELECT address FROM places WHERE precision = ? AND lat = ? AND lon = ?"
+                    " AND (expires_at IS NULL OR expires_at > ?)",
+                    (*self.key(lat, lon), time.time())
+                ).fetchone()
+        except sqlite3.Error as e:
+            logging.error(f"Geocode cache lookup failed: {e}")
+            return None
+        return row[0] if row else None
+
+    def put(self, lat: float, lon: float, address: str) -> None:
+        """Remember the address of coordinates."""
+        expires_at = None if self.ttl is None else time.time() + self.ttl
+        try:
+            with self._lock:
+                conn = self._connection()
+                conn.execute(
+                    "INSERT OR REPLACE INTO places (precision, lat, lon, address, expires_at) VALUES (?, ?, ?, ?, ?)",
+                    (*self.key(lat, lon), address, expires_at)
+                )
+                conn.commit()
+        except sqlite3.Error as e:
+            logging.error(f"Could not cache the address of {lat}, {lon}: {e}")
+
+    def prune(self) -> int:
+        """Delete expired addresses, returns how many."""
+        with self._lock:
+            conn = self._connection()
+            deleted = conn.execute("DELETE FROM places WHERE expires_at <= ?", (time.time(),)).rowcount
+            conn.commit()
+        return deleted
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,197 @@
+"""Background reverse geocoding for batch runs.
+
+    with GeocodeQueue(geocoder, cache) as geocoding:
+        for record in records:
+            geocoding.submit(record)
+        geocoding.join()
+
+Records with coordinates get an "address" key as soon as their place is
+looked up. Lookups run on an asyncio loop in a background thread, so the
+caller keeps extracting while they happen. Records in the same cache cell
+share one lookup, and requests are spaced to stay within Nominatim's usage
+policy of one per second.
+"""
+import time
+import asyncio
+import logging
+import threading
+from typing import Callable, Dict, List, Optional
+
+from .backoff import MAX_RETRIES, backoff
+from .geocode_cache import GeocodeCache
+
+ADDRESS_NOT_FOUND = "Address not found"
+ADDRESS_LOOKUP_FAILED = "Address lookup failed"
+ADDRESS_LOOKUP_ERROR = "Address lookup error"
+
+# Requests per second, Nominatim allows at most one.
+NOMINATIM_RATE = 1.0
+
+# Seconds to wait for one lookup.
+GEOCODE_TIMEOUT = 10
+
+# Seconds between checks that the background thread is still alive while joining.
+JOIN_POLL_INTERVAL = 0.5
+
+
+def is_network_error(error: Exception) -> bool:
+    """Whether a geocoder error is a timeout or an unreachable service."""
+    from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+    return isinstance(error, (GeocoderTimedOut, GeocoderServiceError))
+
+
+def is_retryable(error: Exception) -> bool:
+    """Whether the same lookup could work if tried again later."""
+    from geopy.exc import GeocoderTimedOut, GeocoderUnavailable, GeocoderRateLimited
+    return isinstance(error, (GeocoderTimedOut, GeocoderUnavailable, GeocoderRateLimited))
+
+
+class GeocodeQueue:
+    """Looks up the addresses of submitted records one place at a time."""
+
+    def __init__(self, geocoder, cache: GeocodeCache, rate: float = NOMINATIM_RATE,
+                 max_retries: int = MAX_RETRIES, timeout: float = GEOCODE_TIMEOUT):
+        if rate <= 0:
+            raise ValueError("Geocoding rate must be greater than zero.")
+        self.geocoder = geocoder
+        self.cache = cache
+        self.rate = rate
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.submitted = 0
+        self.resolved = 0
+        self._waiting: Dict[tuple, List[dict]] = {}
+        self._addresses: Dict[tuple, str] = {}
+        self._changed = threading.Condition()
+        self._next_request = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        # Don't sit through the remaining lookups when something went wrong.
+        self.close(wait=exc_type is None)
+
+    def start(self) -> None:
+        """Start the background thread, submit() only works after this."""
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="geocoder", daemon=True)
+        self._thread.start()
+        ready.wait()
+
+    def _run(self, ready: threading.Event) -> None:
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._queue = asyncio.Queue()
+            self._worker = self._loop.create_task(self._work())
+            ready.set()
+            self._loop.run_until_complete(self._worker)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            ready.set()
+            self._loop.close()
+
+    def submit(self, record: dict) -> None:
+        """Queue a record's coordinates, records without any are ignored."""
+        if 'latitude' not in record:
+            return
+        lat, lon = record['latitude'], record['longitude']
+        key = self.cache.key(lat, lon)
+
+        with self._changed:
+            self.submitted += 1
+            if key in self._waiting:
+                self._waiting[key].append(record)
+                return
+            address = self._addresses.get(key) or self.cache.get(lat, lon)
+            if address is not None:
+                self._addresses[key] = address
+                record['address'] = address
+                self.resolved += 1
+                self._changed.notify_all()
+                return
+            self._waiting[key] = [record]
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (key, lat, lon))
+
+    def submit_all(self, records: List[dict]) -> None:
+        for record in records:
+            self.submit(record)
+
+    def join(self, progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """Wait until every submitted record has its address, reporting `progress(done, total)`."""
+        with self._changed:
+            while True:
+                if progress:
+                    progress(self.resolved, self.submitted)
+                if self.resolved >= self.submitted:
+                    return
+                # Lookups can't finish anymore once the thread is gone.
+                if self._thread is None or not self._thread.is_alive():
+                    logging.error(f"Geocoding stopped with {self.submitted - self.resolved} address(es) left.")
+                    return
+                self._changed.wait(JOIN_POLL_INTERVAL)
+
+    def close(self, wait: bool = True) -> None:
+        """Stop the background thread, after the queued lookups unless `wait` is False."""
+        if self._thread is None:
+            return
+        if wait:
+            self._loop.call_soon_threadsafe(self._queue.put_nowait, None)
+            self._thread.join()
+        else:
+            self._loop.call_soon_threadsafe(self._worker.cancel)
+        self._thread = None
+
+    async def _work(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if item is None:
+                return
+            key, lat, lon = item
+            try:
+                self._resolve(key, await self._lookup(lat, lon))
+            except Exception as e:
+                # One bad place mustn't stop the lookups queued behind it.
+                logging.error(f"Address lookup for {lat}, {lon} crashed: {e}")
+                self._resolve(key, ADDRESS_LOOKUP_ERROR)
+
+    def _resolve(self, key: tuple, address: str) -> None:
+        with self._changed:
+            self._addresses[key] = address
+            records = self._waiting.pop(key, [])
+            for record in records:
+                record['address'] = address
+            self.resolved += len(records)
+            self._changed.notify_all()
+
+    async def _wait_turn(self) -> None:
+        """Space requests `1 / rate` seconds apart."""
+        now = time.monotonic()
+        if now < self._next_request:
+            await asyncio.sleep(self._next_request - now)
+        self._next_request = max(now, self._next_request) + 1 / self.rate
+
+    async def _lookup(self, lat: float, lon: float) -> str:
+        """The address of one place, retrying while the geocoder is busy or unreachable."""
+        for attempt in range(self.max_retries + 1):
+            await self._wait_turn()
+            try:
+                location = await asyncio.to_thread(self.geocoder.reverse, f"{lat}, {lon}", timeout=self.timeout)
+            except Exception as e:
+                if attempt < self.max_retries and is_retryable(e):
+                    # Rate limited answers may say how long to back off for.
+                    await asyncio.sleep(getattr(e, 'retry_after', None) or backoff(attempt))
+                    continue
+                logging.warning(f"Address lookup for {lat}, {lon} failed: {e}")
+                return ADDRESS_LOOKUP_FAILED if is_network_error(e) else ADDRESS_LOOKUP_ERROR
+
+            address = location.address if location else ADDRESS_NOT_FOUND
+            self.cache.put(lat, lon, address)
+            return address
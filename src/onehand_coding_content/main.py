@@ -3,49 +3,58 @@
 
 import os
 import sys
-import asyncio
-import inspect
 import argparse
-import importlib.util
+import importlib
 from pathlib import Path
 from typing import List
 
-from .config import PROJECT_ROOT, LINE_LENGTH
-
 os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] = "1"  # Lets hide the pygame prompt.
 
+# Keep imports here light, asyncio and the heavy libraries used by some scripts
+# are only imported once they're needed. Check with `content --bench-import`.
+
+from . import clock
+from .config import LINE_LENGTH
+from .sounds import preload_sounds, set_sound_enabled, sound_files
+from .manifest import get_manifest
+
 CONTENT_DIR = Path(__file__).parent / "content"
 
 
-def run_script(script_name: str, args: list[str] = []):
-    """Finds and runs a script, handling both sync and async main functions."""
+def run_script(script_name: str, args: List[str] = []):
+    """
+    Finds and runs a script, handling both sync and async main functions.
+    `args` are passed on to the script as sys.argv[1:].
+    """
     script_path = CONTENT_DIR / script_name
 
     if not script_path.exists():
         print(f"Script {script_path.name} not Found!")
         sys.exit(1)
 
-    # Add the project root to sys.path to allow imports
-    if str(PROJECT_ROOT) not in sys.path:
-        sys.path.insert(0, str(PROJECT_ROOT))
-
-    # Get the module name without .py extension
+    # Import through the package so scripts share our modules (sound cache, config).
     module_name = Path(script_name).stem
-    full_module_name = f"src.onehand_coding_content.content.{module_name}"
-
-    # Load and execute the module
-    spec = importlib.util.spec_from_file_location(full_module_name, script_path)
-    module = importlib.util.module_from_spec(spec)
+    full_module_name = f"{__package__}.content.{module_name}"
 
-    # Add the module to sys.modules to enable relative imports
-    sys.modules[full_module_name] = module
+    # Decode the script's sound effects upfront so it doesn't hit the disk while typing.
+    script_info = get_script_manifest().get(script_name)
+    preload_sounds(sound_files(script_info.sounds) if script_info else None)
 
+    saved_argv = sys.argv
+    sys.argv = [str(script_path), *args]
     try:
-        spec.loader.exec_module(module)
+        module = importlib.import_module(full_module_name)
 
         # If the module has a main function, call it appropriately
         if hasattr(module, 'main'):
-            if inspect.iscoroutinefunction(module.main):
+            if script_info is not None:
+                is_async = script_info.is_async
+            else:
+                import inspect
+                is_async = inspect.iscoroutinefunction(module.main)
+
+            if is_async:
+                import asyncio
                 asyncio.run(module.main())
             else:
                 module.main()
@@ -54,6 +63,36 @@ def run_script(script_name: str, args: list[str] = []):
         # If we get here, the module didn't handle its own interrupt, so we exit
         print()  # Add a newline
         sys.exit(0)
+    finally:
+        sys.argv = saved_argv
+
+
+def record_script(script_name: str, cast_file: str, args: List[str] = []):
+    """Run a script while recording its output to an asciicast file."""
+    from .recorder import AsciicastRecorder
+
+    with AsciicastRecorder(cast_file, title=script_name):
+        run_script(script_name, args)
+    print(f"\nRecording saved to {cast_file}")
+
+
+def use_clock(speed: float = 1.0):
+    """Set the clock scripts run on, sound effects are muted when not realtime."""
+    script_clock = clock.make_clock(speed)
+    clock.set_clock(script_clock)
+    set_sound_enabled(script_clock.realtime)
+    return script_clock
+
+
+_script_manifest = None
+
+
+def get_script_manifest():
+    """Return the cached metadata of all content scripts, keyed by script name."""
+    global _script_manifest
+    if _script_manifest is None:
+        _script_manifest = get_manifest(CONTENT_DIR)
+    return _script_manifest
 
 
 def get_content_scripts():
@@ -61,7 +100,29 @@ def get_content_scripts():
     Return a sorted list of all content scripts from content dir.
     Only return the names not absolute paths.
     """
-    return sorted(content_code.name for content_code in CONTENT_DIR.glob("*.py"))
+    return list(get_script_manifest())
+
+
+def describe_script(script_name: str) -> str:
+    """One line description of a script from its manifest entry."""
+    script_info = get_script_manifest().get(script_name)
+    if script_info is None:
+        return script_name
+
+    tags = []
+    if script_info.is_async:
+        tags.append("async")
+    if script_info.interactive:
+        tags.append("interactive")
+    if script_info.graphical:
+        tags.append("graphical")
+    if script_info.sounds:
+        tags.append(f"{len(script_info.sounds)} sound(s)")
+
+    description = f"{script_name} - {script_info.title}"
+    if tags:
+        description += f" [{', '.join(tags)}]"
+    return description
 
 
 def list_content_scripts(content_scripts: List[str] = None) -> None:
@@ -77,7 +138,7 @@ def list_content_scripts(content_scripts: List[str] = None) -> None:
         print("\nNo Script to run, write a new one.")
 
     for i, content_code in enumerate(content_scripts, start=1):
-        print(f"{i}.", content_code)
+        print(f"{i}.", describe_script(content_code))
     print()
 
 
@@ -103,30 +164,115 @@ def choose_content_script(content_scripts: List[str] = None):
             sys.exit()
 
 
+def cache_command(argv: List[str]):
+    """`content cache stats|prune|vacuum`, look after the name analysis cache."""
+    # sqlite3 is only needed here, keep it out of the normal startup.
+    from . import database
+
+    parser = argparse.ArgumentParser(prog="content cache", description="Manage the name analysis cache.")
+    parser.add_argument("action", choices=["stats", "prune", "vacuum"], help="Show cache statistics, drop expired and least recently used entries, or compact the database file.")
+    parser.add_argument("--max-entries", type=int, default=database.MAX_CACHED_NAMES, help="Entries to keep when pruning (default: %(default)s).")
+    args = parser.parse_args(argv)
+
+    if args.action == "prune":
+        print(f"Pruned {database.prune_cache(args.max_entries)} entries.")
+    elif args.action == "vacuum":
+        before = database.cache_stats()["file_size"]
+        database.vacuum_cache()
+        after = database.cache_stats()["file_size"]
+        print(f"Vacuumed {database.DB_FILE}: {before / 1024:.0f} KiB -> {after / 1024:.0f} KiB")
+    else:
+        stats = database.cache_stats()
+        print("=" * LINE_LENGTH)
+        print(f"NAME CACHE: {database.DB_FILE}")
+        print("=" * LINE_LENGTH)
+        print(f"Entries: {stats['entries']} of {stats['max_entries']} ({stats['expired']} expired)")
+        for source, entries in sorted(stats['sources'].items()):
+            print(f"  {source}: {entries}")
+        print(f"File size: {stats['file_size'] / 1024:.0f} KiB")
+
+
 def main():
     """Run the main function."""
+    if sys.argv[1:2] == ["cache"]:
+        cache_command(sys.argv[2:])
+        return
+
     content_scripts = get_content_scripts()
-    parser = argparse.ArgumentParser(description="Onehand-Coding FB page scripts content runner.")
+    parser = argparse.ArgumentParser(
+        description="Onehand-Coding FB page scripts content runner.",
+        epilog="Everything after the script name is passed on to the script, so its options can't clash with these.",
+        allow_abbrev=False,
+    )
 
     parser.add_argument("script", nargs="?", help="Name of the python script to run, must be located in content directory.")
+    parser.add_argument("script_args", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
     parser.add_argument("-l", "--list", action= "store_true", help="List all available scripts.")
     parser.add_argument("-c", "--choose", action= "store_true", help="Enables user to choose a script to run interactively.")
-
-    args = parser.parse_args()
+    parser.add_argument("-s", "--speed", type=float, help="Run the script this many times faster than realtime (0 means instant).")
+    parser.add_argument("-i", "--instant", action="store_true", help="Skip all pauses, same as --speed 0.")
+    parser.add_argument("-r", "--record", metavar="CAST_FILE", help="Record the script run to an asciinema (.cast) file, instantly unless --speed is given.")
+    parser.add_argument("--render-all", action="store_true", help="Render every script headless to data/renders/, using scripted answers from data/answers/.")
+    parser.add_argument("-j", "--jobs", type=int, help="Number of worker processes for --render-all (default: all cores).")
+    parser.add_argument("--bench-import", action="store_true", help="Benchmark how long it takes to start the content CLI.")
+    parser.add_argument("--serve", action="store_true", help="Start a warm runner daemon, scripts launched with `content` will run in it.")
+    parser.add_argument("--no-daemon", action="store_true", help="Run the script in this process even if a warm runner daemon is up.")
+
+    args, unknown_args = parser.parse_known_args()
+    # Unknown options before the script name still go to it, like for --choose.
+    script_args = unknown_args + args.script_args
+    if args.speed is not None and args.speed < 0:
+        parser.error("--speed can't be negative.")
+
+    # Recordings keep the logical timestamps, so there's no need to actually wait.
+    speed = args.speed
+    if args.instant or (speed is None and args.record):
+        speed = 0
+    speed = 1.0 if speed is None else speed
+    use_clock(speed)
+
+    def start(script_name):
+        # Hand the script to the warm runner when one is up, graphical scripts keep their own process.
+        script_info = get_script_manifest().get(script_name)
+        if not args.no_daemon and not (script_info and script_info.graphical):
+            from .daemon import run_via_daemon
+            exit_code = run_via_daemon(script_name, speed=speed, record=args.record, args=script_args)
+            if exit_code is not None:
+                sys.exit(exit_code)
+
+        if args.record:
+            record_script(script_name, args.record, script_args)
+        else:
+            run_script(script_name, script_args)
 
     if args.list:
         list_content_scripts(content_scripts)
+    if args.serve:
+        from .daemon import serve
+        serve()
+        return
+    if args.bench_import:
+        from .bench import measure_import_time, print_import_timing
+        print_import_timing(measure_import_time())
+        return
+    if args.render_all:
+        from .batch import render_all, print_render_summary
+        print_render_summary(render_all(content_scripts, CONTENT_DIR, jobs=args.jobs))
+        return
     if args.choose:
-        run_script(choose_content_script(content_scripts))
+        start(choose_content_script(content_scripts))
 
     # If the the script to run is provided as argument.
     script = args.script
     if script is not None:
+        # Allow leaving out the .py extension.
+        if not script.endswith(".py"):
+            script += ".py"
         if script not in content_scripts:
             print(f"\n{script} not found in content dir, make sure to put it inside this directory: {CONTENT_DIR}/")
             return
 
-        run_script(script)
+        start(script)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,136 @@
+"""Cached index of the content scripts.
+
+Script metadata is read with `ast`, so nothing gets imported, and saved to
+`data/manifest.json`. An entry is only re-read when its file's mtime changes,
+so `ast` is only imported when something actually changed.
+"""
+import os
+import json
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+from .config import DATA_DIR
+
+MANIFEST_FILE = DATA_DIR / "manifest.json"
+MANIFEST_VERSION = 1
+
+# Scripts importing these need a display.
+GRAPHICAL_MODULES = ("turtle",)
+
+# The typewriter effects play this sound on every keypress.
+PRESENTATION_SOUND = "KEYPRESS_SOUND"
+
+
+class ScriptInfo(NamedTuple):
+    """Metadata about one content script."""
+    name: str
+    title: str
+    is_async: bool
+    sounds: List[str]
+    interactive: bool
+    graphical: bool
+    mtime: int
+
+
+def _title_from_name(name: str) -> str:
+    return Path(name).stem.replace("_", " ").title()
+
+
+def inspect_script(script_path: Path) -> ScriptInfo:
+    """Read a script's metadata from its source."""
+    import ast
+
+    source = script_path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(script_path))
+
+    docstring = ast.get_docstring(tree)
+    title = next((line.strip() for line in (docstring or "").splitlines() if line.strip()), None)
+
+    is_async = False
+    sounds = set()
+    interactive = False
+    graphical = False
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.AsyncFunctionDef) and node.name == "main" and node in tree.body:
+            is_async = True
+        elif isinstance(node, ast.ImportFrom):
+            if node.module == "sounds":
+                sounds.update(alias.name for alias in node.names if alias.name.isupper())
+            elif node.module == "presentation":
+                sounds.add(PRESENTATION_SOUND)
+            elif node.module and node.module.split(".")[0] in GRAPHICAL_MODULES:
+                graphical = True
+        elif isinstance(node, ast.Import):
+            if any(alias.name.split(".")[0] in GRAPHICAL_MODULES for alias in node.names):
+                graphical = True
+        elif isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and node.func.id == "input":
+            interactive = True
+
+    return ScriptInfo(
+        name=script_path.name,
+        title=title or _title_from_name(script_path.name),
+        is_async=is_async,
+        sounds=sorted(sounds),
+        interactive=interactive,
+        graphical=graphical,
+        mtime=script_path.stat().st_mtime_ns,
+    )
+
+
+def _load_manifest(manifest_file: Path) -> dict:
+    try:
+        manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest
+
+
+def _save_manifest(manifest_file: Path, manifest: dict) -> None:
+    try:
+        manifest_file.parent.mkdir(parents=True, exist_ok=True)
+        manifest_file.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+    except OSError as e:
+        import logging
+        logging.warning(f"Could not save script manifest: {e}")
+
+
+def get_manifest(content_dir: Path, manifest_file: Path = MANIFEST_FILE) -> Dict[str, ScriptInfo]:
+    """Return metadata for every script in `content_dir`, sorted by name."""
+    manifest = _load_manifest(manifest_file)
+    cached = manifest.get("scripts", {})
+    dir_mtime = content_dir.stat().st_mtime_ns
+
+    # The folder's mtime only changes when scripts are added, removed or renamed.
+    if manifest.get("content_dir") == str(content_dir) and manifest.get("dir_mtime") == dir_mtime:
+        names = list(cached)
+    else:
+        names = [entry.name for entry in os.scandir(content_dir) if entry.name.endswith(".py") and entry.is_file()]
+
+    scripts = {}
+    changed = set(names) != set(cached)
+    for name in sorted(names):
+        script_path = content_dir / name
+        entry = cached.get(name)
+        try:
+            if entry is not None and entry["mtime"] == script_path.stat().st_mtime_ns:
+                scripts[name] = ScriptInfo(**entry)
+                continue
+            scripts[name] = inspect_script(script_path)
+        except (OSError, SyntaxError, ValueError) as e:
+            import logging
+            logging.warning(f"Could not read {name}: {e}")
+            continue
+        changed = True
+
+    if changed or manifest.get("dir_mtime") != dir_mtime:
+        _save_manifest(manifest_file, {
+            "version": MANIFEST_VERSION,
+            "content_dir": str(content_dir),
+            "dir_mtime": dir_mtime,
+            "scripts": {name: info._asdict() for name, info in scripts.items()},
+        })
+
+    return scripts
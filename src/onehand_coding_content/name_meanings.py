@@ -1,42 +1,320 @@
 """Module to provide meanings for names using an external API."""
 import os
+import time
 import logging
 import json
 import asyncio
-from typing import Optional, Dict, Any
+from importlib.util import find_spec
+from urllib.parse import urlsplit
+from email.utils import parsedate_to_datetime
+from typing import Optional, Dict, Any, List, Tuple, Iterable, AsyncIterator, Awaitable, Callable
 
-import httpx
-import pycountry
 from dotenv import load_dotenv
-import google.generativeai as genai
 
+# httpx, pycountry and google.generativeai are slow to import, so they are
+# imported where they're used instead of here.
 from .config import LINE_LENGTH
-from .database import get_cached_name, cache_name
+from .backoff import MAX_RETRIES, backoff
+from .partial_json import PartialJSONObject
+from .database import (
+    CACHE_TTL, get_cached_name, get_cached_names, cache_names, cache_description
+)
 
 load_dotenv()
 logging.basicConfig(level=logging.ERROR)
 
+DEFAULT_API_URLS = {
+    "age": "https://api.agify.io/",
+    "origin": "https://api.nationalize.io/",
+    "gender": "https://api.genderize.io/"
+}
+
+# agify, nationalize and genderize accept up to 10 `name[]` parameters per request.
+API_BATCH_SIZE = 10
+
+# Where a cached result came from, stored in the cache's `source` column.
+# API results also carry it in their data so cache hits get the right formatter.
+LLM_SOURCE = "llm"
+API_SOURCE = "api"
+NEGATIVE_SOURCE = "negative"
+
+# Fallback answers are rougher than the LLM's, so they are refreshed sooner,
+# and names nobody knew are retried after a day.
+LLM_CACHE_TTL = CACHE_TTL
+API_CACHE_TTL = 7 * 24 * 60 * 60
+NEGATIVE_CACHE_TTL = 24 * 60 * 60
+
+# Bump when the description formatters change, cached descriptions of
+# older versions are then rendered again on their next lookup.
+FORMATTER_VERSION = 1
+
+# Names packed into one Gemini prompt by `analyze_names`.
+LLM_BATCH_SIZE = 10
+
+# LLM answer fields in the order they're described.
+LLM_DESCRIPTION_FIELDS = ("meaning", "origin", "etymology", "gender", "variations", "famous_bearers", "description")
+
+# Fields every LLM answer must have, and their JSON types.
+LLM_SCHEMA = {
+    "name": str,
+    "meaning": str,
+    "origin": str,
+    "etymology": str,
+    "gender": str,
+    "famous_bearers": list,
+    "variations": list,
+    "description": str,
+}
+
+# Requests per second and burst size allowed per host, hosts not listed get
+# DEFAULT_RATE_LIMIT. Gemini calls are throttled under LLM_HOST.
+LLM_HOST = "generativelanguage.googleapis.com"
+DEFAULT_RATE_LIMIT = (5.0, 10)
+RATE_LIMITS = {
+    LLM_HOST: (1.0, 4),
+}
+
+# Responses retried with `backoff`, or as long as their Retry-After says.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# After this many failures in a row a host is left alone for CIRCUIT_RESET seconds.
+CIRCUIT_THRESHOLD = 5
+CIRCUIT_RESET = 30.0
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a host that keeps failing."""
+
+
+class RetryableResponse(Exception):
+    """An HTTP response worth retrying, like a 429 or a 503."""
+
+    def __init__(self, response):
+        super().__init__(f"HTTP {response.status_code} from {response.url}")
+        self.response = response
+
+
+class HostThrottle:
+    """Token bucket and circuit breaker for one host."""
+
+    def __init__(self, host: str, rate: float, burst: int,
+                 failure_threshold: int = CIRCUIT_THRESHOLD, reset_timeout: float = CIRCUIT_RESET):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+
+    async def acquire(self) -> None:
+        """Wait for a token, and for any Retry-After pause to end."""
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every request to this host for `seconds`."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def check(self) -> None:
+        """Raise CircuitOpenError while the circuit is open."""
+        if self.opened_at is None:
+            return
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            raise CircuitOpenError(f"{self.host} failed {self.failures} times in a row, not calling it for now.")
+        # Half open, let this request through as a trial and keep the rest out until it's done.
+        self.opened_at = time.monotonic()
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            if self.opened_at is None:
+                logging.warning(f"{self.host} keeps failing, pausing requests to it for {self.reset_timeout:.0f}s.")
+            self.opened_at = time.monotonic()
+
+
+def _retry_after(response) -> Optional[float]:
+    """Seconds asked for by a Retry-After header, in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_transient(error: Exception) -> bool:
+    """Whether a failed call is worth retrying."""
+    if isinstance(error, (RetryableResponse, asyncio.TimeoutError)):
+        return True
+    # Google API errors carry their HTTP status as `code`.
+    if getattr(error, "code", None) in RETRY_STATUSES:
+        return True
+    import httpx
+    return isinstance(error, httpx.TransportError)
+
+
+def _json_or_none(response) -> Optional[Any]:
+    """Body of a successful response, None for failed requests."""
+    if isinstance(response, Exception) or response.status_code != 200:
+        return None
+    try:
+        return response.json()
+    except ValueError:
+        return None
+
 
 class NameMeaningProvider:
     """Provides comprehensive name analysis using an LLM as the primary source
     and external APIs as a fallback, all done asynchronously.
+
+    The fallback APIs share one pooled HTTP client, use the provider as an
+    async context manager (or call `aclose()`) to close it when done.
+    Every request, Gemini's included, goes through a per-host `HostThrottle`.
     """
-    GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-
-    def __init__(self):
-        """Initialize the NameMeaningProvider."""
-        self.api_urls = {
-            "age": "https://api.agify.io/",
-            "origin": "https://api.nationalize.io/",
-            "gender": "https://api.genderize.io/"
-        }
-        if self.GEMINI_API_KEY:
-            genai.configure(api_key=self.GEMINI_API_KEY)
+    def __init__(self, max_connections: int = 20, max_keepalive_connections: int = 10,
+                 http2: Optional[bool] = None, timeout: float = 10.0,
+                 api_urls: Optional[Dict[str, str]] = None, llm_model=None,
+                 llm_batch_size: int = LLM_BATCH_SIZE,
+                 rate_limits: Optional[Dict[str, Tuple[float, int]]] = None, max_retries: int = MAX_RETRIES):
+        """
+        Initialize the NameMeaningProvider.
+
+        Args:
+            max_connections: Most connections the HTTP client opens at once.
+            max_keepalive_connections: Idle connections kept open for reuse.
+            http2: Use HTTP/2, defaults to on when the `h2` package is installed.
+            timeout: Seconds before an API request times out.
+            api_urls: Override the "age", "origin" and "gender" API endpoints.
+            llm_model: Model to use instead of Gemini, e.g. the `FakeLLMModel` in tests/fake_llm.py.
+            llm_batch_size: Names per prompt in `analyze_names`, 1 sends one prompt per name.
+            rate_limits: (requests per second, burst) by host, on top of `RATE_LIMITS`.
+            max_retries: Retries of rate limited or failed requests.
+        """
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.http2 = find_spec("h2") is not None if http2 is None else http2
+        self.timeout = timeout
+        self._client = None
+        # Lookups in progress, by normalized name, so concurrent callers share them.
+        self._pending: Dict[str, asyncio.Future] = {}
+        self.api_urls = {**DEFAULT_API_URLS, **(api_urls or {})}
+        self.llm_batch_size = max(llm_batch_size, 1)
+        self.rate_limits = {**RATE_LIMITS, **(rate_limits or {})}
+        self.max_retries = max_retries
+        self._throttles: Dict[str, HostThrottle] = {}
+        if llm_model is not None:
+            self.llm_model = llm_model
+        elif os.getenv("GEMINI_API_KEY"):
+            # Read when the provider is made, so a warm daemon sees each caller's key.
+            import google.generativeai as genai
+            genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
             self.llm_model = genai.GenerativeModel('gemini-pro-latest')
         else:
             self.llm_model = None
             logging.warning("GEMINI_API_KEY not found. LLM features will be disabled.")
 
+    async def __aenter__(self) -> "NameMeaningProvider":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _get_client(self):
+        """Return the shared HTTP client, creating it on first use."""
+        if self._client is None:
+            import httpx
+
+            limits = httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            )
+            self._client = httpx.AsyncClient(limits=limits, http2=self.http2, timeout=self.timeout)
+        return self._client
+
+    def _get_throttle(self, host: str) -> HostThrottle:
+        """Return the throttle for `host`, creating it on first use."""
+        if host not in self._throttles:
+            rate, burst = self.rate_limits.get(host, DEFAULT_RATE_LIMIT)
+            self._throttles[host] = HostThrottle(host, rate, burst)
+        return self._throttles[host]
+
+    async def _throttled(self, host: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `call` within the host's rate limit, retrying transient failures
+        with backoff. Raises CircuitOpenError when the host keeps failing.
+        """
+        throttle = self._get_throttle(host)
+        for attempt in range(self.max_retries + 1):
+            throttle.check()
+            await throttle.acquire()
+            try:
+                result = await call()
+            except Exception as e:
+                if not _is_transient(e):
+                    raise
+                delay = _retry_after(e.response) if isinstance(e, RetryableResponse) else None
+                # A host saying when to come back is busy, not broken, so only
+                # answers without Retry-After count towards opening the circuit.
+                if delay is None:
+                    throttle.record_failure()
+                if attempt == self.max_retries:
+                    raise
+
+                if delay is not None:
+                    # The server told us when to come back, hold every request to it until then.
+                    throttle.pause(delay)
+                else:
+                    delay = backoff(attempt)
+                logging.warning(f"{host} request failed ({e}), retry {attempt + 1} in {delay:.1f}s.")
+                await asyncio.sleep(delay)
+            else:
+                throttle.record_success()
+                return result
+
+    async def _get(self, url: str, params) -> Any:
+        """GET from a fallback API through its host's throttle."""
+        client = self._get_client()
+
+        async def call():
+            response = await client.get(url, params=params)
+            if response.status_code in RETRY_STATUSES:
+                raise RetryableResponse(response)
+            return response
+
+        return await self._throttled(urlsplit(url).netloc, call)
+
+    async def _generate(self, prompt: str, **kwargs) -> Any:
+        """Prompt the LLM through the Gemini throttle."""
+        return await self._throttled(LLM_HOST, lambda: self.llm_model.generate_content_async(prompt, **kwargs))
+
     async def analyze_name(self, name: str) -> Dict[str, Any]:
         """
         Get comprehensive information about a name asynchronously.
@@ -45,26 +323,172 @@ class NameMeaningProvider:
         attempts to get information from the Gemini LLM. If that fails,
         it falls back to using a combination of free APIs.
         """
-        name = name.strip().title()
+        name = self.normalize_name(name)
 
         # Check cache first
-        cached_data = get_cached_name(name)
+        cached_data = get_cached_name(name, FORMATTER_VERSION)
         if cached_data:
-            cached_data['formatted_description'] = self._format_llm_description(cached_data)
-            return cached_data
+            return self._cached_result(name, cached_data)
+
+        # Someone is already looking this name up, wait for their answer.
+        shared = self._pending_flight(name)
+        while shared is not None:
+            try:
+                return dict(await asyncio.shield(shared))
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+            # Whoever started that lookup gave up on it.
+            shared = self._pending_flight(name)
+
+        flight = self._start_flights([name])[name]
+        try:
+            result = await self._analyze_uncached(name)
+        except BaseException:
+            flight.cancel()
+            raise
+        flight.set_result(result)
+        return result
+
+    async def analyze_names(self, names: Iterable[str], concurrency: int = 8) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Analyze many names, yielding each result as soon as it's ready.
+
+        Cached names are read with one bulk query and yielded first. The rest
+        are fetched concurrently, at most `concurrency` at a time, and come
+        out in the order they finish. Duplicate names are analyzed once, also
+        when another call is already looking them up.
+
+        Uncached names are sent to the LLM `llm_batch_size` names per prompt.
+        Names the LLM can't answer are looked up in the fallback APIs in
+        batches of `API_BATCH_SIZE` names per request.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        unique_names = list(dict.fromkeys(self.normalize_name(name) for name in names if name.strip()))
+
+        cached = get_cached_names(unique_names, FORMATTER_VERSION)
+        for name in unique_names:
+            if name in cached:
+                yield self._cached_result(name, cached[name])
+
+        misses = [name for name in unique_names if name not in cached]
+        # Names another call is already fetching are waited for instead.
+        joined = [name for name in misses if self._pending_flight(name) is not None]
+        misses = [name for name in misses if name not in joined]
+        flights = self._start_flights(misses)
+        try:
+            async for name, result in self._analyze_misses(misses, concurrency):
+                flights[name].set_result(result)
+                yield result
+
+            async for result in self._as_completed([self.analyze_name(name) for name in joined]):
+                yield result
+        finally:
+            # Let anyone waiting on a name we didn't get to fetch it themselves.
+            for flight in flights.values():
+                if not flight.done():
+                    flight.cancel()
+
+    async def _analyze_misses(self, misses: List[str], concurrency: int) -> AsyncIterator[tuple]:
+        """Fetch uncached names, LLM first and then the fallback APIs, yields (name, result)."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        fallback_names = []
+        if self.llm_model:
+            async def llm_with_limit(batch):
+                async with semaphore:
+                    if len(batch) == 1:
+                        return {batch[0]: await self._fetch_from_llm(batch[0])}
+                    return await self._fetch_from_llm_batch(batch)
+
+            size = self.llm_batch_size
+            llm_batches = [misses[i:i + size] for i in range(0, len(misses), size)]
+            async for llm_results in self._as_completed([llm_with_limit(batch) for batch in llm_batches]):
+                answered = {name: llm_data for name, llm_data in llm_results.items() if llm_data}
+                for name, result in self._llm_results(answered).items():
+                    yield name, result
+                fallback_names.extend(name for name in llm_results if name not in answered)
+        else:
+            fallback_names = misses
+
+        if fallback_names:
+            logging.warning(f"Could not fetch data for {len(fallback_names)} name(s) from LLM. Falling back to APIs.")
+
+        async def apis_with_limit(batch):
+            async with semaphore:
+                return await self._fetch_from_apis_batch(batch)
+
+        batches = [fallback_names[i:i + API_BATCH_SIZE] for i in range(0, len(fallback_names), API_BATCH_SIZE)]
+        async for api_results in self._as_completed([apis_with_limit(batch) for batch in batches]):
+            for api_data in api_results:
+                yield api_data['name'], api_data
+
+    @staticmethod
+    async def _as_completed(coroutines) -> AsyncIterator[Any]:
+        """Run coroutines as tasks and yield their results as they finish."""
+        tasks = [asyncio.create_task(coroutine) for coroutine in coroutines]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _pending_flight(self, name: str) -> Optional[asyncio.Future]:
+        """The in-progress lookup of `name`, if there is one."""
+        flight = self._pending.get(name)
+        if flight is None or flight.cancelled():
+            return None
+        return flight
+
+    def _start_flights(self, names: List[str]) -> Dict[str, asyncio.Future]:
+        """Register lookups of `names` so concurrent callers can wait on them."""
+        loop = asyncio.get_running_loop()
+        flights = {}
+        for name in names:
+            flights[name] = flight = loop.create_future()
+            self._pending[name] = flight
+            flight.add_done_callback(lambda done, name=name: self._end_flight(name, done))
+        return flights
+
+    def _end_flight(self, name: str, flight: asyncio.Future) -> None:
+        if self._pending.get(name) is flight:
+            del self._pending[name]
 
+    @staticmethod
+    def normalize_name(name: str) -> str:
+        """The form names are looked up and cached under."""
+        return name.strip().title()
+
+    async def _analyze_uncached(self, name: str) -> Dict[str, Any]:
+        """Fetch a name that isn't cached from the LLM, or the APIs if that fails."""
         # If not in cache, fetch from LLM
         llm_data = await self._fetch_from_llm(name)
         if llm_data:
-            cache_name(name, llm_data)  # Cache the successful LLM response
-            llm_data['formatted_description'] = self._format_llm_description(llm_data)
-            return llm_data
+            return self._llm_result(name, llm_data)
 
         # Fallback to APIs if LLM fails
         logging.warning(f"Could not fetch data for '{name}' from LLM. Falling back to APIs.")
-        api_data = await self._fetch_from_apis(name)
-        api_data['formatted_description'] = self._format_api_description(api_data)
-        return api_data
+        return await self._fetch_from_apis(name)
+
+    def _llm_result(self, name: str, llm_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the description to a successful LLM response and cache both."""
+        return self._llm_results({name: llm_data})[name]
+
+    def _llm_results(self, llm_data: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """`_llm_result` for many names, cached in one transaction."""
+        for data in llm_data.values():
+            self._describe(data)
+        cache_names(llm_data, LLM_CACHE_TTL, source=LLM_SOURCE, description_version=FORMATTER_VERSION)
+        return llm_data
+
+    def _cached_result(self, name: str, cached_data: Dict[str, Any]) -> Dict[str, Any]:
+        """A cache hit, rendering and storing its description if it's missing or outdated."""
+        if 'formatted_description' not in cached_data:
+            self._describe(cached_data)
+            cache_description(name, cached_data['formatted_description'], FORMATTER_VERSION)
+        return cached_data
 
     async def _fetch_from_llm(self, name: str) -> Optional[Dict[str, Any]]:
         """
@@ -73,7 +497,17 @@ class NameMeaningProvider:
         if not self.llm_model:
             return None
 
-        prompt = f"""
+        try:
+            response = await self._generate(self._llm_prompt(name))
+            return self._parse_llm_json(response.text)
+        except (json.JSONDecodeError, Exception) as e:
+            logging.error(f"Error processing LLM response for '{name}': {e}")
+            return None
+
+    @staticmethod
+    def _llm_prompt(name: str) -> str:
+        """The single-name prompt, "meaning" comes first so it can be shown first when streaming."""
+        return f"""
         Provide a detailed analysis of the name '{name}'. Your response MUST be a valid JSON object with the following structure:
         {{
           "name": "{name}",
@@ -87,47 +521,211 @@ class NameMeaningProvider:
         }}
         Ensure the JSON is well-formed.
         """
+
+    async def stream_name(self, name: str) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Analyze a name, streaming the LLM answer as it's generated.
+
+        Yields ("field", (key, value)) for each field of the LLM answer as
+        soon as it's complete, then ("result", result) with the same result
+        `analyze_name` would return. Cache hits and API fallbacks only yield
+        the result.
+        """
+        name = self.normalize_name(name)
+        cached_data = get_cached_name(name, FORMATTER_VERSION)
+        if cached_data:
+            yield "result", self._cached_result(name, cached_data)
+            return
+        if not self.llm_model or self._pending_flight(name) is not None:
+            yield "result", await self.analyze_name(name)
+            return
+
+        flight = self._start_flights([name])[name]
         try:
-            response = await self.llm_model.generate_content_async(prompt)
-            cleaned_text = response.text.strip().replace("```json", "").replace("```", "").strip()
-            return json.loads(cleaned_text)
-        except (json.JSONDecodeError, Exception) as e:
-            logging.error(f"Error processing LLM response for '{name}': {e}")
-            return None
+            parser = PartialJSONObject()
+            try:
+                response = await self._generate(self._llm_prompt(name), stream=True)
+                async for chunk in response:
+                    for field in parser.feed(chunk.text):
+                        yield "field", field
+            except Exception as e:
+                logging.error(f"Error streaming LLM response for '{name}': {e}")
+
+            if parser.complete and parser.fields:
+                result = self._llm_result(name, parser.fields)
+            else:
+                logging.warning(f"Could not fetch data for '{name}' from LLM. Falling back to APIs.")
+                result = await self._fetch_from_apis(name)
+        except BaseException:
+            flight.cancel()
+            raise
+        flight.set_result(result)
+        yield "result", result
+
+    async def _fetch_from_llm_batch(self, names: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Analyze several names with one Gemini prompt.
+
+        The model is asked for a JSON array with one object per name. Names
+        missing from the answer, or whose object doesn't match `LLM_SCHEMA`,
+        are retried with their own prompt.
+        """
+        prompt = f"""
+        Provide a detailed analysis of each of these names: {json.dumps(names, ensure_ascii=False)}
+        Your response MUST be a valid JSON array with exactly one object per name, each with the following structure:
+        {{
+          "name": "...",
+          "meaning": "...",
+          "origin": "...",
+          "etymology": "...",
+          "gender": "...",
+          "famous_bearers": ["..."],
+          "variations": ["..."],
+          "description": "A comprehensive summary of the name's history and significance."
+        }}
+        Use the name exactly as given for "name". Ensure the JSON is well-formed.
+        """
+        results = dict.fromkeys(names)
+        try:
+            # Ask for JSON directly so the answer doesn't come wrapped in markdown.
+            response = await self._generate(
+                prompt, generation_config={"response_mime_type": "application/json"})
+            answers = self._parse_llm_json(response.text)
+        except Exception as e:
+            logging.error(f"Error processing LLM response for {len(names)} names: {e}")
+            answers = []
+
+        for answer in answers if isinstance(answers, list) else []:
+            if not self._is_valid_llm_answer(answer):
+                continue
+            name = self.normalize_name(answer['name'])
+            if name in results and results[name] is None:
+                results[name] = answer
+
+        retry = [name for name, answer in results.items() if answer is None]
+        if retry:
+            logging.warning(f"LLM batch answer was missing {len(retry)} of {len(names)} names, retrying them one by one.")
+            answers = await asyncio.gather(*(self._fetch_from_llm(name) for name in retry))
+            results.update(zip(retry, answers))
+        return results
+
+    @staticmethod
+    def _parse_llm_json(text: str) -> Any:
+        """Parse an LLM reply, dropping any markdown code fences around it."""
+        cleaned_text = text.strip().replace("```json", "").replace("```", "").strip()
+        return json.loads(cleaned_text)
+
+    @staticmethod
+    def _is_valid_llm_answer(answer: Any) -> bool:
+        """Whether an answer has every `LLM_SCHEMA` field with the right type."""
+        return isinstance(answer, dict) and all(
+            isinstance(answer.get(field), field_type) for field, field_type in LLM_SCHEMA.items()
+        )
 
     async def _fetch_from_apis(self, name: str) -> Dict[str, Any]:
         """
         Fetch name information from various free APIs as a fallback, asynchronously.
         """
-        result = {'name': name}
-        async with httpx.AsyncClient() as client:
-            tasks = [
-                client.get(f"{self.api_urls['age']}?name={name}"),
-                client.get(f"{self.api_urls['origin']}?name={name}"),
-                client.get(f"{self.api_urls['gender']}?name={name}")
-            ]
-            responses = await asyncio.gather(*tasks, return_exceptions=True)
-
-        age_response, origin_response, gender_response = responses
-
-        if not isinstance(age_response, Exception) and age_response.status_code == 200 and 'age' in age_response.json():
-            result['age_prediction'] = age_response.json()['age']
-
-        if not isinstance(origin_response, Exception) and origin_response.status_code == 200:
-            origin_data = origin_response.json().get('country', [])
-            if origin_data:
-                top_country_code = origin_data[0]['country_id']
-                confidence = round(origin_data[0]['probability'] * 100, 2)
-                country = pycountry.countries.get(alpha_2=top_country_code)
-                result['origin'] = f"{country.name if country else top_country_code} (confidence: {confidence}%)"
-
-        if not isinstance(gender_response, Exception) and gender_response.status_code == 200 and 'gender' in gender_response.json():
-            gender_data = gender_response.json()
-            result['gender'] = gender_data['gender'].title()
-            result['gender_probability'] = round(gender_data.get('probability', 0) * 100, 2)
-                
+        tasks = [
+            self._get(self.api_urls['age'], params={'name': name}),
+            self._get(self.api_urls['origin'], params={'name': name}),
+            self._get(self.api_urls['gender'], params={'name': name})
+        ]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+        age_data, origin_data, gender_data = (_json_or_none(response) for response in responses)
+        result = self._parse_api_data(name, age_data, origin_data, gender_data)
+        self._cache_api_results([result], [None not in (age_data, origin_data, gender_data)])
         return result
 
+    async def _fetch_from_apis_batch(self, names: List[str]) -> List[Dict[str, Any]]:
+        """
+        Fetch up to `API_BATCH_SIZE` names from each fallback API with a single
+        request per API, results are in the same order as `names`.
+        """
+        params = [('name[]', name) for name in names]
+        tasks = [
+            self._get(self.api_urls['age'], params=params),
+            self._get(self.api_urls['origin'], params=params),
+            self._get(self.api_urls['gender'], params=params)
+        ]
+        responses = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Batch responses are JSON arrays in the same order as the requested names.
+        per_api = []
+        for response in responses:
+            data = _json_or_none(response)
+            if not isinstance(data, list) or len(data) != len(names):
+                data = [None] * len(names)
+            per_api.append(data)
+
+        results = []
+        answered = []
+        for name, age_data, origin_data, gender_data in zip(names, *per_api):
+            results.append(self._parse_api_data(name, age_data, origin_data, gender_data))
+            answered.append(None not in (age_data, origin_data, gender_data))
+        self._cache_api_results(results, answered)
+        return results
+
+    def _cache_api_results(self, results: List[Dict[str, Any]], answered: List[bool]):
+        """
+        Cache fallback results, and names all APIs answered without knowing
+        them as negative results. Names an API failed for aren't cached, so
+        they are asked again next time.
+        """
+        found = {}
+        unknown = {}
+        for result, complete in zip(results, answered):
+            if not complete:
+                continue
+            if self._has_api_data(result):
+                found[result['name']] = result
+            else:
+                unknown[result['name']] = result
+        cache_names(found, API_CACHE_TTL, source=API_SOURCE, description_version=FORMATTER_VERSION)
+        cache_names(unknown, NEGATIVE_CACHE_TTL, source=NEGATIVE_SOURCE, description_version=FORMATTER_VERSION)
+
+    def _parse_api_data(self, name: str, age_data: Optional[Dict[str, Any]],
+                        origin_data: Optional[Dict[str, Any]], gender_data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine the agify, nationalize and genderize answers for a name, and describe them."""
+        import pycountry
+
+        result = {'name': name, 'source': API_SOURCE}
+
+        if age_data and age_data.get('age') is not None:
+            result['age_prediction'] = age_data['age']
+
+        countries = (origin_data or {}).get('country', [])
+        if countries:
+            top_country_code = countries[0]['country_id']
+            confidence = round(countries[0]['probability'] * 100, 2)
+            country = pycountry.countries.get(alpha_2=top_country_code)
+            result['origin'] = f"{country.name if country else top_country_code} (confidence: {confidence}%)"
+
+        if gender_data and gender_data.get('gender'):
+            result['gender'] = gender_data['gender'].title()
+            result['gender_probability'] = round((gender_data.get('probability') or 0) * 100, 2)
+
+        return self._describe(result)
+
+    @staticmethod
+    def _has_api_data(info: Dict[str, Any]) -> bool:
+        """Whether any of the fallback APIs knew the name."""
+        return any(key in info for key in ('origin', 'gender', 'age_prediction'))
+
+    def _describe(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Add the formatted description, whole and split into lines for display."""
+        description = self._format_description(info)
+        info['formatted_description'] = description
+        info['description_lines'] = description.split("\n")
+        return info
+
+    def _format_description(self, info: Dict[str, Any]) -> str:
+        """Describe a result with the formatter matching where it came from."""
+        if info.get('source') == API_SOURCE:
+            return self._format_api_description(info)
+        return self._format_llm_description(info)
+
     def _format_llm_description(self, info: Dict[str, Any]) -> str:
         """
         Create a user-friendly description from the LLM name information.
@@ -135,23 +733,38 @@ class NameMeaningProvider:
         name = info.get('name', 'N/A')
         parts = [f"🔍 NAME ANALYSIS: {name}"]
 
-        if info.get('meaning'):
-            parts.append(f"\n📋 MEANING: {info['meaning']}")
-        if info.get('origin'):
-            parts.append(f"🌍 ORIGIN: {info['origin']}")
-        if info.get('etymology'):
-            parts.append(f"📜 ETYMOLOGY: {info['etymology']}")
-        if info.get('gender'):
-            parts.append(f"⚥ GENDER: {info['gender'].title()}")
-        if info.get('variations'):
-            parts.append(f"🎨 VARIATIONS: {', '.join(info['variations'])}")
-        if info.get('famous_bearers'):
-            parts.append(f"🏆 FAMOUS BEARERS: {', '.join(info['famous_bearers'])}")
-        if info.get('description'):
-            parts.append(f"\n📝 DESCRIPTION:\n{info['description']}")
-            
+        for field in LLM_DESCRIPTION_FIELDS:
+            line = self.format_llm_field(field, info.get(field))
+            if line:
+                parts.append(line)
+
         return "\n".join(parts)
 
+    @staticmethod
+    def format_llm_field(field: str, value: Any) -> Optional[str]:
+        """The description text for one field of an LLM answer, None if it isn't shown."""
+        if not value:
+            return None
+        try:
+            if field == 'meaning':
+                return f"\n📋 MEANING: {value}"
+            if field == 'origin':
+                return f"🌍 ORIGIN: {value}"
+            if field == 'etymology':
+                return f"📜 ETYMOLOGY: {value}"
+            if field == 'gender':
+                return f"⚥ GENDER: {value.title()}"
+            if field == 'variations':
+                return f"🎨 VARIATIONS: {', '.join(value)}"
+            if field == 'famous_bearers':
+                return f"🏆 FAMOUS BEARERS: {', '.join(value)}"
+            if field == 'description':
+                return f"\n📝 DESCRIPTION:\n{value}"
+        except (AttributeError, TypeError):
+            # A streamed field can have any type, only show the ones we understand.
+            return None
+        return None
+
     def _format_api_description(self, info: Dict[str, Any]) -> str:
         """
         Create a user-friendly description from the API fallback data.
@@ -175,9 +788,9 @@ class NameMeaningProvider:
 
 async def main():
     """Main function to test the NameMeaningProvider."""
-    provider = NameMeaningProvider()
     name_to_check = "Kenneth"
-    analysis = await provider.analyze_name(name_to_check)
+    async with NameMeaningProvider() as provider:
+        analysis = await provider.analyze_name(name_to_check)
     
     if 'formatted_description' in analysis:
         print("="*LINE_LENGTH)
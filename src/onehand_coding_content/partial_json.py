@@ -0,0 +1,70 @@
+"""Read the fields of a JSON object while it's still being streamed in.
+
+    parser = PartialJSONObject()
+    for chunk in chunks:
+        for key, value in parser.feed(chunk):
+            ...
+
+Each top-level field comes out as soon as its value is complete, so the
+first fields of an LLM answer can be shown before the rest has arrived.
+Anything before the opening brace, like a markdown code fence, is skipped.
+"""
+import json
+from typing import Any, Dict, List, Tuple
+
+_decoder = json.JSONDecoder()
+
+WHITESPACE = " \t\r\n"
+
+# Values that end with their own closing character, anything else (numbers,
+# true, false, null) is only complete once something follows it.
+SELF_CLOSING = '"[{'
+
+
+class PartialJSONObject:
+    """Incremental parser for the top-level fields of one JSON object."""
+
+    def __init__(self):
+        self.buffer = ""
+        self.pos = -1  # Index after the opening brace, -1 until it's seen.
+        self.fields: Dict[str, Any] = {}
+        self.complete = False
+
+    def _skip(self, characters: str) -> None:
+        while self.pos < len(self.buffer) and self.buffer[self.pos] in characters:
+            self.pos += 1
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """Add streamed text, returns the (key, value) pairs it completed."""
+        self.buffer += text
+        if self.pos < 0:
+            start = self.buffer.find("{")
+            if start < 0:
+                return []
+            self.pos = start + 1
+
+        completed = []
+        while not self.complete:
+            self._skip(WHITESPACE + ",")
+            if self.buffer.startswith("}", self.pos):
+                self.complete = True
+                break
+            try:
+                key, value_start = _decoder.raw_decode(self.buffer, self.pos)
+                value_start = self.buffer.index(":", value_start) + 1
+                while value_start < len(self.buffer) and self.buffer[value_start] in WHITESPACE:
+                    value_start += 1
+                value, end = _decoder.raw_decode(self.buffer, value_start)
+            except ValueError:
+                # The field hasn't fully arrived yet.
+                break
+            if self.buffer[value_start] not in SELF_CLOSING and end >= len(self.buffer):
+                # A number at the very end of the buffer might still have digits coming.
+                break
+            if not isinstance(key, str):
+                raise ValueError(f"Expected a field name at position {self.pos}")
+
+            self.fields[key] = value
+            completed.append((key, value))
+            self.pos = end
+        return completed
@@ -1,14 +1,67 @@
-import time
+import sys
 
+from . import clock
 from .sounds import play_sound, KEYPRESS_SOUND
 
+# How many times per second typed text is flushed to the terminal.
+FRAME_RATE = 60
+
+
+class FrameWriter:
+    """Types text out in timed frames instead of flushing every character.
+
+    Characters that are due within the same frame of wall-clock time are
+    written together with a single write() and flush, then the writer sleeps
+    for their combined delay. The total time spent is the same as printing them
+    one by one, but sped up and instant runs write a few frames instead of one
+    per character. Each frame plays one keypress sound.
+
+    Streams that record timing, like an asciicast recording, get their frames
+    cut by logical time instead, so playback keeps the typing pace even when
+    the run itself was instant.
+    """
+
+    def __init__(self, frame_rate=FRAME_RATE, stream=None):
+        self.frame_time = 1.0 / frame_rate
+        self.stream = stream
+
+    def type_text(self, text, delays, sound_file=KEYPRESS_SOUND):
+        """Write each character of `text` followed by its delay from `delays`."""
+        # Look up stdout at call time so redirected output is respected.
+        stream = self.stream or sys.stdout
+        # Delays are in logical time, frames in wall-clock time unless the stream records timing.
+        speed = 1.0 if getattr(stream, "records_timing", False) else clock.get_clock().speed
+        frame = []
+        frame_delay = 0.0
+
+        for char, delay in zip(text, delays):
+            frame.append(char)
+            frame_delay += delay
+
+            if frame_delay / speed >= self.frame_time:
+                self._flush_frame(stream, frame, sound_file)
+                clock.sleep(frame_delay)
+                frame = []
+                frame_delay = 0.0
+
+        if frame:
+            self._flush_frame(stream, frame, sound_file)
+            clock.sleep(frame_delay)
+
+    def _flush_frame(self, stream, frame, sound_file):
+        """Write a frame in one go and play a single keypress for it."""
+        stream.write("".join(frame))
+        stream.flush()
+        if sound_file is not None:
+            play_sound(sound_file)
+
+
+frame_writer = FrameWriter()
+
 
 def typewriter_effect(text, delay=0.05, end_with_newline=True):
     """Simulate typewriter effect - each character appears one by one with sound"""
-    for char in text:
-        print(char, end="", flush=True)
-        play_sound(KEYPRESS_SOUND)
-        time.sleep(delay)
+    frame_writer.type_text(text, [delay] * len(text))
 
     if end_with_newline:
         print()
@@ -16,14 +69,10 @@ def typewriter_effect(text, delay=0.05, end_with_newline=True):
 
 def typing_with_pauses(text, delay=0.05, pause_chars=",.?!;:'", end_with_newline=True):
     """Typewriter effect with dramatic pauses on punctuation with sound"""
-    for char in text:
-        print(char, end="", flush=True)
-        play_sound(KEYPRESS_SOUND)
-
-        if char in pause_chars:
-            time.sleep(delay * 10)  # Longer pause for drama
-        else:
-            time.sleep(delay)
+    # Longer pause on punctuation for drama
+    delays = [delay * 10 if char in pause_chars else delay for char in text]
+    frame_writer.type_text(text, delays)
+
     if end_with_newline:
         print()
 
@@ -32,5 +81,5 @@ def dramatic_pause(seconds):
     """Standard dramatic pause with dots"""
     for i in range(int(seconds)):
         print(".", end="", flush=True)
-        time.sleep(1)
+        clock.sleep(1)
     print()
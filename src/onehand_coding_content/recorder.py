@@ -0,0 +1,120 @@
+"""Record a script run as an asciinema v2 (asciicast) file.
+
+Timestamps come from the logical clock, so with an instant clock a long script
+records in a moment while playback still shows the original pacing.
+"""
+import os
+import sys
+import json
+import time
+import shutil
+from pathlib import Path
+from typing import Optional, TextIO
+
+from . import clock
+
+
+class _RecordingOutput:
+    """Stand-in for sys.stdout that records everything written to it."""
+
+    # Every write gets its own timestamp, so writers shouldn't lump output together.
+    records_timing = True
+
+    def __init__(self, recorder: "AsciicastRecorder", stream: Optional[TextIO]):
+        self.recorder = recorder
+        self.stream = stream
+        self.encoding = getattr(stream, "encoding", "utf-8")
+
+    def write(self, data: str) -> int:
+        self.recorder.record_output(data)
+        if self.stream is not None:
+            self.stream.write(data)
+        return len(data)
+
+    def flush(self) -> None:
+        if self.stream is not None:
+            self.stream.flush()
+
+    def isatty(self) -> bool:
+        return False
+
+
+class _RecordingInput:
+    """Stand-in for sys.stdin that records the lines read as if they were typed."""
+
+    def __init__(self, recorder: "AsciicastRecorder", stream: TextIO):
+        self.recorder = recorder
+        self.stream = stream
+        self.encoding = getattr(stream, "encoding", "utf-8")
+
+    def readline(self, size: int = -1) -> str:
+        line = self.stream.readline(size)
+        self.recorder.record_output(line)
+        return line
+
+    def read(self, size: int = -1) -> str:
+        data = self.stream.read(size)
+        self.recorder.record_output(data)
+        return data
+
+    def isatty(self) -> bool:
+        return False
+
+
+class AsciicastRecorder:
+    """Capture stdout (and echoed stdin) into an asciicast v2 file.
+
+    Use it as a context manager around the code to record, output is still
+    shown on the terminal unless `echo` is False.
+    """
+
+    def __init__(self, path, title: Optional[str] = None, echo: bool = True,
+                 width: Optional[int] = None, height: Optional[int] = None):
+        terminal_size = shutil.get_terminal_size()
+        self.path = Path(path)
+        self.title = title
+        self.echo = echo
+        self.width = width or terminal_size.columns
+        self.height = height or terminal_size.lines
+        self._file = None
+        self._start = 0.0
+        self._saved_streams = None
+
+    def header(self) -> dict:
+        """The asciicast v2 header line."""
+        header = {
+            "version": 2,
+            "width": self.width,
+            "height": self.height,
+            "timestamp": int(time.time()),
+            "env": {"SHELL": os.environ.get("SHELL", "/bin/sh"), "TERM": os.environ.get("TERM", "xterm-256color")},
+        }
+        if self.title:
+            header["title"] = self.title
+        return header
+
+    def record_output(self, data: str) -> None:
+        """Add an output event stamped with the current logical time."""
+        if not data or self._file is None:
+            return
+        # Terminals need a carriage return to go back to the first column.
+        data = data.replace("\r\n", "\n").replace("\n", "\r\n")
+        elapsed = round(clock.now() - self._start, 6)
+        self._file.write(json.dumps([elapsed, "o", data], ensure_ascii=False) + "\n")
+
+    def __enter__(self) -> "AsciicastRecorder":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._file.write(json.dumps(self.header()) + "\n")
+        self._start = clock.now()
+
+        self._saved_streams = (sys.stdout, sys.stdin)
+        sys.stdout = _RecordingOutput(self, sys.stdout if self.echo else None)
+        sys.stdin = _RecordingInput(self, sys.stdin)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        sys.stdout.flush()
+        sys.stdout, sys.stdin = self._saved_streams
+        self._file.close()
+        self._file = None
@@ -1,19 +1,11 @@
 
-try:
-    import pygame
-    from pygame import mixer
-    PYGAME_AVAILABLE = True
-except ImportError:
-    PYGAME_AVAILABLE = False
+from functools import lru_cache
 
 from .config import SOUND_DIR
 
-# Initialize pygame mixer for sound effects
-if PYGAME_AVAILABLE:
-    try:
-        mixer.init()
-    except pygame.error:
-        PYGAME_AVAILABLE = False
+# pygame is imported and the mixer initialized on first use, None means not tried yet.
+PYGAME_AVAILABLE = None
+_mixer = None
 
 # Sound effect file paths, currently uses random sounds avaiable locally lets improve it in the future.
 KEYPRESS_SOUND = SOUND_DIR / "keypress.wav"
@@ -40,10 +32,89 @@ UNFAIR_2 = SOUND_DIR / "unfair-2.wav"
 REVOLUTION = SOUND_DIR / "revolution.wav"
 
 
+# Sounds are muted when scripts run faster than realtime.
+SOUND_ENABLED = True
+
+# How many decoded sounds to keep around, enough for every constant above.
+SOUND_CACHE_SIZE = 32
+
+
+def _sound_names():
+    """Return the names of every sound file constant defined in this module."""
+    return [name for name, value in globals().items() if name.isupper() and name != "SOUND_DIR" and hasattr(value, "suffix")]
+
+
+def _sound_constants():
+    """Return every sound file path defined in this module."""
+    return [globals()[name] for name in _sound_names()]
+
+
+def _get_mixer():
+    """Import pygame and initialize its mixer the first time a sound is needed."""
+    global PYGAME_AVAILABLE, _mixer
+    if PYGAME_AVAILABLE is None:
+        try:
+            from pygame import mixer
+            mixer.init()
+            _mixer = mixer
+            PYGAME_AVAILABLE = True
+        except Exception:
+            PYGAME_AVAILABLE = False
+    return _mixer
+
+
+@lru_cache(maxsize=SOUND_CACHE_SIZE)
+def _load_sound(sound_path):
+    """Decode a sound file once, returns None if it can't be played."""
+    if not sound_path.exists():
+        return None
+    mixer = _get_mixer()
+    if mixer is None:
+        return None
+    try:
+        return mixer.Sound(str(sound_path))
+    except Exception:
+        return None
+
+
+def get_sound(sound_file):
+    """Get the decoded sound for a file from the sound cache."""
+    return _load_sound(sound_file)
+
+
+def sound_files(names):
+    """Map sound constant names like "HERO" to their file paths."""
+    return [globals()[name] for name in names if name in _sound_names()]
+
+
+def preload_sounds(sound_files=None):
+    """Decode sounds ahead of time so playing them later won't touch the disk."""
+    if not SOUND_ENABLED:
+        return
+    if sound_files is None:
+        sound_files = _sound_constants()
+    for sound_file in sound_files:
+        get_sound(sound_file)
+
+
+def set_sound_enabled(enabled):
+    """Turn sound effects on or off."""
+    global SOUND_ENABLED
+    SOUND_ENABLED = enabled
+
+
+def clear_sound_cache():
+    """Forget all decoded sounds."""
+    _load_sound.cache_clear()
+
+
 def play_sound(sound_file, volume=0.3):
     """Play a sound effect if available"""
-    if sound_file.exists() and PYGAME_AVAILABLE:
-        sound_obj = mixer.Sound(str(sound_file))
+    if not SOUND_ENABLED:
+        return
+
+    sound_obj = get_sound(sound_file)
+    if sound_obj is not None:
         try:
             sound_obj.set_volume(volume)
             sound_obj.play()
@@ -54,15 +125,13 @@ def play_sound(sound_file, volume=0.3):
 
 def play_with_wait(sound_file, wait_time=100, volume=0.3):
     """Play sound and wait for it to finish."""
-    if sound_file.exists() and PYGAME_AVAILABLE:
-        sound_obj = mixer.Sound(str(sound_file))
-        try:
-            sound_obj.set_volume(volume)
-            sound_obj.play()
-        except Exception:
-            # If there's an error playing the sound, continue without sound
-            pass
+    play_sound(sound_file, volume)
+
+    if not SOUND_ENABLED or not PYGAME_AVAILABLE:
+        return
+
+    import pygame
 
     # Lets wait for the sound to finish playing.
-    while mixer.get_busy():
+    while _mixer.get_busy():
             pygame.time.wait(wait_time)
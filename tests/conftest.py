@@ -0,0 +1,89 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from onehand_coding_content import database
+
+# Names whose batches the nationalize stand-in answers with one entry too few.
+SHORT_ORIGIN = "Short"
+
+
+@pytest.fixture
+def name_cache(tmp_path, monkeypatch):
+    """A fresh name cache database in a temporary folder."""
+    monkeypatch.setattr(database, "DB_FILE", tmp_path / "name_cache.db")
+    monkeypatch.setattr(database, "_database_ready", False)
+    database.close_db_connection()
+    database.clear_memory_cache()
+    yield database.DB_FILE
+    database.close_db_connection()
+    database.clear_memory_cache()
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    """Answers `name[]` batches like agify, nationalize and genderize, the Nth entry for the Nth name.
+
+    Responses queued in `server.failures` as (status, headers) are sent first, one per request.
+    """
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        api = url.path.strip("/")
+        query = parse_qs(url.query)
+        names = query.get("name[]", query.get("name", []))
+        self.server.requests.append((api, names))
+
+        if self.server.failures:
+            status, headers = self.server.failures.pop(0)
+            self.send_response(status)
+            for header, value in headers.items():
+                self.send_header(header, value)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        answers = [self.answer(api, index, name) for index, name in enumerate(names)]
+        if api == "origin" and SHORT_ORIGIN in names:
+            answers = answers[:-1]
+
+        body = json.dumps(answers if "name[]" in query else answers[0]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    @staticmethod
+    def answer(api, index, name):
+        if api == "age":
+            return {"name": name, "age": 20 + index}
+        if api == "origin":
+            return {"name": name, "country": [{"country_id": "PH", "probability": 0.5}]}
+        return {"name": name, "gender": "female" if index % 2 else "male", "probability": 0.9}
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def api_server():
+    """Local stand-in for the fallback APIs, with the requests it got and failures to send."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAPIHandler)
+    server.requests = []
+    server.failures = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    yield SimpleNamespace(
+        urls={api: f"{base}/{api}/" for api in ("age", "origin", "gender")},
+        host=f"127.0.0.1:{server.server_address[1]}",
+        requests=server.requests,
+        failures=server.failures,
+        short_origin=SHORT_ORIGIN,
+    )
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,105 @@
+"""Offline stand-in for the Gemini model used by `NameMeaningProvider` in tests.
+
+    provider = NameMeaningProvider(llm_model=FakeLLMModel())
+
+It answers both the single-name and the multi-name prompts with made-up but
+well-formed analyses, and can be told to leave names out of batch answers or
+garble them to exercise the per-name retries.
+"""
+import re
+import json
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional
+
+# The batch prompt lists its names as a JSON array after this text.
+BATCH_NAMES_PATTERN = re.compile(r"each of these names: (\[.*?\])")
+SINGLE_NAME_PATTERN = re.compile(r"analysis of the name '(.*?)'")
+
+
+class FakeResponse:
+    """Mimics the `text` attribute of a Gemini response."""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeStream:
+    """Mimics a streamed Gemini response, an async iterator of chunks with `text`."""
+
+    def __init__(self, text: str, chunk_size: int, delay: float):
+        self.text = text
+        self.chunk_size = chunk_size
+        self.delay = delay
+
+    async def __aiter__(self):
+        for start in range(0, len(self.text), self.chunk_size):
+            if self.delay:
+                await asyncio.sleep(self.delay)
+            yield FakeResponse(self.text[start:start + self.chunk_size])
+
+
+class FakeLLMModel:
+    """Answers name prompts locally, counting the prompts it gets."""
+
+    def __init__(self, answers: Optional[Dict[str, Dict[str, Any]]] = None,
+                 drop: Iterable[str] = (), malformed: Iterable[str] = (), delay: float = 0.0,
+                 chunk_size: int = 24):
+        """
+        Args:
+            answers: Fixed answers by name, other names get a generated one.
+            drop: Names to leave out of batch answers.
+            malformed: Names answered with a broken object in batch answers.
+            delay: Seconds each prompt takes, to mimic network latency, and
+                between the chunks of streamed answers.
+            chunk_size: Characters per chunk of streamed answers.
+        """
+        self.answers = answers or {}
+        self.drop = set(drop)
+        self.malformed = set(malformed)
+        self.delay = delay
+        self.chunk_size = chunk_size
+        self.prompts: List[str] = []
+
+    def answer_for(self, name: str) -> Dict[str, Any]:
+        """The analysis returned for `name`."""
+        if name in self.answers:
+            return self.answers[name]
+        return {
+            "name": name,
+            "meaning": f"A made-up meaning for {name}",
+            "origin": "Offline",
+            "etymology": f"{name} comes from the fake model.",
+            "gender": "unisex",
+            "famous_bearers": [f"{name} Example"],
+            "variations": [name.lower(), name.upper()],
+            "description": f"{name} was analyzed without calling Gemini.",
+        }
+
+    async def generate_content_async(self, prompt: str, stream: bool = False, **kwargs):
+        response = await self._answer(prompt)
+        if stream:
+            return FakeStream(response.text, self.chunk_size, self.delay)
+        return response
+
+    async def _answer(self, prompt: str) -> FakeResponse:
+        self.prompts.append(prompt)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+
+        batch = BATCH_NAMES_PATTERN.search(prompt)
+        if batch:
+            answers = []
+            for name in json.loads(batch.group(1)):
+                if name in self.drop:
+                    continue
+                if name in self.malformed:
+                    answers.append({"name": name, "meaning": None})
+                else:
+                    answers.append(self.answer_for(name))
+            return FakeResponse(json.dumps(answers))
+
+        single = SINGLE_NAME_PATTERN.search(prompt)
+        if not single:
+            return FakeResponse("I can't help with that.")
+        # Single-name replies come fenced, like Gemini's usually do.
+        return FakeResponse(f"```json\n{json.dumps(self.answer_for(single.group(1)))}\n```")
@@ -0,0 +1,61 @@
+"""Batched fallback API lookups, against a local stand-in for agify, nationalize and genderize."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pycountry")
+
+from onehand_coding_content import database
+from onehand_coding_content.name_meanings import API_BATCH_SIZE, NameMeaningProvider
+
+
+@pytest.fixture(autouse=True)
+def offline(name_cache, monkeypatch):
+    """A fresh name cache, and no Gemini even when a key is configured."""
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+
+
+async def fetch_batch(api_urls, names):
+    async with NameMeaningProvider(api_urls=api_urls, llm_model=None) as provider:
+        return await provider._fetch_from_apis_batch(names)
+
+
+def test_batch_results_follow_name_order(api_server):
+    names = ["Maria", "Juan", "Jose"]
+    results = asyncio.run(fetch_batch(api_server.urls, names))
+
+    assert [result["name"] for result in results] == names
+    assert [result["age_prediction"] for result in results] == [20, 21, 22]
+    assert [result["gender"] for result in results] == ["Male", "Female", "Male"]
+    assert all(result["origin"].startswith("Philippines") for result in results)
+    # One request per API for the whole batch.
+    assert sorted(api for api, _ in api_server.requests) == ["age", "gender", "origin"]
+    assert all(requested == names for _, requested in api_server.requests)
+    assert database.get_cached_name("Juan")["age_prediction"] == 21
+
+
+def test_length_mismatch_drops_that_api(api_server):
+    names = ["Maria", api_server.short_origin]
+    results = asyncio.run(fetch_batch(api_server.urls, names))
+
+    assert [result["name"] for result in results] == names
+    assert [result["age_prediction"] for result in results] == [20, 21]
+    assert not any("origin" in result for result in results)
+    # An API that answered wrong isn't a reason to remember the name as unknown.
+    assert database.get_cached_name("Maria") is None
+    assert database.get_cached_name(api_server.short_origin) is None
+
+
+def test_analyze_names_batches_requests(api_server):
+    names = [f"Name{i}" for i in range(API_BATCH_SIZE + 2)]
+
+    async def analyze():
+        async with NameMeaningProvider(api_urls=api_server.urls, llm_model=None) as provider:
+            return [result async for result in provider.analyze_names(names)]
+
+    results = asyncio.run(analyze())
+
+    assert sorted(result["name"] for result in results) == sorted(names)
+    assert len(api_server.requests) == 3 * 2
+    assert sorted(len(requested) for _, requested in api_server.requests) == [2, 2, 2, 10, 10, 10]
@@ -0,0 +1,46 @@
+"""Name cache reads and writes."""
+import sqlite3
+
+import pytest
+
+from onehand_coding_content import database
+
+
+@pytest.fixture
+def locked_writer(name_cache, monkeypatch):
+    """Another connection holding the write lock, with a short busy timeout for ours."""
+    monkeypatch.setattr(database, "BUSY_TIMEOUT", 0.1)
+    database.cache_name("Maria", {"name": "Maria", "gender": "Female"})
+    database.close_db_connection()
+    database.clear_memory_cache()
+
+    writer = sqlite3.connect(name_cache, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    yield writer
+    writer.execute("ROLLBACK")
+    writer.close()
+
+
+def last_access(name):
+    return database.get_db_connection().execute(
+        "SELECT last_access FROM names WHERE name = ?", (name,)
+    ).fetchone()[0]
+
+
+def test_reads_work_while_another_connection_writes(locked_writer):
+    assert database.get_cached_name("Maria")["gender"] == "Female"
+    database.clear_memory_cache()
+    assert database.get_cached_names(["Maria", "Juan"]) == {"Maria": {"name": "Maria", "gender": "Female"}}
+
+
+def test_access_times_are_saved_with_the_next_write(name_cache, monkeypatch):
+    database.cache_name("Maria", {"name": "Maria"})
+    database.clear_memory_cache()
+    written = last_access("Maria")
+
+    monkeypatch.setattr(database.time, "time", lambda: written + 100)
+    database.get_cached_name("Maria")
+    assert last_access("Maria") == written
+
+    database.cache_name("Juan", {"name": "Juan"})
+    assert last_access("Maria") == written + 100
@@ -0,0 +1,131 @@
+"""Background reverse geocoding, against a stub geocoder instead of Nominatim."""
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("geopy")
+
+from geopy.exc import GeocoderTimedOut
+
+from onehand_coding_content import geocode_queue
+from onehand_coding_content.geocode_cache import GeocodeCache
+from onehand_coding_content.geocode_queue import ADDRESS_LOOKUP_ERROR, GeocodeQueue
+
+# Fast enough that spacing requests doesn't slow the tests down.
+RATE = 1000.0
+
+
+class StubGeocoder:
+    """Answers reverse() with the queried coordinates, or with queued answers first.
+
+    A queued answer is returned as is, or raised when it's an exception.
+    """
+
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def reverse(self, query, timeout=None):
+        with self.lock:
+            self.queries.append(query)
+            answer = self.answers.pop(0) if self.answers else None
+        if isinstance(answer, Exception):
+            raise answer
+        return answer or SimpleNamespace(address=f"Near {query}")
+
+
+class CrashingLocation:
+    """A location that blows up when read, so the lookup itself crashes."""
+
+    @property
+    def address(self):
+        raise RuntimeError("bad answer")
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = GeocodeCache(tmp_path / "geocode_cache.db")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(geocode_queue, "backoff", lambda attempt: 0)
+
+
+def record(lat, lon):
+    return {'latitude': lat, 'longitude': lon}
+
+
+def test_same_cell_costs_one_lookup(cache):
+    geocoder = StubGeocoder()
+    first, second = record(14.59951, 120.98422), record(14.59954, 120.98418)
+    assert cache.key(first['latitude'], first['longitude']) == cache.key(second['latitude'], second['longitude'])
+
+    with GeocodeQueue(geocoder, cache, rate=RATE) as geocoding:
+        geocoding.submit_all([first, second])
+        geocoding.join()
+
+    assert len(geocoder.queries) == 1
+    assert first['address'] == second['address'] == f"Near {geocoder.queries[0]}"
+
+
+def test_cache_hit_resolves_at_submit(cache):
+    cache.put(14.5995, 120.9842, "Manila City Hall")
+    geocoder = StubGeocoder()
+    photo = record(14.5995, 120.9842)
+
+    with GeocodeQueue(geocoder, cache, rate=RATE) as geocoding:
+        geocoding.submit(photo)
+        assert photo['address'] == "Manila City Hall"
+        assert geocoding.resolved == geocoding.submitted == 1
+        geocoding.join()
+
+    assert geocoder.queries == []
+
+
+def test_timeouts_are_retried(cache):
+    geocoder = StubGeocoder(GeocoderTimedOut("slow"), SimpleNamespace(address="Quiapo Church"))
+    photo = record(14.5987, 120.9837)
+
+    with GeocodeQueue(geocoder, cache, rate=RATE) as geocoding:
+        geocoding.submit(photo)
+        geocoding.join()
+
+    assert len(geocoder.queries) == 2
+    assert photo['address'] == "Quiapo Church"
+    assert cache.get(14.5987, 120.9837) == "Quiapo Church"
+
+
+def test_crash_doesnt_stop_later_lookups(cache):
+    geocoder = StubGeocoder(CrashingLocation())
+    crashed, later = record(14.5, 121.0), record(10.3, 123.9)
+
+    with GeocodeQueue(geocoder, cache, rate=RATE) as geocoding:
+        geocoding.submit_all([crashed, later])
+        geocoding.join()
+
+    assert crashed['address'] == ADDRESS_LOOKUP_ERROR
+    assert later['address'].startswith("Near ")
+    assert len(geocoder.queries) == 2
+
+
+def test_join_returns(cache):
+    geocoder = StubGeocoder()
+    photos = [record(14.0 + i, 121.0) for i in range(5)] + [{'filename': "no_gps.jpg"}]
+    seen = []
+
+    geocoding = GeocodeQueue(geocoder, cache, rate=RATE)
+    geocoding.start()
+    geocoding.submit_all(photos)
+    joiner = threading.Thread(target=geocoding.join, args=(lambda done, total: seen.append((done, total)),))
+    joiner.start()
+    joiner.join(timeout=10)
+    geocoding.close()
+
+    assert not joiner.is_alive()
+    assert seen[-1] == (5, 5)
+    assert all('address' in photo for photo in photos[:5])
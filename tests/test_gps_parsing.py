@@ -0,0 +1,86 @@
+"""GPS rational parsing, which replaced eval() on metadata from untrusted photos."""
+import math
+import random
+import string
+import timeit
+from fractions import Fraction
+
+import pytest
+
+from onehand_coding_content.content.exif_extractor import ExifExtractor, dms_to_degrees, parse_rational
+
+MANILA = "14/1 35/1 4272/100"
+MANILA_DEGREES = 14 + 35 / 60 + 42.72 / 3600
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("4272/100", 42.72),
+    ("14/1", 14.0),
+    ("14", 14.0),
+    (" 35/1 ", 35.0),
+    ("42.72", 42.72),
+    (".5", 0.5),
+    (Fraction(4272, 100), 42.72),
+    ((4272, 100), 42.72),
+    (14, 14.0),
+    (42.72, 42.72),
+])
+def test_parse_rational(value, expected):
+    assert parse_rational(value) == pytest.approx(expected)
+
+
+def test_parse_rational_pil_ifd_rational():
+    TiffImagePlugin = pytest.importorskip("PIL.TiffImagePlugin")
+    assert parse_rational(TiffImagePlugin.IFDRational(4272, 100)) == pytest.approx(42.72)
+
+
+@pytest.mark.parametrize("value", [
+    "1/0", (1, 0), (0, 0),
+    "", "/", "1/", "/2", "-1/2", "1/-2", "1e5", "abc", "__import__('os')", "1/2/3",
+    float("inf"), float("nan"), "9" * 400, ("9" * 400, 1), (10 ** 400, 1),
+    None, [1, 2], (1, 2, 3), object(),
+])
+def test_parse_rational_rejects(value):
+    assert parse_rational(value) is None
+
+
+def test_dms_to_degrees():
+    assert dms_to_degrees(MANILA) == pytest.approx(MANILA_DEGREES)
+    assert dms_to_degrees((Fraction(14), Fraction(35), Fraction(4272, 100))) == pytest.approx(MANILA_DEGREES)
+    assert dms_to_degrees(((14, 1), (35, 1), (4272, 100))) == pytest.approx(MANILA_DEGREES)
+    assert dms_to_degrees("14/1") == pytest.approx(14.0)
+
+
+@pytest.mark.parametrize("value", [
+    "", "14/1 35/1 4272/100 1/1", "14/1 35/0 1/1", "14/1 -35/1 0/1", "14/1 x 0/1", None, 14, (),
+])
+def test_dms_to_degrees_rejects(value):
+    assert dms_to_degrees(value) is None
+
+
+@pytest.mark.parametrize("lat, lon", [(91.0, 0.0), (0.0, 180.5), (None, 0.0), (0.0, None)])
+def test_out_of_range_coordinates(lat, lon):
+    assert not ExifExtractor().valid_coordinates(lat, lon)
+
+
+def test_out_of_range_dms_is_rejected():
+    extractor = ExifExtractor()
+    assert extractor.valid_coordinates(dms_to_degrees(MANILA), dms_to_degrees("121/1 0/1 0/1"))
+    assert not extractor.valid_coordinates(dms_to_degrees("95/1 0/1 0/1"), dms_to_degrees("121/1 0/1 0/1"))
+
+
+def test_fuzz_random_strings():
+    rng = random.Random(2024)
+    alphabet = string.digits * 4 + "/ ./-+eE_()'" + string.ascii_letters + "\x00½٣"
+    for _ in range(20000):
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))
+        for result in (parse_rational(text), dms_to_degrees(text)):
+            assert result is None or (math.isfinite(result) and result >= 0), text
+
+
+def test_benchmark():
+    """Parsing stays far below what reading the photo costs, about 5 µs per coordinate."""
+    runs = 10000
+    seconds = min(timeit.repeat(lambda: dms_to_degrees(MANILA), number=runs, repeat=3))
+    print(f"\ndms_to_degrees: {seconds / runs * 1e6:.1f} µs per coordinate")
+    assert seconds / runs < 100e-6
@@ -0,0 +1,70 @@
+"""Batched Gemini prompts, against the offline FakeLLMModel."""
+import asyncio
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from onehand_coding_content import database, name_meanings
+from onehand_coding_content.name_meanings import LLM_BATCH_SIZE, NameMeaningProvider
+
+from fake_llm import BATCH_NAMES_PATTERN, FakeLLMModel
+
+NAMES = ["Maria", "Juan", "Jose", "Ana", "Pedro", "Rosa", "Luis", "Carmen", "Miguel", "Elena"]
+
+
+@pytest.fixture
+def cache_writes(name_cache, monkeypatch):
+    """The names of each cache_names call made by the provider."""
+    writes = []
+
+    def cache_names(items, *args, **kwargs):
+        writes.append(sorted(items))
+        database.cache_names(items, *args, **kwargs)
+
+    monkeypatch.setattr(name_meanings, "cache_names", cache_names)
+    return writes
+
+
+def analyze(model, names=NAMES):
+    async def run():
+        async with NameMeaningProvider(llm_model=model) as provider:
+            return {result["name"]: result async for result in provider.analyze_names(names)}
+    return asyncio.run(run())
+
+
+def test_batch_costs_one_prompt(cache_writes):
+    assert len(NAMES) == LLM_BATCH_SIZE
+    model = FakeLLMModel()
+    results = analyze(model)
+
+    assert len(model.prompts) == 1
+    assert BATCH_NAMES_PATTERN.search(model.prompts[0])
+    assert sorted(results) == sorted(NAMES)
+    assert all(result["meaning"] == f"A made-up meaning for {name}" for name, result in results.items())
+    # The whole batch is written in one go.
+    assert cache_writes == [sorted(NAMES)]
+    assert database.get_cached_name("Elena")["origin"] == "Offline"
+
+
+def test_dropped_and_malformed_names_are_retried_alone(cache_writes):
+    model = FakeLLMModel(drop=["Juan"], malformed=["Jose"])
+    results = analyze(model)
+
+    assert len(model.prompts) == 3
+    single_prompts = model.prompts[1:]
+    assert not any(BATCH_NAMES_PATTERN.search(prompt) for prompt in single_prompts)
+    assert sorted(name for name in ("Juan", "Jose") for prompt in single_prompts if f"name '{name}'" in prompt) == ["Jose", "Juan"]
+    assert all(result["meaning"] == f"A made-up meaning for {name}" for name, result in results.items())
+    assert cache_writes == [sorted(NAMES)]
+
+
+def test_cached_names_skip_the_prompt(cache_writes):
+    analyze(FakeLLMModel(), NAMES[:3])
+    database.clear_memory_cache()
+    model = FakeLLMModel()
+    results = analyze(model, NAMES[:5])
+
+    assert sorted(results) == sorted(NAMES[:5])
+    assert len(model.prompts) == 1
+    assert BATCH_NAMES_PATTERN.search(model.prompts[0]).group(1) == '["Ana", "Pedro"]'
@@ -0,0 +1,56 @@
+"""Typed text frames, on screen and in recordings."""
+import io
+import json
+
+import pytest
+
+from onehand_coding_content import clock, sounds
+from onehand_coding_content.presentation import FrameWriter, typewriter_effect
+from onehand_coding_content.recorder import AsciicastRecorder
+
+
+class CountingStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, data):
+        self.writes += 1
+        return super().write(data)
+
+
+@pytest.fixture(autouse=True)
+def instant_clock(monkeypatch):
+    monkeypatch.setattr(sounds, "SOUND_ENABLED", False)
+    previous = clock.set_clock(clock.make_clock(0))
+    yield
+    clock.set_clock(previous)
+
+
+def test_instant_run_is_batched():
+    stream = CountingStream()
+    FrameWriter(stream=stream).type_text("a" * 200, [0.05] * 200)
+    assert stream.getvalue() == "a" * 200
+    assert stream.writes == 1
+
+
+def test_scaled_run_is_batched():
+    clock.set_clock(clock.make_clock(10))
+    stream = CountingStream()
+    FrameWriter(stream=stream).type_text("a" * 40, [0.05] * 40)
+    assert stream.writes == 10
+
+
+def test_recording_keeps_typing_pace(tmp_path):
+    cast_file = tmp_path / "typed.cast"
+    text = "Hello world, this is typed"
+    with AsciicastRecorder(cast_file, echo=False):
+        typewriter_effect(text)
+
+    events = [json.loads(line) for line in cast_file.read_text(encoding="utf-8").splitlines()[1:]]
+    typed = [event for event in events if event[2] != "\r\n"]
+    assert "".join(event[2] for event in typed) == text
+    assert len(typed) > 1
+    timestamps = [event[0] for event in typed]
+    assert timestamps == sorted(timestamps) and timestamps[-1] > timestamps[0]
+    assert timestamps[-1] == pytest.approx(0.05 * (len(text) - 1))
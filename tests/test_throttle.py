@@ -0,0 +1,86 @@
+"""Rate limiting, retries and the circuit breaker, against the local API stand-in."""
+import time
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+pytest.importorskip("pycountry")
+
+from onehand_coding_content import database, name_meanings
+from onehand_coding_content.name_meanings import (
+    CIRCUIT_RESET, CIRCUIT_THRESHOLD, CircuitOpenError, NameMeaningProvider, RetryableResponse
+)
+
+
+@pytest.fixture(autouse=True)
+def offline(name_cache, monkeypatch):
+    monkeypatch.delenv("GEMINI_API_KEY", raising=False)
+    # Retries without Retry-After go out right away.
+    monkeypatch.setattr(name_meanings, "backoff", lambda attempt: 0)
+
+
+def provider_for(api_server, **kwargs):
+    return NameMeaningProvider(api_urls=api_server.urls, llm_model=None, **kwargs)
+
+
+def test_retry_after_is_honoured(api_server):
+    api_server.failures.append((429, {"Retry-After": "1"}))
+
+    async def get():
+        async with provider_for(api_server) as provider:
+            started = time.monotonic()
+            response = await provider._get(api_server.urls["age"], params={"name": "Maria"})
+            return response, time.monotonic() - started, provider._get_throttle(api_server.host)
+
+    response, elapsed, throttle = asyncio.run(get())
+    assert response.status_code == 200
+    assert len(api_server.requests) == 2
+    assert elapsed >= 0.95
+    # A polite 429 doesn't count towards opening the circuit.
+    assert throttle.failures == 0
+
+
+def test_server_errors_leave_the_name_uncached(api_server):
+    api_server.failures.extend([(503, {})] * 20)
+
+    async def fetch():
+        async with provider_for(api_server, max_retries=2) as provider:
+            return await provider._fetch_from_apis("Maria")
+
+    result = asyncio.run(fetch())
+    assert not any(key in result for key in ("age_prediction", "origin", "gender"))
+    assert database.get_cached_name("Maria") is None
+
+
+def test_circuit_opens_and_lets_one_trial_through(api_server, monkeypatch):
+    api_server.failures.extend([(500, {})] * (CIRCUIT_THRESHOLD + 1))
+    url = api_server.urls["age"]
+    offset = 0.0
+    real_monotonic = time.monotonic
+    monkeypatch.setattr(name_meanings.time, "monotonic", lambda: real_monotonic() + offset)
+
+    async def run():
+        nonlocal offset
+        async with provider_for(api_server, max_retries=0) as provider:
+            for _ in range(CIRCUIT_THRESHOLD):
+                with pytest.raises(RetryableResponse):
+                    await provider._get(url, params={"name": "Maria"})
+            with pytest.raises(CircuitOpenError):
+                await provider._get(url, params={"name": "Maria"})
+            assert len(api_server.requests) == CIRCUIT_THRESHOLD
+
+            # After the reset timeout one trial goes out, it fails and the circuit stays open.
+            offset += CIRCUIT_RESET + 1
+            with pytest.raises(RetryableResponse):
+                await provider._get(url, params={"name": "Maria"})
+            with pytest.raises(CircuitOpenError):
+                await provider._get(url, params={"name": "Maria"})
+            assert len(api_server.requests) == CIRCUIT_THRESHOLD + 1
+
+            # A successful trial closes it again.
+            offset += CIRCUIT_RESET + 1
+            assert (await provider._get(url, params={"name": "Maria"})).status_code == 200
+            assert (await provider._get(url, params={"name": "Maria"})).status_code == 200
+
+    asyncio.run(run())